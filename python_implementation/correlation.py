@@ -1,4 +1,8 @@
 import math
+import operator
+from collections import Counter
+from itertools import repeat
+from dataframe import ColumnaCategorica
 
 class Correlacion:
     def __init__(self, dataframe):
@@ -37,12 +41,16 @@ class Correlacion:
     def informacion_mutua(self, col1: list, col2: list) -> float:
         '''
         Método para calcular la información mutua entre dos columnas categóricas.
+        Si ambas columnas están codificadas como categóricas, los recuentos se hacen sobre los códigos enteros.
         Parameters:
-            col1: (list) Primera columna de valores.
-            col2: (list) Segunda columna de valores.
+            col1: (list | ColumnaCategorica) Primera columna de valores.
+            col2: (list | ColumnaCategorica) Segunda columna de valores.
         Return:
             float: Valor de información mutua entre col1 y col2.
         '''
+        if isinstance(col1, ColumnaCategorica) and isinstance(col2, ColumnaCategorica):
+            return self._informacion_mutua_codigos(col1, col2)
+
         # Contadores de frecuencias conjuntas y marginales
         conteo_conjunto = {}
         conteo_col1 = {}
@@ -65,6 +73,82 @@ class Correlacion:
             
         return informacion_mutua
 
+    def _informacion_mutua_codigos(self, col1: ColumnaCategorica, col2: ColumnaCategorica) -> float:
+        '''
+        Método para calcular la información mutua entre dos columnas categóricas a partir de sus códigos.
+        Cada par de códigos se combina en un único entero (código1 * num_categorias2 + código2) para el recuento conjunto.
+        Parameters:
+            col1: (ColumnaCategorica) Primera columna.
+            col2: (ColumnaCategorica) Segunda columna.
+        Return:
+            float: Valor de información mutua entre col1 y col2.
+        '''
+        total = len(col1)
+        num_categorias2 = len(col2.categorias)
+        conteo_col1 = Counter(col1.codigos)
+        conteo_col2 = Counter(col2.codigos)
+        conteo_conjunto = Counter(map(operator.add, map(operator.mul, col1.codigos, repeat(num_categorias2)), col2.codigos))
+
+        informacion_mutua = 0
+        for codigo_conjunto, conteo in conteo_conjunto.items():
+            x, y = divmod(codigo_conjunto, num_categorias2)
+            p_xy = conteo / total
+            informacion_mutua += p_xy * math.log2(p_xy * total * total / (conteo_col1[x] * conteo_col2[y]))
+        return informacion_mutua
+
+    def matriz_correlacion_pearson(self, columnas: list[str] = None,
+                                   filas_por_bloque: int = 16384) -> tuple[list[list[float]], list[str]]:
+        '''
+        Método para calcular la matriz de correlaciones de Pearson entre columnas numéricas.
+        Cada columna se centra y se divide por su norma una sola vez (con la media y la varianza en caché del
+        data.frame); la correlación de cada par es entonces el producto escalar de las columnas estandarizadas, que se
+        acumula por bloques de filas: cada bloque estandarizado de una columna se reutiliza con todas las demás mientras
+        está en memoria, y sólo se guardan a la vez los bloques de filas, no las columnas estandarizadas completas.
+        Las columnas constantes tienen correlación 0 con todas las demás (y consigo mismas), como en correlacion_pearson.
+        Parameters:
+            columnas: (list[str] | None) Columnas a correlacionar, o None para usar todas las numéricas.
+            filas_por_bloque: (int) Número de filas de cada bloque del producto.
+        Return:
+            tuple[list[list[float]], list[str]]: Matriz simétrica de correlaciones y nombres de sus filas y columnas.
+        Exceptions:
+            ValueError si alguna columna no es numérica o `filas_por_bloque` no es un entero positivo.
+        '''
+        if not isinstance(filas_por_bloque, int) or filas_por_bloque < 1:
+            raise ValueError("`filas_por_bloque` debe ser un entero positivo.")
+        if columnas is None:
+            columnas = [nombre for nombre in self.dataframe.datos if self.dataframe.es_numerica(nombre)]
+        escalas = []
+        for nombre in columnas:
+            if not self.dataframe.es_numerica(nombre):
+                raise ValueError(f"La columna '{nombre}' no es numérica.")
+            estadisticas = self.dataframe.estadisticas_columna(nombre)
+            norma = math.sqrt(estadisticas['varianza'] * estadisticas['conteo']) if estadisticas['conteo'] else 0.0
+            escalas.append((estadisticas['media'], 1 / norma) if norma else None)
+
+        p = len(columnas)
+        matriz = [[0.0] * p for _ in range(p)]
+        activas = [i for i, escala in enumerate(escalas) if escala is not None]
+        buffers = {i: self.dataframe.obtener_buffer(columnas[i]) for i in activas}
+        filas = len(buffers[activas[0]]) if activas else 0
+        for inicio in range(0, filas, filas_por_bloque):
+            # Cada fila de cada columna se estandariza una sola vez, al entrar en su bloque; las listas de float se
+            # multiplican más deprisa que los array, que crean un objeto float por cada acceso
+            bloques = {
+                i: list(map(operator.mul, map(operator.sub, buffers[i][inicio:inicio + filas_por_bloque],
+                                              repeat(escalas[i][0])), repeat(escalas[i][1])))
+                for i in activas
+            }
+            for posicion, i in enumerate(activas):
+                bloque_i, fila = bloques[i], matriz[i]
+                for j in activas[posicion + 1:]:
+                    fila[j] += sum(map(operator.mul, bloque_i, bloques[j]))
+        for posicion, i in enumerate(activas):
+            matriz[i][i] = 1.0
+            for j in activas[posicion + 1:]:
+                # El redondeo puede dejar el producto ligeramente fuera de [-1, 1]
+                matriz[i][j] = matriz[j][i] = max(-1.0, min(1.0, matriz[i][j]))
+        return matriz, list(columnas)
+
     def calcular_correlacion_por_pares(self) -> dict:
         '''
         Método para calcular la correlación entre todas las combinaciones de columnas en el DataFrame.
@@ -75,18 +159,20 @@ class Correlacion:
         '''
         resultados_correlacion = {}
         columnas = list(self.dataframe.datos.keys())
-        
+        # Todas las correlaciones de Pearson se obtienen de una sola vez con la matriz de correlaciones
+        matriz, numericas = self.matriz_correlacion_pearson()
+        posiciones = {nombre: posicion for posicion, nombre in enumerate(numericas)}
+
         for i, nombre_col1 in enumerate(columnas):
             for nombre_col2 in columnas[i + 1:]:
-                col1 = self.dataframe.obtener_columna(nombre_col1)
-                col2 = self.dataframe.obtener_columna(nombre_col2)
-                
                 # Verifica si ambas columnas son numéricas para usar Pearson, si no, usa información mutua.
-                if self._es_numerico(col1) and self._es_numerico(col2):
-                    correlacion = self.correlacion_pearson(col1, col2)
+                if nombre_col1 in posiciones and nombre_col2 in posiciones:
+                    correlacion = matriz[posiciones[nombre_col1]][posiciones[nombre_col2]]
                 else:
+                    col1 = self.dataframe.obtener_buffer(nombre_col1)
+                    col2 = self.dataframe.obtener_buffer(nombre_col2)
                     correlacion = self.informacion_mutua(col1, col2)
-                
+
                 resultados_correlacion[(nombre_col1, nombre_col2)] = correlacion
-                
+
         return resultados_correlacion
@@ -1,16 +1,251 @@
 '''
 Clase para manipular un data.frame personalizado con métodos para añadir y acceder columnas,
-validar si está vacío, y exportar o importar datos en formatos CSV y TXT.
+validar si está vacío, y exportar o importar datos en formatos CSV, TXT (opcionalmente comprimidos) y binario columnar.
+Las columnas numéricas se almacenan en buffers tipados y contiguos (array.array) y el tipo
+inferido de cada columna se registra en un esquema por columna.
 '''
+import bz2
+import gzip
+import json
+import locale
+import lzma
+import math
+import mmap
+import operator
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, compress, islice, repeat
+from typing import Iterator, TextIO
+
+class _ColumnaTextoMapeada(Sequence):
+    '''
+    Columna de texto respaldada por un archivo binario mapeado en memoria.
+    Cada valor se decodifica al accederlo, de modo que sólo se leen del disco las páginas usadas.
+    '''
+    def __init__(self, desplazamientos: memoryview, datos: memoryview):
+        '''
+        Constructor de la columna de texto mapeada.
+        Parameters:
+            desplazamientos: (memoryview) Desplazamientos (int64) de inicio de cada valor, más el final del último.
+            datos: (memoryview) Bytes UTF-8 de todos los valores concatenados.
+        '''
+        self.desplazamientos = desplazamientos
+        self.datos = datos
+
+    def __len__(self) -> int:
+        return len(self.desplazamientos) - 1
+
+    def __getitem__(self, indice: int | slice) -> str | list[str]:
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Índice de fila fuera de rango.")
+        return str(self.datos[self.desplazamientos[indice]:self.desplazamientos[indice + 1]], 'utf-8')
+
+    def __iter__(self) -> Iterator[str]:
+        inicio = 0
+        for fin in self.desplazamientos[1:]:
+            yield str(self.datos[inicio:fin], 'utf-8')
+            inicio = fin
+
+class _ColumnaIndexada(Sequence):
+    '''
+    Vista de sólo lectura de algunas filas de una columna, definida por sus índices, que no copia los valores.
+    '''
+    def __init__(self, base, indices: range | array):
+        '''
+        Constructor de la vista indexada.
+        Parameters:
+            base: (Sequence) Columna original.
+            indices: (range | array) Índices de las filas de `base` que forman la vista, en orden.
+        '''
+        self.base = base
+        self.indices = indices
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __getitem__(self, indice: int | slice) -> object | list:
+        if isinstance(indice, slice):
+            return list(map(self.base.__getitem__, self.indices[indice]))
+        return self.base[self.indices[indice]]
+
+    def __iter__(self) -> Iterator:
+        return map(self.base.__getitem__, self.indices)
+
+class ColumnaCategorica(Sequence):
+    '''
+    Columna categórica codificada por diccionario: guarda un código entero por fila y la lista de valores distintos.
+    Los recuentos (entropía, información mutua) pueden hacerse directamente sobre los códigos.
+    '''
+    def __init__(self, codigos: array, categorias: list):
+        '''
+        Constructor de la columna categórica.
+        Parameters:
+            codigos: (array) Código (índice en `categorias`) de cada fila.
+            categorias: (list) Valores distintos de la columna, en orden de aparición.
+        '''
+        self.codigos = codigos
+        self.categorias = categorias
+
+    @classmethod
+    def codificar(cls, valores) -> "ColumnaCategorica":
+        '''
+        Método de clase para codificar una secuencia de valores como columna categórica.
+        Parameters:
+            valores: (Sequence) Valores de la columna.
+        Return:
+            ColumnaCategorica: Columna codificada.
+        '''
+        if isinstance(valores, cls):
+            return valores
+        indices = {}
+        codigos = array('i', [indices.setdefault(valor, len(indices)) for valor in valores])
+        return cls(codigos, list(indices))
+
+    @classmethod
+    def concatenar(cls, columnas: list["ColumnaCategorica"]) -> "ColumnaCategorica":
+        '''
+        Método de clase para unir varias columnas categóricas unificando sus diccionarios.
+        Parameters:
+            columnas: (list[ColumnaCategorica]) Columnas a unir, en orden.
+        Return:
+            ColumnaCategorica: Columna con las filas de todas las columnas.
+        '''
+        indices = {}
+        codigos = array('i')
+        for columna in columnas:
+            traduccion = [indices.setdefault(categoria, len(indices)) for categoria in columna.categorias]
+            codigos.extend(map(traduccion.__getitem__, columna.codigos))
+        return cls(codigos, list(indices))
+
+    def __len__(self) -> int:
+        return len(self.codigos)
+
+    def __getitem__(self, indice: int | slice) -> object | list:
+        if isinstance(indice, slice):
+            return list(map(self.categorias.__getitem__, self.codigos[indice]))
+        return self.categorias[self.codigos[indice]]
+
+    def __iter__(self) -> Iterator:
+        return map(self.categorias.__getitem__, self.codigos)
 
 class DataFrame:
-    def __init__(self, datos: dict[str, list]):
+    # Códigos de array.array usados para almacenar cada tipo numérico del esquema
+    CODIGOS_BUFFER = {'int': 'q', 'float': 'd'}
+    # Orden en que se amplía el tipo de una columna leída cuando una celda no encaja en el tipo actual
+    ORDEN_AMPLIACION = ('int', 'float', 'str')
+    # Número de celdas de cada columna usadas para inferir su tipo al leer un archivo
+    FILAS_MUESTRA = 100
+    # Compresiones de la librería estándar admitidas en los archivos de texto, por firma y por extensión
+    FIRMAS_COMPRESION = {b'\x1f\x8b': gzip, b'BZh': bz2, b'\xfd7zXZ\x00': lzma}
+    EXTENSIONES_COMPRESION = {'.gz': gzip, '.bz2': bz2, '.xz': lzma, '.lzma': lzma}
+    # Tamaño mínimo en bytes de cada rango de un archivo leído en paralelo
+    TAMANO_MIN_FRAGMENTO = 1 << 20
+    # Las columnas de texto leídas con a lo sumo MAX_CATEGORIAS valores distintos, que además no superen
+    # RATIO_CATEGORIAS veces el número de filas, se guardan como columnas categóricas
+    MAX_CATEGORIAS = 1024
+    RATIO_CATEGORIAS = 0.5
+    # Firma al inicio y al final de los archivos en formato binario columnar
+    FIRMA_BINARIO = b'DFCOLUM1'
+    # Firma y extensión de los archivos de índice de filas de un CSV/TXT
+    FIRMA_INDICE = b'DFINDICE'
+    EXTENSION_INDICE = '.idx'
+    # Número de filas de cada bloque que se perfila de una vez al calcular las estadísticas de una columna
+    TAMANO_BLOQUE_ESTADISTICAS = 1 << 16
+
+    def __init__(self, datos: dict[str, list], esquema: dict[str, str] = None):
         '''
         Constructor para inicializar el data.frame personalizado.
         Parameters:
             datos: (dict[str, list]) Diccionario que representa el data.frame, donde las llaves son nombres de columnas y los valores son listas con datos de cada columna.
+            esquema: (dict[str, str] | None) Tipos ya conocidos de las columnas; los que falten se infieren.
         '''
-        self.datos = datos
+        esquema = esquema or {}
+        self.datos = {}
+        self.esquema = {}
+        # Buffer al que corresponde el tipo registrado de cada columna, para detectar asignaciones directas sobre `datos`
+        self._buffers_esquema = {}
+        # Estadísticas por columna calculadas bajo demanda: nombre -> (buffer del que se calcularon, estadísticas)
+        self._estadisticas = {}
+        for nombre_columna, valores in datos.items():
+            self._asignar_columna(nombre_columna, valores, esquema.get(nombre_columna))
+
+    @staticmethod
+    def _codigo_buffer(valores) -> str | None:
+        '''
+        Método estático para obtener el código de tipo de un buffer tipado (array.array o memoryview).
+        Parameters:
+            valores: (list | array | memoryview) Valores de la columna.
+        Return:
+            str | None: Código de tipo del buffer, o None si los valores no están en un buffer tipado.
+        '''
+        if isinstance(valores, array):
+            return valores.typecode
+        if isinstance(valores, memoryview):
+            return valores.format
+        return None
+
+    @classmethod
+    def _inferir_tipo(cls, valores) -> str:
+        '''
+        Método de clase para inferir el tipo de una columna ('int', 'float', 'str', 'category' u 'object').
+        Parameters:
+            valores: (list | array | memoryview) Valores de la columna.
+        Return:
+            str: Tipo inferido de la columna.
+        '''
+        codigo = cls._codigo_buffer(valores)
+        if codigo is not None:
+            if codigo in 'bBhHiIlLqQ':
+                return 'int'
+            return 'float' if codigo in 'fd' else 'object'
+        if isinstance(valores, _ColumnaTextoMapeada):
+            return 'str'
+        if isinstance(valores, ColumnaCategorica):
+            return 'category'
+        if len(valores) == 0:
+            return 'object'
+        tipos = set(map(type, valores))
+        if tipos == {int}:
+            return 'int'
+        if tipos <= {int, float}:
+            return 'float'
+        if tipos == {str}:
+            return 'str'
+        return 'object'
+
+    def _asignar_columna(self, nombre_columna: str, valores, tipo: str = None) -> None:
+        '''
+        Método para almacenar una columna en su buffer tipado y registrar su tipo en el esquema.
+        Las columnas numéricas se guardan como array.array (o memoryview si ya vienen mapeadas); el resto se mantiene como lista.
+        Las vistas de filas de otro data.frame se guardan tal cual, sin copiar sus valores.
+        Parameters:
+            nombre_columna: (str) Nombre de la columna.
+            valores: (list | array | memoryview) Valores de la columna.
+            tipo: (str | None) Tipo conocido de la columna, o None para inferirlo.
+        Return:
+            None
+        '''
+        tipo = tipo or self._inferir_tipo(valores)
+        buffer = valores
+        codigo = self.CODIGOS_BUFFER.get(tipo)
+        if codigo is not None and self._codigo_buffer(valores) != codigo and not isinstance(valores, _ColumnaIndexada):
+            try:
+                buffer = array(codigo, valores)
+            except OverflowError:
+                # Enteros fuera del rango de 64 bits: se conservan como lista
+                buffer = list(valores)
+        self.datos[nombre_columna] = buffer
+        self.esquema[nombre_columna] = tipo
+        self._buffers_esquema[nombre_columna] = buffer
+        self._estadisticas.pop(nombre_columna, None)
     
     def agregar_columna(self, nombre_columna: str, valores: list) -> None:
         '''
@@ -26,11 +261,28 @@ class DataFrame:
         if nombre_columna in self.datos:
             raise ValueError(f"La columna '{nombre_columna}' ya existe.")
         
-        self.datos[nombre_columna] = valores
+        self._asignar_columna(nombre_columna, valores)
+
+    def reemplazar_columna(self, nombre_columna: str, valores: list) -> None:
+        '''
+        Método para sustituir los valores de una columna existente (p. ej. tras normalizar o discretizar).
+        Parameters:
+            nombre_columna: (str) Nombre de la columna a sustituir.
+            valores: (list) Nuevos valores de la columna.
+        Return:
+            None
+        Exceptions:
+            KeyError si la columna no existe.
+        '''
+        if nombre_columna not in self.datos:
+            raise KeyError(f"La columna '{nombre_columna}' no existe.")
+
+        self._asignar_columna(nombre_columna, valores)
     
     def obtener_columna(self, nombre_columna: str) -> list:
         '''
         Método para obtener los valores de una columna específica.
+        Las columnas numéricas se devuelven como una lista nueva construida desde su buffer tipado.
         Parameters:
             nombre_columna: (str) Nombre de la columna a obtener.
         Return:
@@ -38,11 +290,177 @@ class DataFrame:
         Exceptions:
             KeyError si la columna no existe.
         '''
+        buffer = self.obtener_buffer(nombre_columna)
+        if self._codigo_buffer(buffer) is not None:
+            return buffer.tolist()
+        return buffer if isinstance(buffer, list) else list(buffer)
+
+    def obtener_buffer(self, nombre_columna: str) -> array | memoryview | Sequence:
+        '''
+        Método para obtener el almacenamiento interno de una columna sin copiarlo.
+        Parameters:
+            nombre_columna: (str) Nombre de la columna a obtener.
+        Return:
+            array | memoryview | Sequence: Buffer tipado (columnas numéricas) o secuencia de valores (resto de columnas).
+        Exceptions:
+            KeyError si la columna no existe.
+        '''
         if nombre_columna not in self.datos:
             raise KeyError(f"La columna '{nombre_columna}' no existe.")
         
         return self.datos[nombre_columna]
 
+    def tipo_columna(self, nombre_columna: str) -> str:
+        '''
+        Método para obtener el tipo registrado en el esquema para una columna.
+        Si la columna se ha sustituido asignando directamente sobre `datos`, su tipo se vuelve a inferir.
+        Parameters:
+            nombre_columna: (str) Nombre de la columna.
+        Return:
+            str: Tipo de la columna ('int', 'float', 'str', 'category' u 'object').
+        Exceptions:
+            KeyError si la columna no existe.
+        '''
+        buffer = self.obtener_buffer(nombre_columna)
+        if self._buffers_esquema.get(nombre_columna) is not buffer:
+            # Columnas añadidas o sustituidas directamente sobre `datos` se infieren de nuevo al consultarlas
+            self.esquema[nombre_columna] = self._inferir_tipo(buffer)
+            self._buffers_esquema[nombre_columna] = buffer
+
+        return self.esquema[nombre_columna]
+
+    def es_numerica(self, nombre_columna: str) -> bool:
+        '''
+        Método para verificar, a partir del esquema, si una columna es numérica.
+        Parameters:
+            nombre_columna: (str) Nombre de la columna.
+        Return:
+            bool: True si la columna es de tipo 'int' o 'float', False en caso contrario.
+        '''
+        return self.tipo_columna(nombre_columna) in self.CODIGOS_BUFFER
+
+    def codificar_categorica(self, nombre_columna: str) -> None:
+        '''
+        Método para convertir una columna en columna categórica (códigos enteros más diccionario de valores).
+        Parameters:
+            nombre_columna: (str) Nombre de la columna a convertir.
+        Return:
+            None
+        Exceptions:
+            KeyError si la columna no existe.
+        '''
+        self.reemplazar_columna(nombre_columna, ColumnaCategorica.codificar(self.obtener_buffer(nombre_columna)))
+
+    def estadisticas_columna(self, nombre_columna: str) -> dict:
+        '''
+        Método para obtener las estadísticas de una columna, calculándolas sólo la primera vez que se piden.
+        La caché se invalida automáticamente cuando la columna se sustituye (agregar_columna, reemplazar_columna,
+        transformaciones in situ o asignación directa sobre `datos`).
+        Parameters:
+            nombre_columna: (str) Nombre de la columna.
+        Return:
+            dict: Diccionario con las llaves 'numerica', 'conteo', 'distintos', 'min', 'max', 'suma', 'suma_cuadrados',
+                  'media' y 'varianza' (poblacional); las seis últimas son None en columnas no numéricas o vacías.
+        Exceptions:
+            KeyError si la columna no existe.
+        '''
+        buffer = self.obtener_buffer(nombre_columna)
+        entrada = self._estadisticas.get(nombre_columna)
+        if entrada is None or entrada[0] is not buffer:
+            entrada = (buffer, self._calcular_estadisticas(buffer, self.tipo_columna(nombre_columna)))
+            self._estadisticas[nombre_columna] = entrada
+        return dict(entrada[1])
+
+    def estadisticas_columnas(self, nombres_columnas: list[str] = None, n_procesos: int = 1) -> dict[str, dict]:
+        '''
+        Método para obtener las estadísticas de varias columnas, repartiendo entre varios procesos las que aún no están
+        en caché. Cada columna pendiente se envía a un proceso (ver buffer_para_proceso) y sus estadísticas quedan en
+        la caché igual que con estadisticas_columna.
+        Parameters:
+            nombres_columnas: (list[str] | None) Columnas a perfilar, o None para todas.
+            n_procesos: (int | None) Número de procesos, o None para usar todos los núcleos.
+        Return:
+            dict[str, dict]: Estadísticas de cada columna (ver estadisticas_columna).
+        Exceptions:
+            KeyError si alguna columna no existe.
+            ValueError si `n_procesos` no es un entero positivo.
+        '''
+        if nombres_columnas is None:
+            nombres_columnas = list(self.datos)
+        n_procesos = self.normalizar_n_procesos(n_procesos)
+        pendientes = [nombre for nombre in nombres_columnas
+                      if self._estadisticas.get(nombre, (None,))[0] is not self.obtener_buffer(nombre)]
+        n_procesos = min(n_procesos, len(pendientes))
+        if n_procesos > 1:
+            buffers = [self.obtener_buffer(nombre) for nombre in pendientes]
+            tipos = [self.tipo_columna(nombre) for nombre in pendientes]
+            with ProcessPoolExecutor(n_procesos) as ejecutor:
+                resultados = ejecutor.map(self._calcular_estadisticas, map(self.buffer_para_proceso, buffers), tipos)
+                for nombre, buffer, estadisticas in zip(pendientes, buffers, resultados):
+                    self._estadisticas[nombre] = (buffer, estadisticas)
+        return {nombre: self.estadisticas_columna(nombre) for nombre in nombres_columnas}
+
+    @classmethod
+    def _calcular_estadisticas(cls, buffer, tipo: str) -> dict:
+        '''
+        Método de clase que perfila un buffer de columna en una sola pasada por bloques: cada bloque se lee una vez y,
+        mientras está en caché, se obtienen sus valores distintos, mínimo, máximo, suma y dispersión. Los bloques se
+        combinan con la fórmula de Welford por pares (Chan), que mantiene la varianza estable aunque la media sea grande.
+        Las sumas de columnas enteras son exactas; las de columnas reales se redondean con math.fsum.
+        Parameters:
+            buffer: (Sequence) Valores de la columna.
+            tipo: (str) Tipo de la columna según el esquema.
+        Return:
+            dict: Estadísticas de la columna (ver estadisticas_columna).
+        '''
+        numerica = tipo in cls.CODIGOS_BUFFER
+        n = len(buffer)
+        estadisticas = {
+            'numerica': numerica, 'conteo': n, 'distintos': 0, 'min': None, 'max': None,
+            'suma': None, 'suma_cuadrados': None, 'media': None, 'varianza': None
+        }
+        if not numerica or not n:
+            estadisticas['distintos'] = len(set(buffer.codigos if isinstance(buffer, ColumnaCategorica) else buffer))
+            return estadisticas
+
+        distintos = set()
+        minimo = maximo = buffer[0]
+        suma_entera = suma_cuadrados_entera = 0
+        sumas_bloques = []
+        vistos, media, m2 = 0, 0.0, 0.0
+        for inicio in range(0, n, cls.TAMANO_BLOQUE_ESTADISTICAS):
+            bloque = buffer[inicio:inicio + cls.TAMANO_BLOQUE_ESTADISTICAS]
+            distintos.update(bloque)
+            minimo, maximo = min(minimo, min(bloque)), max(maximo, max(bloque))
+            if tipo == 'int':
+                suma_entera += sum(bloque)
+                suma_cuadrados_entera += sum(map(operator.mul, bloque, bloque))
+                continue
+            n_bloque = len(bloque)
+            suma_bloque = math.fsum(bloque)
+            media_bloque = suma_bloque / n_bloque
+            desviaciones = list(map(operator.sub, bloque, repeat(media_bloque)))
+            m2_bloque = math.fsum(map(operator.mul, desviaciones, desviaciones))
+            sumas_bloques.append(suma_bloque)
+            delta = media_bloque - media
+            vistos += n_bloque
+            media += delta * n_bloque / vistos
+            m2 += m2_bloque + delta * delta * (vistos - n_bloque) * n_bloque / vistos
+
+        estadisticas.update({'distintos': len(distintos), 'min': minimo, 'max': maximo})
+        if tipo == 'int':
+            # Con sumas enteras exactas, media y varianza sólo se redondean en la división final
+            estadisticas.update({
+                'suma': suma_entera, 'suma_cuadrados': suma_cuadrados_entera, 'media': suma_entera / n,
+                'varianza': (n * suma_cuadrados_entera - suma_entera * suma_entera) / (n * n)
+            })
+        else:
+            suma = math.fsum(sumas_bloques)
+            estadisticas.update({
+                'suma': suma, 'suma_cuadrados': m2 + suma * suma / n, 'media': media, 'varianza': m2 / n
+            })
+        return estadisticas
+
     def esta_vacio(self) -> bool:
         '''
         Método para verificar si el data.frame está vacío.
@@ -51,83 +469,947 @@ class DataFrame:
         '''
         return not bool(self.datos) or all(len(valores) == 0 for valores in self.datos.values())
 
+    def seleccionar_filas(self, seleccion: slice | range | list[int] | list[bool]) -> "DataFrame":
+        '''
+        Método para seleccionar filas por rango de índices, lista de índices o máscara booleana.
+        Devuelve una vista: sus columnas guardan los índices de las filas sobre los buffers del data.frame original,
+        sin copiar los valores, y son de sólo lectura. La vista comparte los datos con el original: los cambios in situ
+        sobre un buffer del original (por ejemplo, asignar un elemento de su array) se ven en la vista. Sustituir una
+        columna del original o de la vista (reemplazar_columna, transformaciones in situ) no afecta al otro, y la vista
+        no impide ampliar los buffers del original.
+        Parameters:
+            seleccion: (slice | range | list[int] | list[bool]) Rango de filas, índices de las filas o máscara
+                       booleana con un valor por fila.
+        Return:
+            DataFramePersonalizado: Vista con las filas seleccionadas.
+        Exceptions:
+            ValueError si la máscara no tiene un valor por fila.
+            IndexError si algún índice está fuera de rango.
+        '''
+        filas = self._num_filas()
+        if isinstance(seleccion, slice):
+            indices = range(filas)[seleccion]
+        elif isinstance(seleccion, range):
+            indices = seleccion
+        elif len(seleccion) > 0 and isinstance(seleccion[0], bool):
+            if len(seleccion) != filas:
+                raise ValueError("La máscara debe tener un valor por fila.")
+            indices = array('q', compress(range(filas), seleccion))
+        else:
+            indices = array('q', seleccion)
+        if len(indices) and (min(indices) < 0 or max(indices) >= filas):
+            raise IndexError("Índice de fila fuera de rango.")
+
+        vista = type(self)({})
+        for nombre_columna, buffer in self.datos.items():
+            vista._asignar_columna(nombre_columna, self._vista_buffer(buffer, indices), self.tipo_columna(nombre_columna))
+        return vista
+
+    @classmethod
+    def _vista_buffer(cls, buffer, indices: range | array):
+        '''
+        Método de clase para construir la vista de sólo lectura de las filas `indices` de un buffer de columna.
+        Los rangos contiguos de columnas que ya son memoryview (archivos binarios mapeados) se recortan sin copia; el
+        resto se expone como vista indexada, que no exporta el buffer de los array y por tanto no los bloquea.
+        Parameters:
+            buffer: (Sequence) Buffer de la columna original.
+            indices: (range | array) Índices de las filas seleccionadas.
+        Return:
+            Sequence: Vista de la columna con las filas seleccionadas.
+        '''
+        if isinstance(buffer, ColumnaCategorica):
+            return ColumnaCategorica(cls._vista_buffer(buffer.codigos, indices), buffer.categorias)
+        contiguo = isinstance(indices, range) and indices.step == 1
+        if contiguo and isinstance(buffer, memoryview):
+            return buffer[indices.start:indices.stop]
+        if isinstance(buffer, _ColumnaIndexada):
+            # Una vista de una vista apunta directamente a la columna original
+            if contiguo:
+                return _ColumnaIndexada(buffer.base, buffer.indices[indices.start:indices.stop])
+            return _ColumnaIndexada(buffer.base, array('q', map(buffer.indices.__getitem__, indices)))
+        return _ColumnaIndexada(buffer, indices)
+
+    @classmethod
+    def concatenar(cls, bloques: list["DataFrame"]) -> "DataFrame":
+        '''
+        Método de clase para unir por filas varios data.frames con las mismas columnas.
+        Si una columna tiene tipos distintos en los bloques, se amplía al tipo más general (int -> float -> str).
+        Parameters:
+            bloques: (list[DataFramePersonalizado]) Data.frames a unir, en orden.
+        Return:
+            DataFramePersonalizado: Nuevo data.frame con las filas de todos los bloques.
+        Exceptions:
+            ValueError si los bloques no tienen las mismas columnas.
+        '''
+        bloques = list(bloques)
+        df = cls({})
+        if not bloques:
+            return df
+        nombres = list(bloques[0].datos)
+        if any(list(bloque.datos) != nombres for bloque in bloques[1:]):
+            raise ValueError("Los bloques no tienen las mismas columnas.")
+
+        for nombre_columna in nombres:
+            partes = [(bloque.obtener_buffer(nombre_columna), bloque.tipo_columna(nombre_columna)) for bloque in bloques]
+            tipos = {tipo for parte, tipo in partes if len(parte)}
+            if tipos == {'category'}:
+                categoricas = [ColumnaCategorica.codificar(parte) for parte, _ in partes]
+                df._asignar_columna(nombre_columna, ColumnaCategorica.concatenar(categoricas), 'category')
+                continue
+            # Una columna categórica se une con columnas de texto como texto
+            tipos = {'str' if tipo == 'category' else tipo for tipo in tipos}
+            if tipos and tipos <= set(cls.ORDEN_AMPLIACION):
+                tipo = max(tipos, key=cls.ORDEN_AMPLIACION.index)
+            else:
+                tipo = tipos.pop() if len(tipos) == 1 else 'object'
+            codigo = cls.CODIGOS_BUFFER.get(tipo)
+            buffer = array(codigo) if codigo else []
+            try:
+                for parte, tipo_parte in partes:
+                    if tipo == 'str' and tipo_parte != 'str':
+                        buffer.extend(map(str, parte))
+                    elif isinstance(parte, array) and parte.typecode != codigo:
+                        # array.extend sólo acepta otro array si tiene el mismo código de tipo
+                        buffer.extend(iter(parte))
+                    else:
+                        buffer.extend(parte)
+            except OverflowError:
+                # Enteros fuera del rango de 64 bits: se conservan como lista
+                buffer = [valor for parte, _ in partes for valor in parte]
+            df._asignar_columna(nombre_columna, buffer, tipo if len(buffer) else None)
+        return df
+
     def __repr__(self) -> str:
         '''
         Método para representar el data.frame como una cadena de texto.
         Return:
             str: Representación visual del data.frame.
         '''
-        filas = len(next(iter(self.datos.values()), []))
+        filas = self._num_filas()
         return "\n".join(
             " | ".join(f"{self.datos[col][fila]}" for col in self.datos)
             for fila in range(filas)
         )
     
-    def escribir_a_csv(self, ruta_archivo: str) -> None:
+    def escribir_a_csv(self, ruta_archivo: str, anexar: bool = False, filas_por_lote: int = 50000, n_procesos: int = 1) -> None:
         '''
         Método para escribir el data.frame en un archivo CSV.
         Parameters:
             ruta_archivo: (str) Ruta donde se guardará el archivo CSV.
+            anexar: (bool) Si es True, añade las filas al final del archivo (el encabezado sólo se escribe si está vacío).
+            filas_por_lote: (int) Número de filas que se serializan y escriben de una sola vez.
+            n_procesos: (int | None) Número de procesos que convierten las columnas a texto en paralelo, o None para usar
+                        todos los núcleos.
         Return:
             None
         '''
-        with open(ruta_archivo, 'w') as archivo:
-            archivo.write(','.join(self.datos.keys()) + '\n')
-            filas = len(next(iter(self.datos.values()), []))
-            for fila in range(filas):
-                archivo.write(','.join(str(self.datos[col][fila]) for col in self.datos) + '\n')
+        self._escribir_delimitado(ruta_archivo, ',', anexar, filas_por_lote, n_procesos)
 
     @classmethod
-    def leer_desde_csv(cls, ruta_archivo: str) -> "DataFrame":
+    def leer_desde_csv(cls, ruta_archivo: str, esquema: dict[str, str] = None, columnas: list[str] = None) -> "DataFrame":
         '''
         Método de clase para leer un archivo CSV y crear un data.frame personalizado.
         Parameters:
             ruta_archivo: (str) Ruta del archivo CSV a leer.
+            esquema: (dict[str, str] | None) Tipos explícitos ('int', 'float', 'str' o 'category') por columna; el resto se infiere.
+            columnas: (list[str] | None) Columnas a cargar, o None para cargar todas; el resto de campos no se convierte ni se almacena.
         Return:
             DataFramePersonalizado: Nueva instancia de la clase con datos cargados desde el CSV.
+        Exceptions:
+            ValueError si algún valor no puede convertirse al tipo indicado en `esquema`.
+            KeyError si alguna de las `columnas` no existe en el archivo.
+        '''
+        with cls._abrir_archivo(ruta_archivo, 'r') as archivo:
+            encabezados = archivo.readline().strip().split(',')
+            return cls._leer_bloque(archivo, encabezados, ',', esquema=esquema, columnas=columnas)
+
+    @classmethod
+    def iterar_csv(cls, ruta_archivo: str, filas_por_bloque: int = 100000, esquema: dict[str, str] = None,
+                   columnas: list[str] = None) -> Iterator["DataFrame"]:
+        '''
+        Método de clase para recorrer un archivo CSV por bloques, con uso de memoria acotado por el tamaño del bloque.
+        Los tipos inferidos sólo se amplían de un bloque al siguiente, por lo que pueden variar entre bloques; las
+        columnas indicadas en `esquema` tienen el mismo tipo en todos.
+        Parameters:
+            ruta_archivo: (str) Ruta del archivo CSV a leer.
+            filas_por_bloque: (int) Número máximo de filas de cada bloque.
+            esquema: (dict[str, str] | None) Tipos explícitos ('int', 'float', 'str' o 'category') por columna; el resto se infiere.
+            columnas: (list[str] | None) Columnas a cargar, o None para cargar todas; el resto de campos no se convierte ni se almacena.
+        Return:
+            Iterator[DataFramePersonalizado]: Generador de data.frames con las filas consecutivas del archivo.
+        Exceptions:
+            ValueError si `filas_por_bloque` no es un entero positivo.
+            KeyError si alguna de las `columnas` no existe en el archivo.
         '''
-        with open(ruta_archivo, 'r') as archivo:
-            lineas = archivo.readlines()
-            encabezados = lineas[0].strip().split(',')
-            datos = {encabezado: [] for encabezado in encabezados}
-            for linea in lineas[1:]:
-                valores = linea.strip().split(',')
-                for encabezado, valor in zip(encabezados, valores):
-                    datos[encabezado].append(cls._convertir_tipo(valor))
-            return cls(datos)
+        return cls._iterar_bloques(ruta_archivo, ',', filas_por_bloque, esquema, columnas)
 
-    def escribir_a_txt(self, ruta_archivo: str) -> None:
+    @classmethod
+    def leer_desde_csv_paralelo(cls, rutas: str | list[str], n_procesos: int = None, esquema: dict[str, str] = None,
+                               columnas: list[str] = None) -> "DataFrame":
+        '''
+        Método de clase para leer en paralelo uno o varios archivos CSV con un grupo de procesos.
+        Cada archivo sin comprimir se reparte en rangos de bytes alineados a saltos de línea; los archivos
+        comprimidos se leen enteros en un único proceso. Los fragmentos se concatenan en el orden original.
+        Parameters:
+            rutas: (str | list[str]) Ruta de un archivo, de un directorio con archivos particionados, o lista de rutas.
+            n_procesos: (int | None) Número de procesos, o None para usar todos los núcleos.
+            esquema: (dict[str, str] | None) Tipos explícitos ('int', 'float', 'str' o 'category') por columna; el resto se infiere.
+            columnas: (list[str] | None) Columnas a cargar, o None para cargar todas.
+        Return:
+            DataFramePersonalizado: Nueva instancia de la clase con los datos de todos los archivos.
+        Exceptions:
+            ValueError si los archivos no tienen los mismos encabezados o algún valor no encaja en `esquema`.
+            KeyError si alguna de las `columnas` no existe en los archivos.
+        '''
+        return cls._leer_paralelo(rutas, ',', n_procesos, esquema, columnas)
+
+    def escribir_a_txt(self, ruta_archivo: str, anexar: bool = False, filas_por_lote: int = 50000, n_procesos: int = 1) -> None:
         '''
         Método para escribir el data.frame en un archivo TXT con valores separados por tabulaciones.
         Parameters:
             ruta_archivo: (str) Ruta donde se guardará el archivo TXT.
+            anexar: (bool) Si es True, añade las filas al final del archivo (el encabezado sólo se escribe si está vacío).
+            filas_por_lote: (int) Número de filas que se serializan y escriben de una sola vez.
+            n_procesos: (int | None) Número de procesos que convierten las columnas a texto en paralelo, o None para usar
+                        todos los núcleos.
         Return:
             None
         '''
-        with open(ruta_archivo, 'w') as archivo:
-            archivo.write('\t'.join(self.datos.keys()) + '\n')
-            filas = len(next(iter(self.datos.values()), []))
-            for fila in range(filas):
-                archivo.write('\t'.join(str(self.datos[col][fila]) for col in self.datos) + '\n')
+        self._escribir_delimitado(ruta_archivo, '\t', anexar, filas_por_lote, n_procesos)
 
     @classmethod
-    def leer_desde_txt(cls, ruta_archivo: str) -> "DataFrame":
+    def leer_desde_txt(cls, ruta_archivo: str, esquema: dict[str, str] = None, columnas: list[str] = None) -> "DataFrame":
         '''
         Método de clase para leer un archivo TXT con valores separados por tabulaciones y crear un data.frame personalizado.
         Parameters:
             ruta_archivo: (str) Ruta del archivo TXT a leer.
+            esquema: (dict[str, str] | None) Tipos explícitos ('int', 'float', 'str' o 'category') por columna; el resto se infiere.
+            columnas: (list[str] | None) Columnas a cargar, o None para cargar todas; el resto de campos no se convierte ni se almacena.
         Return:
             DataFramePersonalizado: Nueva instancia de la clase con datos cargados desde el TXT.
+        Exceptions:
+            ValueError si algún valor no puede convertirse al tipo indicado en `esquema`.
+            KeyError si alguna de las `columnas` no existe en el archivo.
+        '''
+        with cls._abrir_archivo(ruta_archivo, 'r') as archivo:
+            encabezados = archivo.readline().strip().split('\t')
+            return cls._leer_bloque(archivo, encabezados, '\t', esquema=esquema, columnas=columnas)
+
+    @classmethod
+    def iterar_txt(cls, ruta_archivo: str, filas_por_bloque: int = 100000, esquema: dict[str, str] = None,
+                   columnas: list[str] = None) -> Iterator["DataFrame"]:
+        '''
+        Método de clase para recorrer un archivo TXT separado por tabulaciones por bloques de filas.
+        Los tipos inferidos sólo se amplían de un bloque al siguiente, por lo que pueden variar entre bloques; las
+        columnas indicadas en `esquema` tienen el mismo tipo en todos.
+        Parameters:
+            ruta_archivo: (str) Ruta del archivo TXT a leer.
+            filas_por_bloque: (int) Número máximo de filas de cada bloque.
+            esquema: (dict[str, str] | None) Tipos explícitos ('int', 'float', 'str' o 'category') por columna; el resto se infiere.
+            columnas: (list[str] | None) Columnas a cargar, o None para cargar todas; el resto de campos no se convierte ni se almacena.
+        Return:
+            Iterator[DataFramePersonalizado]: Generador de data.frames con las filas consecutivas del archivo.
+        Exceptions:
+            ValueError si `filas_por_bloque` no es un entero positivo.
+            KeyError si alguna de las `columnas` no existe en el archivo.
+        '''
+        return cls._iterar_bloques(ruta_archivo, '\t', filas_por_bloque, esquema, columnas)
+
+    @classmethod
+    def leer_desde_txt_paralelo(cls, rutas: str | list[str], n_procesos: int = None, esquema: dict[str, str] = None,
+                               columnas: list[str] = None) -> "DataFrame":
+        '''
+        Método de clase para leer en paralelo uno o varios archivos TXT separados por tabulaciones con un grupo de procesos.
+        Cada archivo sin comprimir se reparte en rangos de bytes alineados a saltos de línea; los archivos
+        comprimidos se leen enteros en un único proceso. Los fragmentos se concatenan en el orden original.
+        Parameters:
+            rutas: (str | list[str]) Ruta de un archivo, de un directorio con archivos particionados, o lista de rutas.
+            n_procesos: (int | None) Número de procesos, o None para usar todos los núcleos.
+            esquema: (dict[str, str] | None) Tipos explícitos ('int', 'float', 'str' o 'category') por columna; el resto se infiere.
+            columnas: (list[str] | None) Columnas a cargar, o None para cargar todas.
+        Return:
+            DataFramePersonalizado: Nueva instancia de la clase con los datos de todos los archivos.
+        Exceptions:
+            ValueError si los archivos no tienen los mismos encabezados o algún valor no encaja en `esquema`.
+            KeyError si alguna de las `columnas` no existe en los archivos.
+        '''
+        return cls._leer_paralelo(rutas, '\t', n_procesos, esquema, columnas)
+
+    def escribir_a_binario(self, ruta_archivo: str) -> None:
+        '''
+        Método para escribir el data.frame en formato binario columnar.
+        Cada columna se guarda como un bloque contiguo alineado a 8 bytes (int64, float64, códigos int32 más
+        diccionario para las categóricas, o desplazamientos int64 más bytes UTF-8 para el texto), seguido de un
+        pie JSON con el índice de bloques.
+        Las columnas de tipo 'object' se guardan como texto, igual que en CSV.
+        Parameters:
+            ruta_archivo: (str) Ruta donde se guardará el archivo binario.
+        Return:
+            None
+        Exceptions:
+            ValueError si una columna entera no cabe en 64 bits.
+        '''
+        # Se escribe en un archivo temporal del mismo directorio que luego sustituye al destino: el destino puede ser
+        # el archivo mapeado del que se leen las columnas, y truncarlo invalidaría los buffers mientras se escriben
+        directorio, nombre_archivo = os.path.split(os.path.abspath(ruta_archivo))
+        ruta_temporal = os.path.join(directorio, f'.{nombre_archivo}.{os.getpid()}.tmp')
+        try:
+            with open(ruta_temporal, 'wb') as archivo:
+                self._escribir_columnas_binario(archivo)
+            os.replace(ruta_temporal, ruta_archivo)
+        except BaseException:
+            if os.path.exists(ruta_temporal):
+                os.remove(ruta_temporal)
+            raise
+
+    def _escribir_columnas_binario(self, archivo) -> None:
+        '''
+        Método para escribir en un archivo abierto la firma, los bloques de las columnas y el pie del formato binario.
+        Parameters:
+            archivo: (BinaryIO) Archivo abierto en modo binario.
+        Return:
+            None
+        Exceptions:
+            ValueError si una columna entera no cabe en 64 bits.
+        '''
+        indice = []
+        archivo.write(self.FIRMA_BINARIO)
+        for nombre_columna, buffer in self.datos.items():
+            tipo = self.tipo_columna(nombre_columna)
+            entrada = {'nombre': nombre_columna, 'tipo': tipo, 'filas': len(buffer)}
+            if tipo in self.CODIGOS_BUFFER:
+                codigo = self.CODIGOS_BUFFER[tipo]
+                if self._codigo_buffer(buffer) != codigo:
+                    try:
+                        buffer = array(codigo, buffer)
+                    except OverflowError:
+                        raise ValueError(f"La columna '{nombre_columna}' contiene enteros que no caben en 64 bits.")
+                entrada['datos'] = self._escribir_bloque_binario(archivo, buffer)
+            elif tipo == 'category':
+                # Códigos int32 y, a continuación, el diccionario de categorías como columna de texto
+                codigos = buffer.codigos if self._codigo_buffer(buffer.codigos) == 'i' else array('i', buffer.codigos)
+                entrada['datos'] = self._escribir_bloque_binario(archivo, codigos)
+                entrada['categorias'] = self._escribir_texto_binario(archivo, buffer.categorias)
+            else:
+                entrada['tipo'] = 'str'
+                entrada.update(self._escribir_texto_binario(archivo, buffer))
+            indice.append(entrada)
+        pie = json.dumps({'orden_bytes': sys.byteorder, 'columnas': indice}).encode('utf-8')
+        archivo.write(pie)
+        archivo.write(struct.pack('<Q', len(pie)) + self.FIRMA_BINARIO)
+
+    @classmethod
+    def _escribir_texto_binario(cls, archivo, valores) -> dict:
+        '''
+        Método de clase para escribir una columna de texto como desplazamientos int64 seguidos de los bytes UTF-8.
+        Parameters:
+            archivo: (BinaryIO) Archivo abierto en modo binario.
+            valores: (Sequence) Valores de la columna (se convierten a texto).
+        Return:
+            dict: Posición de los bloques escritos, con las llaves 'desplazamientos' y 'datos'.
+        '''
+        codificados = [str(valor).encode('utf-8') for valor in valores]
+        desplazamientos = array('q', accumulate(map(len, codificados), initial=0))
+        return {
+            'desplazamientos': cls._escribir_bloque_binario(archivo, desplazamientos),
+            'datos': cls._escribir_bloque_binario(archivo, b''.join(codificados))
+        }
+
+    @staticmethod
+    def _escribir_bloque_binario(archivo, datos) -> list[int]:
+        '''
+        Método estático para escribir un bloque de datos alineado a 8 bytes.
+        Parameters:
+            archivo: (BinaryIO) Archivo abierto en modo binario.
+            datos: (array | memoryview | bytes) Contenido del bloque.
+        Return:
+            list[int]: Desplazamiento y longitud en bytes del bloque dentro del archivo.
+        '''
+        relleno = -archivo.tell() % 8
+        archivo.write(b'\0' * relleno)
+        desplazamiento = archivo.tell()
+        archivo.write(datos)
+        return [desplazamiento, archivo.tell() - desplazamiento]
+
+    @classmethod
+    def leer_desde_binario(cls, ruta_archivo: str, columnas: list[str] = None) -> "DataFrame":
+        '''
+        Método de clase para abrir un archivo en formato binario columnar mapeándolo en memoria.
+        Sólo se lee el índice del pie: las columnas numéricas se exponen sin copia como memoryview sobre el
+        archivo y las de texto se decodifican al accederlas, por lo que cada columna se carga del disco al usarla.
+        Parameters:
+            ruta_archivo: (str) Ruta del archivo binario a leer.
+            columnas: (list[str] | None) Columnas a exponer, o None para exponer todas.
+        Return:
+            DataFramePersonalizado: Nueva instancia de la clase respaldada por el archivo mapeado.
+        Exceptions:
+            ValueError si el archivo no está en formato binario columnar.
+            KeyError si alguna de las `columnas` no existe en el archivo.
+        '''
+        with open(ruta_archivo, 'rb') as archivo:
+            mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        firma = cls.FIRMA_BINARIO
+        fin_pie = len(mapa) - len(firma) - 8
+        if fin_pie < len(firma) or mapa[:len(firma)] != firma or mapa[-len(firma):] != firma:
+            raise ValueError("El archivo no está en formato binario de DataFrame.")
+        longitud_pie = struct.unpack('<Q', mapa[fin_pie:fin_pie + 8])[0]
+        pie = json.loads(mapa[fin_pie - longitud_pie:fin_pie])
+        entradas = {entrada['nombre']: entrada for entrada in pie['columnas']}
+        if columnas is None:
+            columnas = list(entradas)
+        for nombre_columna in columnas:
+            if nombre_columna not in entradas:
+                raise KeyError(f"La columna '{nombre_columna}' no existe.")
+
+        vista = memoryview(mapa)
+        misma_maquina = pie['orden_bytes'] == sys.byteorder
+
+        def bloque_tipado(posicion: list[int], codigo: str) -> memoryview | array:
+            desplazamiento, longitud = posicion
+            bloque = vista[desplazamiento:desplazamiento + longitud]
+            if misma_maquina:
+                return bloque.cast(codigo)
+            # Orden de bytes distinto al de la máquina: no es posible evitar la copia
+            buffer = array(codigo, bloque.tobytes())
+            buffer.byteswap()
+            return buffer
+
+        def texto_mapeado(posiciones: dict) -> _ColumnaTextoMapeada:
+            desplazamiento, longitud = posiciones['datos']
+            return _ColumnaTextoMapeada(bloque_tipado(posiciones['desplazamientos'], 'q'),
+                                        vista[desplazamiento:desplazamiento + longitud])
+
+        df = cls({})
+        for nombre_columna in columnas:
+            entrada = entradas[nombre_columna]
+            if entrada['tipo'] in cls.CODIGOS_BUFFER:
+                buffer = bloque_tipado(entrada['datos'], cls.CODIGOS_BUFFER[entrada['tipo']])
+            elif entrada['tipo'] == 'category':
+                buffer = ColumnaCategorica(bloque_tipado(entrada['datos'], 'i'), list(texto_mapeado(entrada['categorias'])))
+            else:
+                buffer = texto_mapeado(entrada)
+            df._asignar_columna(nombre_columna, buffer, entrada['tipo'])
+        return df
+
+    @classmethod
+    def construir_indice_filas(cls, ruta_archivo: str, cada_n: int = 1000) -> str:
         '''
-        with open(ruta_archivo, 'r') as archivo:
-            lineas = archivo.readlines()
-            encabezados = lineas[0].strip().split('\t')
-            datos = {encabezado: [] for encabezado in encabezados}
-            for linea in lineas[1:]:
-                valores = linea.strip().split('\t')
-                for encabezado, valor in zip(encabezados, valores):
-                    datos[encabezado].append(cls._convertir_tipo(valor))
-            return cls(datos)
+        Método de clase para construir el índice de filas de un archivo CSV/TXT sin comprimir.
+        El índice se guarda junto al archivo (ruta_archivo + '.idx') y contiene el desplazamiento en bytes de cada
+        `cada_n` filas de datos, para poder leer rangos de filas sin recorrer el archivo desde el principio.
+        Parameters:
+            ruta_archivo: (str) Ruta del archivo a indexar.
+            cada_n: (int) Número de filas entre dos desplazamientos consecutivos del índice.
+        Return:
+            str: Ruta del archivo de índice creado.
+        Exceptions:
+            ValueError si `cada_n` no es un entero positivo o el archivo está comprimido.
+        '''
+        if not isinstance(cada_n, int) or cada_n < 1:
+            raise ValueError("`cada_n` debe ser un entero positivo.")
+        desplazamientos = array('q')
+        filas = 0
+        with open(ruta_archivo, 'rb') as archivo:
+            if any(archivo.read(6).startswith(firma) for firma in cls.FIRMAS_COMPRESION):
+                raise ValueError("No se puede indexar un archivo comprimido.")
+            archivo.seek(0)
+            posicion = len(archivo.readline())
+            for linea in archivo:
+                # Las líneas vacías no son filas, igual que al leer el archivo
+                if linea.strip():
+                    if filas % cada_n == 0:
+                        desplazamientos.append(posicion)
+                    filas += 1
+                posicion += len(linea)
+
+        if sys.byteorder != 'little':
+            desplazamientos.byteswap()
+        estado = os.stat(ruta_archivo)
+        ruta_indice = ruta_archivo + cls.EXTENSION_INDICE
+        with open(ruta_indice, 'wb') as archivo:
+            archivo.write(cls.FIRMA_INDICE)
+            archivo.write(struct.pack('<qqqq', cada_n, filas, estado.st_size, estado.st_mtime_ns))
+            archivo.write(desplazamientos)
+        return ruta_indice
+
+    @classmethod
+    def leer_filas_csv(cls, ruta_archivo: str, inicio: int, fin: int, esquema: dict[str, str] = None,
+                       columnas: list[str] = None) -> "DataFrame":
+        '''
+        Método de clase para leer las filas [inicio, fin) de un archivo CSV usando su índice de filas.
+        Parameters:
+            ruta_archivo: (str) Ruta del archivo CSV, indexado con construir_indice_filas.
+            inicio: (int) Primera fila de datos a leer (empezando en 0).
+            fin: (int) Fila siguiente a la última a leer.
+            esquema: (dict[str, str] | None) Tipos explícitos por columna; el resto se infiere.
+            columnas: (list[str] | None) Columnas a cargar, o None para cargar todas.
+        Return:
+            DataFramePersonalizado: Data.frame con las filas pedidas.
+        Exceptions:
+            ValueError si el índice no existe, no corresponde al archivo actual o el rango no es válido.
+        '''
+        return cls._leer_filas(ruta_archivo, ',', inicio, fin, esquema, columnas)
+
+    @classmethod
+    def leer_filas_txt(cls, ruta_archivo: str, inicio: int, fin: int, esquema: dict[str, str] = None,
+                       columnas: list[str] = None) -> "DataFrame":
+        '''
+        Método de clase para leer las filas [inicio, fin) de un archivo TXT separado por tabulaciones usando su índice de filas.
+        Parameters:
+            ruta_archivo: (str) Ruta del archivo TXT, indexado con construir_indice_filas.
+            inicio: (int) Primera fila de datos a leer (empezando en 0).
+            fin: (int) Fila siguiente a la última a leer.
+            esquema: (dict[str, str] | None) Tipos explícitos por columna; el resto se infiere.
+            columnas: (list[str] | None) Columnas a cargar, o None para cargar todas.
+        Return:
+            DataFramePersonalizado: Data.frame con las filas pedidas.
+        Exceptions:
+            ValueError si el índice no existe, no corresponde al archivo actual o el rango no es válido.
+        '''
+        return cls._leer_filas(ruta_archivo, '\t', inicio, fin, esquema, columnas)
+
+    def _escribir_delimitado(self, ruta_archivo: str, separador: str, anexar: bool, filas_por_lote: int, n_procesos: int) -> None:
+        '''
+        Método para escribir el data.frame en un archivo delimitado por lotes de filas.
+        Cada lote se convierte a texto columna a columna (opcionalmente en procesos paralelos), se une en
+        una única cadena y se escribe con una sola llamada, en lugar de indexar y escribir celda a celda.
+        Parameters:
+            ruta_archivo: (str) Ruta del archivo a escribir.
+            separador: (str) Separador de campos.
+            anexar: (bool) Si es True, añade las filas al final del archivo.
+            filas_por_lote: (int) Número de filas por lote.
+            n_procesos: (int | None) Número de procesos para convertir las columnas a texto, o None para usar todos los núcleos.
+        Return:
+            None
+        Exceptions:
+            ValueError si `filas_por_lote` o `n_procesos` no son enteros positivos.
+        '''
+        if not isinstance(filas_por_lote, int) or filas_por_lote < 1:
+            raise ValueError("`filas_por_lote` debe ser un entero positivo.")
+        n_procesos = self.normalizar_n_procesos(n_procesos)
+
+        columnas = list(self.datos.values())
+        filas = self._num_filas()
+        # El tamaño se comprueba antes de abrir: en archivos comprimidos la posición no refleja el contenido previo
+        escribir_encabezado = not anexar or not os.path.exists(ruta_archivo) or os.path.getsize(ruta_archivo) == 0
+        ejecutor = ProcessPoolExecutor(n_procesos) if n_procesos > 1 and len(columnas) > 1 else None
+        try:
+            with self._abrir_archivo(ruta_archivo, 'a' if anexar else 'w') as archivo:
+                if escribir_encabezado:
+                    archivo.write(separador.join(self.datos.keys()) + '\n')
+                for inicio in range(0, filas, filas_por_lote):
+                    fragmentos = [columna[inicio:inicio + filas_por_lote] for columna in columnas]
+                    if ejecutor is None:
+                        textos = map(self._codificar_fragmento, fragmentos)
+                    else:
+                        fragmentos = list(map(self.buffer_para_proceso, fragmentos))
+                        textos = ejecutor.map(self._codificar_fragmento, fragmentos)
+                    archivo.write('\n'.join(map(separador.join, zip(*textos))) + '\n')
+        finally:
+            if ejecutor is not None:
+                ejecutor.shutdown()
+
+    @classmethod
+    def _abrir_archivo(cls, ruta_archivo: str, modo: str) -> TextIO:
+        '''
+        Método de clase para abrir un archivo de texto, comprimido o no, en modo 'r', 'w' o 'a'.
+        Al leer, la compresión (gzip, bz2 o lzma/xz) se detecta por la firma del archivo; al escribir, por su
+        extensión. La (des)compresión se hace en flujo, sin expandir el archivo en disco ni en memoria.
+        Parameters:
+            ruta_archivo: (str) Ruta del archivo.
+            modo: (str) Modo de apertura ('r', 'w' o 'a').
+        Return:
+            TextIO: Archivo abierto en modo texto.
+        '''
+        if modo == 'r':
+            with open(ruta_archivo, 'rb') as archivo:
+                inicio = archivo.read(6)
+            compresion = next((c for firma, c in cls.FIRMAS_COMPRESION.items() if inicio.startswith(firma)), None)
+        else:
+            extension = os.path.splitext(ruta_archivo)[1].lower()
+            compresion = cls.EXTENSIONES_COMPRESION.get(extension)
+        if compresion is None:
+            return open(ruta_archivo, modo)
+        return compresion.open(ruta_archivo, modo + 't')
+
+    @staticmethod
+    def _codificar_fragmento(valores) -> list[str]:
+        '''
+        Método estático para convertir a texto un fragmento de columna.
+        Parameters:
+            valores: (Sequence) Valores del fragmento.
+        Return:
+            list[str]: Representación textual de cada valor.
+        '''
+        return list(map(str, valores))
+
+    def _num_filas(self) -> int:
+        '''
+        Método para obtener el número de filas del data.frame (longitud de su primera columna).
+        Return:
+            int: Número de filas.
+        '''
+        return len(next(iter(self.datos.values()), []))
+
+    @staticmethod
+    def normalizar_n_procesos(n_procesos: int | None) -> int:
+        '''
+        Método estático para validar el número de procesos de una operación paralela.
+        Parameters:
+            n_procesos: (int | None) Número de procesos, o None para usar todos los núcleos.
+        Return:
+            int: Número de procesos a usar.
+        Exceptions:
+            ValueError si `n_procesos` no es un entero positivo.
+        '''
+        if n_procesos is None:
+            n_procesos = os.cpu_count() or 1
+        if not isinstance(n_procesos, int) or n_procesos < 1:
+            raise ValueError("`n_procesos` debe ser un entero positivo.")
+        return n_procesos
+
+    @classmethod
+    def buffer_para_proceso(cls, buffer):
+        '''
+        Método de clase para preparar un buffer de columna antes de enviarlo a otro proceso.
+        Los memoryview de archivos mapeados no se pueden serializar, y las vistas de filas sí, pero arrastran la
+        columna original completa: ambos se copian en un array compacto (o en una lista si no son numéricos). Las
+        columnas categóricas se envían como códigos enteros con su diccionario, sin decodificar cada valor.
+        Parameters:
+            buffer: (Sequence) Buffer de la columna.
+        Return:
+            Sequence: Buffer serializable con los mismos valores.
+        '''
+        if isinstance(buffer, ColumnaCategorica):
+            codigos = cls.buffer_para_proceso(buffer.codigos)
+            return buffer if codigos is buffer.codigos else ColumnaCategorica(codigos, buffer.categorias)
+        if isinstance(buffer, (array, list)):
+            return buffer
+        codigo = cls._codigo_buffer(buffer.base if isinstance(buffer, _ColumnaIndexada) else buffer)
+        return list(buffer) if codigo is None else array(codigo, buffer)
+
+    @classmethod
+    def _iterar_bloques(cls, ruta_archivo: str, separador: str, filas_por_bloque: int, esquema: dict[str, str] = None,
+                        columnas: list[str] = None) -> Iterator["DataFrame"]:
+        '''
+        Método de clase que valida los argumentos y devuelve el generador de bloques de un archivo delimitado.
+        Los tipos inferidos en un bloque se usan como punto de partida del siguiente, de modo que sólo pueden ampliarse
+        (int -> float -> str), pero los bloques ya devueltos no se modifican: una columna puede tener un tipo distinto en
+        bloques distintos, y una columna de texto puede ser categórica en unos y no en otros. Para un esquema fijo en
+        todos los bloques, los tipos deben indicarse en `esquema`.
+        Parameters:
+            ruta_archivo: (str) Ruta del archivo a leer.
+            separador: (str) Separador de campos.
+            filas_por_bloque: (int) Número máximo de filas de cada bloque.
+            esquema: (dict[str, str] | None) Tipos explícitos por columna.
+            columnas: (list[str] | None) Columnas a cargar, o None para cargar todas.
+        Return:
+            Iterator[DataFramePersonalizado]: Generador de bloques.
+        Exceptions:
+            ValueError si `filas_por_bloque` no es un entero positivo.
+        '''
+        if not isinstance(filas_por_bloque, int) or filas_por_bloque < 1:
+            raise ValueError("`filas_por_bloque` debe ser un entero positivo.")
+
+        def generador():
+            tipos_iniciales = {}
+            with cls._abrir_archivo(ruta_archivo, 'r') as archivo:
+                encabezados = archivo.readline().strip().split(separador)
+                while True:
+                    bloque = cls._leer_bloque(archivo, encabezados, separador, filas_por_bloque, esquema,
+                                              tipos_iniciales, columnas)
+                    if bloque.esta_vacio():
+                        return
+                    tipos_iniciales = cls._tipos_de_partida(bloque.esquema)
+                    yield bloque
+
+        return generador()
+
+    @classmethod
+    def _tipos_de_partida(cls, esquema: dict[str, str]) -> dict[str, str]:
+        '''
+        Método de clase que obtiene, a partir del esquema de un bloque leído, los tipos de partida para los siguientes.
+        Parameters:
+            esquema: (dict[str, str]) Esquema del bloque leído.
+        Return:
+            dict[str, str]: Tipos ampliables ('int', 'float' o 'str') por columna.
+        '''
+        return {
+            nombre: 'str' if tipo == 'category' else tipo
+            for nombre, tipo in esquema.items() if tipo in cls.ORDEN_AMPLIACION or tipo == 'category'
+        }
+
+    @classmethod
+    def _leer_paralelo(cls, rutas: str | list[str], separador: str, n_procesos: int, esquema: dict[str, str],
+                       columnas: list[str]) -> "DataFrame":
+        '''
+        Método de clase que reparte la lectura de uno o varios archivos delimitados entre un grupo de procesos.
+        Los tipos de partida se infieren una sola vez sobre una muestra del primer archivo y se comparten con todos
+        los procesos, para que los fragmentos lleguen con el mismo esquema.
+        Parameters:
+            rutas: (str | list[str]) Ruta de un archivo, de un directorio o lista de rutas.
+            separador: (str) Separador de campos.
+            n_procesos: (int | None) Número de procesos, o None para usar todos los núcleos.
+            esquema: (dict[str, str] | None) Tipos explícitos por columna.
+            columnas: (list[str] | None) Columnas a cargar, o None para cargar todas.
+        Return:
+            DataFramePersonalizado: Data.frame con las filas de todos los archivos, en orden.
+        Exceptions:
+            ValueError si `n_procesos` no es un entero positivo o los archivos no tienen los mismos encabezados.
+        '''
+        n_procesos = cls.normalizar_n_procesos(n_procesos)
+        if isinstance(rutas, str):
+            if os.path.isdir(rutas):
+                rutas = sorted(ruta for ruta in (os.path.join(rutas, nombre) for nombre in os.listdir(rutas))
+                               if cls._es_archivo_de_datos(ruta))
+            else:
+                rutas = [rutas]
+
+        tareas = []
+        encabezados_comunes = None
+        partes_por_archivo = -(-n_procesos // max(len(rutas), 1))
+        for ruta_archivo in rutas:
+            with cls._abrir_archivo(ruta_archivo, 'r') as archivo:
+                encabezados = archivo.readline().strip().split(separador)
+                if encabezados_comunes is None:
+                    encabezados_comunes = encabezados
+                    muestra = cls._leer_bloque(archivo, encabezados, separador, cls.FILAS_MUESTRA, esquema, None, columnas)
+                    tipos_iniciales = cls._tipos_de_partida(muestra.esquema)
+                elif encabezados != encabezados_comunes:
+                    raise ValueError(f"El archivo '{ruta_archivo}' no tiene los mismos encabezados que el resto.")
+            with open(ruta_archivo, 'rb') as archivo:
+                comprimido = any(archivo.read(6).startswith(firma) for firma in cls.FIRMAS_COMPRESION)
+                archivo.seek(0)
+                inicio_datos = len(archivo.readline())
+            tamano = os.path.getsize(ruta_archivo)
+            partes = 1 if comprimido else max(1, min(partes_por_archivo, (tamano - inicio_datos) // cls.TAMANO_MIN_FRAGMENTO))
+            if partes == 1:
+                tareas.append((ruta_archivo, None, None))
+            else:
+                limites = [inicio_datos + (tamano - inicio_datos) * i // partes for i in range(partes + 1)]
+                tareas.extend((ruta_archivo, inicio, fin) for inicio, fin in zip(limites, limites[1:]))
+        if not tareas:
+            return cls({})
+
+        argumentos = [[separador] * len(tareas), [esquema] * len(tareas), [tipos_iniciales] * len(tareas), [columnas] * len(tareas)]
+        if n_procesos == 1 or len(tareas) == 1:
+            fragmentos = list(map(cls._leer_fragmento, *zip(*tareas), *argumentos))
+        else:
+            with ProcessPoolExecutor(min(n_procesos, len(tareas))) as ejecutor:
+                fragmentos = list(ejecutor.map(cls._leer_fragmento, *zip(*tareas), *argumentos))
+        return cls.concatenar(fragmentos)
+
+    @classmethod
+    def _es_archivo_de_datos(cls, ruta_archivo: str) -> bool:
+        '''
+        Método de clase que decide si un archivo de un directorio es una parte de datos delimitados. Se descartan los
+        archivos ocultos, los índices de filas (EXTENSION_INDICE) y cualquier archivo con la firma de un índice o del
+        formato binario columnar, aunque se haya renombrado.
+        Parameters:
+            ruta_archivo: (str) Ruta del archivo.
+        Return:
+            bool: True si el archivo debe leerse como parte de los datos.
+        '''
+        nombre = os.path.basename(ruta_archivo)
+        if not os.path.isfile(ruta_archivo) or nombre.startswith('.') or nombre.endswith(cls.EXTENSION_INDICE):
+            return False
+        with open(ruta_archivo, 'rb') as archivo:
+            firma = archivo.read(max(len(cls.FIRMA_INDICE), len(cls.FIRMA_BINARIO)))
+        return not firma.startswith((cls.FIRMA_INDICE, cls.FIRMA_BINARIO))
+
+    @classmethod
+    def _leer_fragmento(cls, ruta_archivo: str, inicio: int | None, fin: int | None, separador: str, esquema: dict[str, str],
+                        tipos_iniciales: dict[str, str], columnas: list[str]) -> "DataFrame":
+        '''
+        Método de clase que lee las filas de un archivo cuyo inicio está en el rango de bytes [inicio, fin).
+        Parameters:
+            ruta_archivo: (str) Ruta del archivo.
+            inicio: (int | None) Primer byte del rango, o None para leer el archivo completo.
+            fin: (int | None) Byte siguiente al final del rango, o None para leer el archivo completo.
+            separador: (str) Separador de campos.
+            esquema: (dict[str, str] | None) Tipos explícitos por columna.
+            tipos_iniciales: (dict[str, str] | None) Tipos de partida por columna.
+            columnas: (list[str] | None) Columnas a cargar, o None para cargar todas.
+        Return:
+            DataFramePersonalizado: Data.frame con las filas del fragmento.
+        '''
+        if inicio is None:
+            with cls._abrir_archivo(ruta_archivo, 'r') as archivo:
+                encabezados = archivo.readline().strip().split(separador)
+                return cls._leer_bloque(archivo, encabezados, separador, None, esquema, tipos_iniciales, columnas)
+
+        codificacion = locale.getpreferredencoding(False)
+        with open(ruta_archivo, 'rb') as archivo:
+            encabezados = archivo.readline().decode(codificacion).strip().split(separador)
+            # Se descarta el resto de la línea que contiene el byte anterior al rango: pertenece al fragmento previo
+            archivo.seek(inicio - 1)
+            posicion = inicio - 1 + len(archivo.readline())
+
+            def lineas():
+                nonlocal posicion
+                while posicion < fin:
+                    linea = archivo.readline()
+                    if not linea:
+                        return
+                    posicion += len(linea)
+                    yield linea.decode(codificacion)
+
+            return cls._leer_bloque(lineas(), encabezados, separador, None, esquema, tipos_iniciales, columnas)
+
+    @classmethod
+    def _leer_filas(cls, ruta_archivo: str, separador: str, inicio: int, fin: int, esquema: dict[str, str],
+                    columnas: list[str]) -> "DataFrame":
+        '''
+        Método de clase que salta, con el índice de filas, al desplazamiento más cercano a `inicio` y lee [inicio, fin).
+        Como mucho se recorren cada_n - 1 filas antes de la primera pedida.
+        Parameters:
+            ruta_archivo: (str) Ruta del archivo indexado.
+            separador: (str) Separador de campos.
+            inicio: (int) Primera fila de datos a leer.
+            fin: (int) Fila siguiente a la última a leer.
+            esquema: (dict[str, str] | None) Tipos explícitos por columna.
+            columnas: (list[str] | None) Columnas a cargar, o None para cargar todas.
+        Return:
+            DataFramePersonalizado: Data.frame con las filas pedidas.
+        Exceptions:
+            ValueError si el índice no existe, no corresponde al archivo actual o el rango no es válido.
+        '''
+        ruta_indice = ruta_archivo + cls.EXTENSION_INDICE
+        if not os.path.exists(ruta_indice):
+            raise ValueError(f"El archivo '{ruta_archivo}' no tiene índice de filas. Use construir_indice_filas.")
+        with open(ruta_indice, 'rb') as archivo:
+            if archivo.read(len(cls.FIRMA_INDICE)) != cls.FIRMA_INDICE:
+                raise ValueError(f"El archivo '{ruta_indice}' no es un índice de filas.")
+            cada_n, filas, tamano, modificacion = struct.unpack('<qqqq', archivo.read(32))
+            estado = os.stat(ruta_archivo)
+            if (tamano, modificacion) != (estado.st_size, estado.st_mtime_ns):
+                raise ValueError(f"El índice de filas de '{ruta_archivo}' está desactualizado.")
+            if not 0 <= inicio <= fin <= filas:
+                raise ValueError(f"Rango de filas no válido: [{inicio}, {fin}) con {filas} filas.")
+            # Sólo se lee el desplazamiento necesario del índice; un rango vacío no lo necesita (al final del archivo
+            # apuntaría más allá del último desplazamiento guardado)
+            desplazamiento = 0
+            if inicio < fin:
+                archivo.seek(len(cls.FIRMA_INDICE) + 32 + 8 * (inicio // cada_n))
+                desplazamiento = struct.unpack('<q', archivo.read(8))[0]
+
+        codificacion = locale.getpreferredencoding(False)
+        with open(ruta_archivo, 'rb') as archivo:
+            encabezados = archivo.readline().decode(codificacion).strip().split(separador)
+            archivo.seek(desplazamiento)
+            lineas_no_vacias = (linea.decode(codificacion) for linea in archivo if linea.strip())
+            lineas = islice(lineas_no_vacias, inicio % cada_n, inicio % cada_n + fin - inicio)
+            return cls._leer_bloque(lineas, encabezados, separador, None, esquema, None, columnas)
+
+    @classmethod
+    def _leer_bloque(cls, archivo, encabezados: list[str], separador: str, max_filas: int = None,
+                     esquema: dict[str, str] = None, tipos_iniciales: dict[str, str] = None,
+                     columnas: list[str] = None) -> "DataFrame":
+        '''
+        Método de clase para leer hasta `max_filas` líneas de un archivo abierto y construir un data.frame con ellas.
+        Las líneas se consumen de forma perezosa y cada columna se convierte en bloque con un único conversor.
+        Parameters:
+            archivo: (TextIO) Archivo abierto, posicionado tras la línea de encabezados.
+            encabezados: (list[str]) Nombres de las columnas.
+            separador: (str) Separador de campos.
+            max_filas: (int | None) Número máximo de filas a leer, o None para leer hasta el final.
+            esquema: (dict[str, str] | None) Tipos explícitos por columna, que no se amplían.
+            tipos_iniciales: (dict[str, str] | None) Tipos de partida por columna, que sí pueden ampliarse.
+            columnas: (list[str] | None) Columnas a cargar, o None para cargar todas.
+        Return:
+            DataFramePersonalizado: Data.frame con las filas leídas (vacío si no quedan filas).
+        Exceptions:
+            ValueError si algún valor no puede convertirse al tipo indicado en `esquema`.
+            KeyError si alguna de las `columnas` no existe en el archivo.
+        '''
+        esquema = esquema or {}
+        tipos_iniciales = tipos_iniciales or {}
+        if columnas is None:
+            columnas = encabezados
+        for nombre_columna in columnas:
+            if nombre_columna not in encabezados:
+                raise KeyError(f"La columna '{nombre_columna}' no existe.")
+
+        textos = {nombre_columna: [] for nombre_columna in columnas}
+        seleccion = [(textos[nombre_columna], encabezados.index(nombre_columna)) for nombre_columna in textos]
+        # Sólo se separan los campos hasta la última columna pedida; el resto de la línea no se procesa
+        max_indice = max((indice for _, indice in seleccion), default=-1)
+        max_divisiones = -1 if max_indice == len(encabezados) - 1 else max_indice + 1
+        lineas_no_vacias = (linea for linea in archivo if linea.strip())
+        for linea in islice(lineas_no_vacias, max_filas):
+            campos = linea.strip().split(separador, max_divisiones)
+            for columna, indice in seleccion:
+                if indice < len(campos):
+                    columna.append(campos[indice])
+
+        datos = {}
+        for encabezado, valores in textos.items():
+            if esquema.get(encabezado) == 'category':
+                datos[encabezado] = ColumnaCategorica.codificar(valores)
+            elif encabezado in esquema:
+                datos[encabezado] = cls._convertir_columna(valores, esquema[encabezado], ampliar=False)
+            elif valores:
+                tipo = tipos_iniciales.get(encabezado) or cls._inferir_tipo_texto(valores[:cls.FILAS_MUESTRA])
+                datos[encabezado] = cls._convertir_columna(valores, tipo)
+                if isinstance(datos[encabezado], list) and cls._es_baja_cardinalidad(valores):
+                    datos[encabezado] = ColumnaCategorica.codificar(valores)
+            else:
+                datos[encabezado] = valores
+        return cls(datos)
+
+    @classmethod
+    def _es_baja_cardinalidad(cls, valores: list[str]) -> bool:
+        '''
+        Método de clase para decidir si una columna de texto leída debe guardarse como categórica.
+        Parameters:
+            valores: (list[str]) Valores de la columna.
+        Return:
+            bool: True si el número de valores distintos no supera MAX_CATEGORIAS ni RATIO_CATEGORIAS veces las filas.
+        '''
+        return len(set(valores)) <= min(cls.MAX_CATEGORIAS, cls.RATIO_CATEGORIAS * len(valores))
+
+    @classmethod
+    def _inferir_tipo_texto(cls, muestra: list[str]) -> str:
+        '''
+        Método de clase para inferir el tipo ('int', 'float' o 'str') de una columna a partir de una muestra de celdas.
+        Parameters:
+            muestra: (list[str]) Celdas de la columna tal como aparecen en el archivo.
+        Return:
+            str: Tipo más estrecho capaz de representar todas las celdas de la muestra.
+        '''
+        indices = (cls.ORDEN_AMPLIACION.index(type(cls._convertir_tipo(valor)).__name__) for valor in muestra)
+        return cls.ORDEN_AMPLIACION[max(indices, default=0)]
+
+    @classmethod
+    def _convertir_columna(cls, valores: list[str], tipo: str, ampliar: bool = True) -> array | list:
+        '''
+        Método de clase para convertir todas las celdas de una columna con un único conversor.
+        Si una celda no encaja en el tipo y `ampliar` es True, la columna entera pasa al siguiente tipo de
+        ORDEN_AMPLIACION (int -> float -> str), de modo que el resultado no depende del orden de las celdas.
+        Parameters:
+            valores: (list[str]) Celdas de la columna.
+            tipo: (str) Tipo de partida ('int', 'float' o 'str').
+            ampliar: (bool) Si es False, una celda que no encaja en `tipo` provoca un error.
+        Return:
+            array | list: Buffer tipado para columnas numéricas o lista de cadenas.
+        Exceptions:
+            ValueError si el tipo no es válido, o si una celda no encaja en `tipo` y `ampliar` es False.
+        '''
+        if tipo not in cls.ORDEN_AMPLIACION:
+            raise ValueError(f"Tipo de columna no válido: '{tipo}'. Use 'int', 'float' o 'str'.")
+
+        for tipo_candidato in cls.ORDEN_AMPLIACION[cls.ORDEN_AMPLIACION.index(tipo):]:
+            if tipo_candidato == 'str':
+                return valores
+            conversor = int if tipo_candidato == 'int' else float
+            try:
+                try:
+                    return array(cls.CODIGOS_BUFFER[tipo_candidato], map(conversor, valores))
+                except OverflowError:
+                    return list(map(conversor, valores))
+            except ValueError:
+                if not ampliar:
+                    raise ValueError(f"La columna contiene valores que no son de tipo '{tipo}'.")
 
     @staticmethod
     def _convertir_tipo(valor: str) -> int | float | str:
@@ -1,23 +1,31 @@
 import math
+import operator
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, groupby
+from dataframe import DataFrame
+from quantiles import ResumenCuantiles
 
 class Discretizador:
     # Diccionario para almacenar puntos de corte por método de discretización
     puntos_corte = {}
 
     @staticmethod
-    def ancho_igual(columna: list[float | int], bins: int) -> list[int]:
+    def ancho_igual(columna: list[float | int], bins: int, min_valor: float = None, max_valor: float = None) -> list[int]:
         '''
         Método para discretizar una columna en intervalos de ancho igual.
         Parameters:
             columna: (list[float | int]) Lista de valores numéricos a discretizar.
             bins: (int) Número de intervalos (bins).
+            min_valor: (float | None) Mínimo ya conocido de la columna, o None para calcularlo.
+            max_valor: (float | None) Máximo ya conocido de la columna, o None para calcularlo.
         Return:
             list[int]: Lista de valores discretizados en función del intervalo correspondiente.
         '''
-        min_valor, max_valor = min(columna), max(columna)
-        rango = max_valor - min_valor + 1e-10  # Para evitar divisiones por cero
-        ancho = rango / bins
-        puntos_corte = [min_valor + i * ancho for i in range(1, bins)]
+        if min_valor is None or max_valor is None:
+            min_valor, max_valor = min(columna), max(columna)
+        puntos_corte, rango = Discretizador._cortes_ancho_igual(min_valor, max_valor, bins)
         Discretizador.puntos_corte['ancho_igual'] = puntos_corte
         discretizado = [
             min(bins - 1, int((valor - min_valor) / rango * bins)) for valor in columna
@@ -28,52 +36,143 @@ class Discretizador:
     def frecuencia_igual(columna: list[float | int], bins: int) -> list[int]:
         '''
         Método para discretizar una columna en intervalos de frecuencia igual.
+        Las filas se ordenan una sola vez (argsort) y cada valor recibe el bin de la primera posición que ocupa
+        en el orden, de modo que los valores repetidos nunca se reparten entre dos bins.
         Parameters:
             columna: (list[float | int]) Lista de valores numéricos a discretizar.
             bins: (int) Número de intervalos (bins).
         Return:
             list[int]: Lista de valores discretizados en función del intervalo correspondiente.
         '''
-        valores_ordenados = sorted(columna)
         n = len(columna)
+        orden = sorted(range(n), key=columna.__getitem__)
         tamano_bin = n // bins
-        puntos_corte = [valores_ordenados[(i + 1) * tamano_bin - 1] for i in range(bins - 1)]
+        puntos_corte = Discretizador._cortes_frecuencia_igual([columna[indice] for indice in orden], bins)
         Discretizador.puntos_corte['frecuencia_igual'] = puntos_corte
         discretizado = [0] * n
-        for indice_bin in range(bins):
-            inicio = indice_bin * tamano_bin
-            fin = inicio + tamano_bin if indice_bin < bins - 1 else n
-            for i in range(inicio, fin):
-                discretizado[columna.index(valores_ordenados[i])] = indice_bin
+        indice_bin = 0
+        valor_previo = None
+        for posicion, indice in enumerate(orden):
+            valor = columna[indice]
+            if posicion == 0 or valor != valor_previo:
+                indice_bin = min(bins - 1, posicion // tamano_bin) if tamano_bin else bins - 1
+                valor_previo = valor
+            discretizado[indice] = indice_bin
         return discretizado
 
     @staticmethod
-    def k_means(columna: list[float | int], bins: int) -> list[int]:
+    def k_means(columna: list[float | int], bins: int, max_iteraciones: int = 300, tolerancia: float = 1e-9,
+                exacto: bool = False) -> list[int]:
         '''
         Método para discretizar una columna usando el algoritmo de k-means.
+        La columna se ordena una sola vez: cada cluster es un tramo contiguo de los valores ordenados y su
+        centroide se obtiene con sumas acumuladas, sin comparar cada valor con cada centroide.
         Parameters:
             columna: (list[float | int]) Lista de valores numéricos a discretizar.
             bins: (int) Número de intervalos (bins).
+            max_iteraciones: (int) Número máximo de iteraciones de Lloyd.
+            tolerancia: (float) Las iteraciones se detienen cuando ningún centroide se desplaza más de
+                        `tolerancia` veces el rango de la columna.
+            exacto: (bool) Si es True, obtiene la partición óptima (mínima suma de cuadrados) por programación
+                    dinámica en lugar de usar iteraciones de Lloyd.
         Return:
             list[int]: Lista de valores discretizados en función del intervalo correspondiente.
         '''
-        min_valor, max_valor = min(columna), max(columna)
+        puntos_corte = Discretizador._cortes_k_means(sorted(columna), bins, max_iteraciones, tolerancia, exacto)
+        Discretizador.puntos_corte['k_means'] = puntos_corte
+        return [bisect_right(puntos_corte, valor) for valor in columna]
+
+    @staticmethod
+    def _centroides_k_means_lloyd(valores_ordenados: list[float | int], bins: int, max_iteraciones: int,
+                                  tolerancia: float) -> list[float]:
+        '''
+        Método para obtener los centroides de k-means en 1-D con iteraciones de Lloyd sobre la columna ordenada.
+        En cada iteración los límites de los clusters se buscan por bisección en los puntos medios entre centroides
+        y las medias se calculan con sumas acumuladas, con un coste O(bins * log n) por iteración.
+        Parameters:
+            valores_ordenados: (list[float | int]) Valores de la columna, ordenados.
+            bins: (int) Número de clusters.
+            max_iteraciones: (int) Número máximo de iteraciones.
+            tolerancia: (float) Desplazamiento máximo de los centroides, relativo al rango, para detenerse.
+        Return:
+            list[float]: Centroides finales.
+        '''
+        min_valor, max_valor = valores_ordenados[0], valores_ordenados[-1]
+        sumas = list(accumulate(valores_ordenados, initial=0))
+        umbral = tolerancia * (max_valor - min_valor)
         centroides = [min_valor + (i + 0.5) * (max_valor - min_valor) / bins for i in range(bins)]
-        centroides_previos = [None] * bins
-        while centroides != centroides_previos:
-            clusters = [[] for _ in range(bins)]
-            for valor in columna:
-                indice_mas_cercano = min(range(bins), key=lambda i: abs(valor - centroides[i]))
-                clusters[indice_mas_cercano].append(valor)
-            centroides_previos = centroides[:]
-            centroides = [sum(cluster) / len(cluster) if cluster else centroides[i]
-                          for i, cluster in enumerate(clusters)]
-        Discretizador.puntos_corte['k_means'] = [(centroides[i] + centroides[i + 1]) / 2 for i in range(bins - 1)]
-        discretizado = [
-            next((i for i, corte in enumerate(Discretizador.puntos_corte['k_means']) if valor < corte), bins - 1)
-            for valor in columna
-        ]
-        return discretizado
+        for _ in range(max_iteraciones):
+            # Un valor equidistante de dos centroides se asigna al de menor índice
+            limites = [0] + [bisect_right(valores_ordenados, (centroides[i] + centroides[i + 1]) / 2)
+                             for i in range(bins - 1)] + [len(valores_ordenados)]
+            nuevos = [(sumas[fin] - sumas[inicio]) / (fin - inicio) if fin > inicio else centroides[i]
+                      for i, (inicio, fin) in enumerate(zip(limites, limites[1:]))]
+            desplazamiento = max(abs(nuevo - previo) for nuevo, previo in zip(nuevos, centroides))
+            centroides = nuevos
+            if desplazamiento <= umbral:
+                break
+        return centroides
+
+    @staticmethod
+    def _centroides_k_means_exacto(valores_ordenados: list[float | int], bins: int) -> list[float]:
+        '''
+        Método para obtener los centroides de la partición k-means óptima en 1-D por programación dinámica.
+        Trabaja sobre los valores distintos ponderados por su frecuencia y centrados en su media, con sumas acumuladas
+        para el coste de cada tramo y la optimización divide y vencerás (los cortes óptimos son monótonos), en
+        O(bins * m log m) para m valores distintos. Si hay menos valores distintos que bins, se devuelve un centroide
+        por valor.
+        Parameters:
+            valores_ordenados: (list[float | int]) Valores de la columna, ordenados.
+            bins: (int) Número de clusters.
+        Return:
+            list[float]: Centroides de la partición óptima.
+        '''
+        distintos, pesos = [], []
+        for valor, grupo in groupby(valores_ordenados):
+            distintos.append(valor)
+            pesos.append(sum(1 for _ in grupo))
+        m = len(distintos)
+        k = min(bins, m)
+        # Los valores se centran en su media antes de acumularlos: con un desplazamiento grande (por ejemplo, marcas
+        # de tiempo) la resta de sumas de cuadrados del coste se cancelaría y perdería toda la precisión
+        media = math.fsum(map(operator.mul, pesos, distintos)) / len(valores_ordenados)
+        centrados = [valor - media for valor in distintos]
+        suma_pesos = list(accumulate(pesos, initial=0))
+        suma_valores = list(accumulate(map(operator.mul, pesos, centrados), initial=0))
+        suma_cuadrados = list(accumulate((p * x * x for p, x in zip(pesos, centrados)), initial=0))
+
+        def coste(inicio: int, fin: int) -> float:
+            # Suma de cuadrados respecto a la media de los valores distintos [inicio, fin)
+            suma = suma_valores[fin] - suma_valores[inicio]
+            return suma_cuadrados[fin] - suma_cuadrados[inicio] - suma * suma / (suma_pesos[fin] - suma_pesos[inicio])
+
+        previo = [0.0] + [coste(0, fin) for fin in range(1, m + 1)]
+        cortes = []
+        for cluster in range(2, k + 1):
+            actual = [math.inf] * (m + 1)
+            corte = [0] * (m + 1)
+            pendientes = [(cluster, m, cluster - 1, m - 1)]
+            while pendientes:
+                bajo, alto, opt_bajo, opt_alto = pendientes.pop()
+                if bajo > alto:
+                    continue
+                medio = (bajo + alto) // 2
+                for inicio in range(opt_bajo, min(medio - 1, opt_alto) + 1):
+                    candidato = previo[inicio] + coste(inicio, medio)
+                    if candidato < actual[medio]:
+                        actual[medio], corte[medio] = candidato, inicio
+                pendientes.append((bajo, medio - 1, opt_bajo, corte[medio]))
+                pendientes.append((medio + 1, alto, corte[medio], opt_alto))
+            previo = actual
+            cortes.append(corte)
+
+        limites = [m]
+        for corte in reversed(cortes):
+            limites.append(corte[limites[-1]])
+        limites.append(0)
+        limites.reverse()
+        return [media + (suma_valores[fin] - suma_valores[inicio]) / (suma_pesos[fin] - suma_pesos[inicio])
+                for inicio, fin in zip(limites, limites[1:])]
 
     @staticmethod
     def basado_en_cuantiles(columna: list[float | int], bins: int) -> list[int]:
@@ -85,37 +184,265 @@ class Discretizador:
         Return:
             list[int]: Lista de valores discretizados en función del intervalo correspondiente.
         '''
-        valores_ordenados = sorted(columna)
-        n = len(valores_ordenados)
-        tamano_bin = n / bins
-        puntos_corte = [(valores_ordenados[int(i * tamano_bin - 1)] + valores_ordenados[int(i * tamano_bin)]) / 2 for i in range(1, bins)]
+        puntos_corte = Discretizador._cortes_cuantiles(sorted(columna), bins)
         Discretizador.puntos_corte['basado_en_cuantiles'] = puntos_corte
-        return [next((i for i, corte in enumerate(puntos_corte) if valor < corte), bins - 1) for valor in columna]
+        return [bisect_right(puntos_corte, valor) for valor in columna]
+
+    @staticmethod
+    def entropia_mdl(columna: list[float | int], clase: list) -> list[int]:
+        '''
+        Método para discretizar una columna de forma supervisada (Fayyad-Irani): se elige recursivamente el corte que
+        minimiza la entropía de la clase y se detiene con el criterio MDL, por lo que el número de bins lo decide el método.
+        Parameters:
+            columna: (list[float | int]) Lista de valores numéricos a discretizar.
+            clase: (list) Etiqueta de clase de cada valor.
+        Return:
+            list[int]: Lista de valores discretizados en función del intervalo correspondiente.
+        Exceptions:
+            ValueError si la columna y la clase no tienen la misma longitud.
+        '''
+        puntos_corte = Discretizador._cortes_entropia_mdl(columna, clase)
+        Discretizador.puntos_corte['entropia_mdl'] = puntos_corte
+        return [bisect_right(puntos_corte, valor) for valor in columna]
+
+    @staticmethod
+    def _cortes_ancho_igual(min_valor: float, max_valor: float, bins: int) -> tuple[list[float], float]:
+        '''
+        Método para calcular los puntos de corte de ancho igual.
+        Parameters:
+            min_valor: (float) Mínimo de la columna.
+            max_valor: (float) Máximo de la columna.
+            bins: (int) Número de intervalos (bins).
+        Return:
+            tuple[list[float], float]: Puntos de corte y rango usado para asignar los bins.
+        '''
+        rango = max_valor - min_valor + 1e-10  # Para evitar divisiones por cero
+        ancho = rango / bins
+        return [min_valor + i * ancho for i in range(1, bins)], rango
+
+    @staticmethod
+    def _cortes_frecuencia_igual(valores_ordenados: list[float | int], bins: int) -> list[float | int]:
+        '''
+        Método para calcular los puntos de corte de frecuencia igual: el último valor de cada bin.
+        Parameters:
+            valores_ordenados: (list[float | int]) Valores de la columna, ordenados.
+            bins: (int) Número de intervalos (bins).
+        Return:
+            list[float | int]: Puntos de corte (un valor pertenece al primer bin cuyo corte es mayor o igual).
+        '''
+        tamano_bin = len(valores_ordenados) // bins
+        if tamano_bin == 0:
+            # Con menos valores que bins los primeros bins quedan vacíos y todos los valores van al último
+            return [-math.inf] * (bins - 1)
+        return [valores_ordenados[(i + 1) * tamano_bin - 1] for i in range(bins - 1)]
 
     @staticmethod
-    def discretizar_columna(df, nombre_columna: str, metodo: str = 'ancho_igual', bins: int = 3) -> None:
+    def _cortes_k_means(valores_ordenados: list[float | int], bins: int, max_iteraciones: int = 300,
+                        tolerancia: float = 1e-9, exacto: bool = False) -> list[float]:
+        '''
+        Método para calcular los puntos de corte de k-means: los puntos medios entre centroides consecutivos.
+        Parameters:
+            valores_ordenados: (list[float | int]) Valores de la columna, ordenados.
+            bins: (int) Número de clusters.
+            max_iteraciones: (int) Número máximo de iteraciones de Lloyd.
+            tolerancia: (float) Desplazamiento relativo de los centroides para detenerse.
+            exacto: (bool) Si es True, usa la partición óptima por programación dinámica.
+        Return:
+            list[float]: Puntos de corte (un valor pertenece al primer bin cuyo corte es mayor estricto).
+        '''
+        if exacto:
+            centroides = Discretizador._centroides_k_means_exacto(valores_ordenados, bins)
+        else:
+            centroides = Discretizador._centroides_k_means_lloyd(valores_ordenados, bins, max_iteraciones, tolerancia)
+        return [(centroides[i] + centroides[i + 1]) / 2 for i in range(len(centroides) - 1)]
+
+    @staticmethod
+    def _cortes_cuantiles(valores_ordenados: list[float | int], bins: int) -> list[float]:
+        '''
+        Método para calcular los puntos de corte por cuantiles: el punto medio entre los valores que rodean cada cuantil.
+        Parameters:
+            valores_ordenados: (list[float | int]) Valores de la columna, ordenados.
+            bins: (int) Número de intervalos (bins).
+        Return:
+            list[float]: Puntos de corte (un valor pertenece al primer bin cuyo corte es mayor estricto).
+        '''
+        tamano_bin = len(valores_ordenados) / bins
+        return [(valores_ordenados[int(i * tamano_bin - 1)] + valores_ordenados[int(i * tamano_bin)]) / 2
+                for i in range(1, bins)]
+
+    @staticmethod
+    def _cortes_entropia_mdl(columna: list[float | int], clase: list) -> list[float]:
+        '''
+        Método para calcular los puntos de corte de la discretización por entropía con criterio MDL.
+        La columna se ordena una sola vez y se agrupa por valores distintos; con sumas acumuladas del número de filas de
+        cada clase, la entropía de cualquier tramo se obtiene en O(clases), sin recorrer de nuevo sus filas.
+        Parameters:
+            columna: (list[float | int]) Valores numéricos de la columna.
+            clase: (list) Etiqueta de clase de cada valor.
+        Return:
+            list[float]: Puntos de corte, ordenados (un valor pertenece al primer bin cuyo corte es mayor estricto).
+        Exceptions:
+            ValueError si la columna y la clase no tienen la misma longitud.
+        '''
+        if len(columna) != len(clase):
+            raise ValueError("La columna y la clase deben tener la misma longitud.")
+        codigos, valores, conteos = {}, [], []
+        for indice in sorted(range(len(columna)), key=columna.__getitem__):
+            valor = columna[indice]
+            if not valores or valor != valores[-1]:
+                valores.append(valor)
+                conteos.append({})
+            codigo = codigos.setdefault(clase[indice], len(codigos))
+            conteos[-1][codigo] = conteos[-1].get(codigo, 0) + 1
+        acumulados = [list(accumulate((conteo.get(codigo, 0) for conteo in conteos), initial=0))
+                      for codigo in range(len(codigos))]
+        filas = list(accumulate(map(sum, map(dict.values, conteos)), initial=0))
+
+        def x_log_x(x: int) -> float:
+            return x * math.log2(x) if x else 0.0
+
+        def entropia(cuentas: list[int], total: int) -> float:
+            return math.log2(total) - sum(map(x_log_x, cuentas)) / total
+
+        puntos_corte = []
+        pendientes = [(0, len(valores))]
+        while pendientes:
+            inicio, fin = pendientes.pop()
+            if fin - inicio < 2:
+                continue
+            totales = [acumulado[fin] - acumulado[inicio] for acumulado in acumulados]
+            n = filas[fin] - filas[inicio]
+            entropia_tramo = entropia(totales, n)
+            if entropia_tramo == 0:
+                continue
+            # n * entropía ponderada de una partición = sum(x log x de cada lado) - sum(x log x de cada clase y lado)
+            mejor_coste, mejor_corte = math.inf, None
+            for corte in range(inicio + 1, fin):
+                n_izquierda = filas[corte] - filas[inicio]
+                coste = x_log_x(n_izquierda) + x_log_x(n - n_izquierda)
+                for acumulado, total in zip(acumulados, totales):
+                    izquierda = acumulado[corte] - acumulado[inicio]
+                    coste -= x_log_x(izquierda) + x_log_x(total - izquierda)
+                if coste < mejor_coste:
+                    mejor_coste, mejor_corte = coste, corte
+            izquierda = [acumulado[mejor_corte] - acumulado[inicio] for acumulado in acumulados]
+            derecha = [total - cuenta for total, cuenta in zip(totales, izquierda)]
+            n_izquierda = filas[mejor_corte] - filas[inicio]
+            entropia_izquierda = entropia(izquierda, n_izquierda)
+            entropia_derecha = entropia(derecha, n - n_izquierda)
+            k = sum(1 for cuenta in totales if cuenta)
+            k_izquierda = sum(1 for cuenta in izquierda if cuenta)
+            k_derecha = sum(1 for cuenta in derecha if cuenta)
+            ganancia = entropia_tramo - mejor_coste / n
+            delta = math.log2(3 ** k - 2) - (k * entropia_tramo - k_izquierda * entropia_izquierda
+                                             - k_derecha * entropia_derecha)
+            if ganancia > (math.log2(n - 1) + delta) / n:
+                puntos_corte.append((valores[mejor_corte - 1] + valores[mejor_corte]) / 2)
+                pendientes.append((inicio, mejor_corte))
+                pendientes.append((mejor_corte, fin))
+        return sorted(puntos_corte)
+
+    @staticmethod
+    def discretizar_columna(df, nombre_columna: str, metodo: str = 'ancho_igual', bins: int = 3,
+                            columna_clase: str = None) -> 'DiscretizadorColumna':
         '''
         Método para discretizar una columna de un data.frame usando un método específico.
         Parameters:
             df: (objeto) DataFrame con la columna a discretizar.
             nombre_columna: (str) Nombre de la columna a discretizar.
-            metodo: (str) Método de discretización ('ancho_igual', 'frecuencia_igual', 'k_means', 'basado_en_cuantiles').
-            bins: (int) Número de intervalos (bins).
+            metodo: (str) Método de discretización ('ancho_igual', 'frecuencia_igual', 'k_means', 'basado_en_cuantiles',
+                    'entropia_mdl').
+            bins: (int) Número de intervalos (bins); en 'entropia_mdl' no se usa.
+            columna_clase: (str | None) Columna con la clase, necesaria para 'entropia_mdl'.
         Return:
-            None
+            DiscretizadorColumna: Discretizador ajustado, reutilizable para aplicar los mismos bins a otros datos.
+        Exceptions:
+            ValueError si el método no es válido o 'entropia_mdl' se usa sin columna de clase.
         '''
-        columna = df.obtener_columna(nombre_columna)
+        discretizador = DiscretizadorColumna(metodo, bins)
+        columna = df.obtener_buffer(nombre_columna)
         if metodo == 'ancho_igual':
-            discretizado = Discretizador.ancho_igual(columna, bins)
-        elif metodo == 'frecuencia_igual':
-            discretizado = Discretizador.frecuencia_igual(columna, bins)
-        elif metodo == 'k_means':
-            discretizado = Discretizador.k_means(columna, bins)
-        elif metodo == 'basado_en_cuantiles':
-            discretizado = Discretizador.basado_en_cuantiles(columna, bins)
+            estadisticas = df.estadisticas_columna(nombre_columna)
+            discretizador.ajustar(columna, estadisticas['min'], estadisticas['max'])
+        else:
+            clase = df.obtener_buffer(columna_clase) if columna_clase is not None else None
+            discretizador.ajustar(columna, clase=clase)
+        Discretizador.puntos_corte[metodo] = discretizador.puntos_corte
+        df.reemplazar_columna(nombre_columna, discretizador.transformar(columna))
+        return discretizador
+
+    @staticmethod
+    def discretizar_data_frame(df, metodo: str = 'ancho_igual', bins: int = 3, columnas: list[str] = None,
+                               n_procesos: int = None, columna_clase: str = None) -> dict[str, 'DiscretizadorColumna']:
+        '''
+        Método para discretizar varias columnas de un data.frame, ajustando y aplicando los bins de cada columna en
+        paralelo. Cada columna se ajusta de forma independiente, por lo que el resultado no depende del número de procesos.
+        Parameters:
+            df: (objeto) DataFrame con las columnas a discretizar.
+            metodo: (str) Método de discretización ('ancho_igual', 'frecuencia_igual', 'k_means', 'basado_en_cuantiles',
+                    'entropia_mdl').
+            bins: (int) Número de intervalos (bins).
+            columnas: (list[str] | None) Columnas a discretizar, o None para discretizar todas las numéricas (salvo la clase).
+            n_procesos: (int | None) Número de procesos, o None para usar todos los núcleos.
+            columna_clase: (str | None) Columna con la clase, necesaria para 'entropia_mdl'.
+        Return:
+            dict[str, DiscretizadorColumna]: Discretizador ajustado (con sus puntos de corte) de cada columna.
+        Exceptions:
+            ValueError si el método no es válido, `n_procesos` no es un entero positivo o 'entropia_mdl' se usa sin
+            columna de clase.
+        '''
+        if metodo not in DiscretizadorColumna.METODOS:
+            raise ValueError("Método de discretización no válido. Use 'ancho_igual', 'frecuencia_igual', 'k_means', 'basado_en_cuantiles' o 'entropia_mdl'.")
+        n_procesos = DataFrame.normalizar_n_procesos(n_procesos)
+        if metodo == 'entropia_mdl' and columna_clase is None:
+            raise ValueError("El método 'entropia_mdl' necesita una columna de clase.")
+        if columnas is None:
+            columnas = [nombre for nombre in df.datos if df.es_numerica(nombre) and nombre != columna_clase]
+        clase = df.obtener_buffer(columna_clase) if metodo == 'entropia_mdl' else None
+
+        tareas = []
+        for nombre in columnas:
+            columna = df.obtener_buffer(nombre)
+            min_valor = max_valor = None
+            if metodo == 'ancho_igual':
+                estadisticas = df.estadisticas_columna(nombre)
+                min_valor, max_valor = estadisticas['min'], estadisticas['max']
+            tareas.append((columna, min_valor, max_valor))
+        argumentos = [[metodo] * len(tareas), [bins] * len(tareas)]
+        argumentos_clase = [[clase] * len(tareas)]
+        if n_procesos == 1 or len(tareas) <= 1:
+            resultados = list(map(Discretizador._discretizar_tarea, *argumentos, *zip(*tareas), *argumentos_clase))
         else:
-            raise ValueError("Método de discretización no válido. Use 'ancho_igual', 'frecuencia_igual', 'k_means', o 'basado_en_cuantiles'.")
-        df.datos[nombre_columna] = discretizado
+            tareas = [(DataFrame.buffer_para_proceso(c), mn, mx) for c, mn, mx in tareas]
+            if clase is not None:
+                argumentos_clase = [[DataFrame.buffer_para_proceso(clase)] * len(tareas)]
+            with ProcessPoolExecutor(min(n_procesos, len(tareas))) as ejecutor:
+                resultados = list(ejecutor.map(Discretizador._discretizar_tarea, *argumentos, *zip(*tareas),
+                                               *argumentos_clase))
+
+        discretizadores = {}
+        for nombre, (discretizador, discretizado) in zip(columnas, resultados):
+            df.reemplazar_columna(nombre, discretizado)
+            discretizadores[nombre] = discretizador
+        return discretizadores
+
+    @staticmethod
+    def _discretizar_tarea(metodo: str, bins: int, columna: list[float | int], min_valor: float | None,
+                           max_valor: float | None, clase: list | None) -> tuple['DiscretizadorColumna', array]:
+        '''
+        Método que ajusta y aplica el discretizador de una columna (ejecutado en un proceso del pool).
+        Parameters:
+            metodo: (str) Método de discretización.
+            bins: (int) Número de intervalos (bins).
+            columna: (list[float | int]) Valores de la columna.
+            min_valor: (float | None) Mínimo conocido de la columna (solo 'ancho_igual').
+            max_valor: (float | None) Máximo conocido de la columna (solo 'ancho_igual').
+            clase: (list | None) Clase de cada fila (solo 'entropia_mdl').
+        Return:
+            tuple[DiscretizadorColumna, array]: Discretizador ajustado y bins de cada fila.
+        '''
+        discretizador = DiscretizadorColumna(metodo, bins).ajustar(columna, min_valor, max_valor, clase)
+        return discretizador, array('q', discretizador.transformar(columna))
 
     @staticmethod
     def obtener_rangos_bins(metodo: str = 'ancho_igual', decimales: int = 8) -> list[tuple[float, float]]:
@@ -141,3 +468,171 @@ class Discretizador:
         rangos_bins.append((corte_previo, float('inf')))
         
         return rangos_bins
+
+
+class DiscretizadorColumna:
+    '''
+    Discretizador que se ajusta una vez sobre una columna y guarda sus propios puntos de corte, de modo que los
+    mismos bins pueden aplicarse después a nuevos lotes (o en otros procesos) sin volver a ajustar.
+    Los bins se asignan por bisección sobre los puntos de corte.
+    '''
+    METODOS = ('ancho_igual', 'frecuencia_igual', 'k_means', 'basado_en_cuantiles', 'entropia_mdl')
+
+    def __init__(self, metodo: str = 'ancho_igual', bins: int = 3, max_iteraciones: int = 300,
+                 tolerancia: float = 1e-9, exacto: bool = False) -> None:
+        '''
+        Constructor del discretizador.
+        Parameters:
+            metodo: (str) Método de discretización ('ancho_igual', 'frecuencia_igual', 'k_means', 'basado_en_cuantiles',
+                    'entropia_mdl').
+            bins: (int) Número de intervalos (bins).
+            max_iteraciones: (int) Número máximo de iteraciones de Lloyd (solo 'k_means').
+            tolerancia: (float) Desplazamiento relativo de los centroides para detenerse (solo 'k_means').
+            exacto: (bool) Si es True, usa la partición óptima de k-means (solo 'k_means').
+        Exceptions:
+            ValueError si el método no es válido.
+        '''
+        if metodo not in self.METODOS:
+            raise ValueError("Método de discretización no válido. Use 'ancho_igual', 'frecuencia_igual', 'k_means', 'basado_en_cuantiles' o 'entropia_mdl'.")
+        self.metodo = metodo
+        self.bins = bins
+        self.max_iteraciones = max_iteraciones
+        self.tolerancia = tolerancia
+        self.exacto = exacto
+        self.puntos_corte = None
+        self.min_valor = None
+        self.rango = None
+
+    def ajustar(self, columna: list[float | int], min_valor: float = None, max_valor: float = None,
+                clase: list = None) -> 'DiscretizadorColumna':
+        '''
+        Método para calcular los puntos de corte a partir de una columna.
+        Parameters:
+            columna: (list[float | int]) Valores numéricos sobre los que ajustar.
+            min_valor: (float | None) Mínimo ya conocido de la columna (solo 'ancho_igual').
+            max_valor: (float | None) Máximo ya conocido de la columna (solo 'ancho_igual').
+            clase: (list | None) Clase de cada valor (necesaria para 'entropia_mdl').
+        Return:
+            DiscretizadorColumna: El propio discretizador, ya ajustado.
+        Exceptions:
+            ValueError si se usa 'entropia_mdl' sin clase.
+        '''
+        if self.metodo == 'ancho_igual':
+            if min_valor is None or max_valor is None:
+                min_valor, max_valor = min(columna), max(columna)
+            self.puntos_corte, self.rango = Discretizador._cortes_ancho_igual(min_valor, max_valor, self.bins)
+            self.min_valor = min_valor
+        elif self.metodo == 'frecuencia_igual':
+            self.puntos_corte = Discretizador._cortes_frecuencia_igual(sorted(columna), self.bins)
+        elif self.metodo == 'k_means':
+            self.puntos_corte = Discretizador._cortes_k_means(sorted(columna), self.bins, self.max_iteraciones,
+                                                              self.tolerancia, self.exacto)
+        elif self.metodo == 'entropia_mdl':
+            if clase is None:
+                raise ValueError("El método 'entropia_mdl' necesita una columna de clase.")
+            self.puntos_corte = Discretizador._cortes_entropia_mdl(columna, clase)
+        else:
+            self.puntos_corte = Discretizador._cortes_cuantiles(sorted(columna), self.bins)
+        return self
+
+    def ajustar_resumen(self, resumen: ResumenCuantiles) -> 'DiscretizadorColumna':
+        '''
+        Método para calcular puntos de corte aproximados a partir de un resumen de cuantiles, sin tener la columna
+        completa en memoria. El resumen hace el papel de la columna ordenada.
+        Parameters:
+            resumen: (ResumenCuantiles) Resumen de la columna, construido por bloques o combinando resúmenes parciales.
+        Return:
+            DiscretizadorColumna: El propio discretizador, ya ajustado.
+        Exceptions:
+            ValueError si el resumen está vacío o el método es 'k_means' o 'entropia_mdl', que necesitan todos los valores.
+        '''
+        if resumen.n == 0:
+            raise ValueError("El resumen está vacío.")
+        if self.metodo in ('k_means', 'entropia_mdl'):
+            raise ValueError(f"El método '{self.metodo}' no admite ajuste a partir de un resumen de cuantiles.")
+        if self.metodo == 'ancho_igual':
+            self.puntos_corte, self.rango = Discretizador._cortes_ancho_igual(resumen.min, resumen.max, self.bins)
+            self.min_valor = resumen.min
+        elif self.metodo == 'frecuencia_igual':
+            self.puntos_corte = Discretizador._cortes_frecuencia_igual(resumen, self.bins)
+        else:
+            self.puntos_corte = Discretizador._cortes_cuantiles(resumen, self.bins)
+        return self
+
+    def transformar(self, columna: list[float | int]) -> list[int]:
+        '''
+        Método para asignar a cada valor el bin que le corresponde según los puntos de corte ajustados.
+        Parameters:
+            columna: (list[float | int]) Valores numéricos a discretizar.
+        Return:
+            list[int]: Lista de valores discretizados.
+        Exceptions:
+            ValueError si el discretizador no ha sido ajustado.
+        '''
+        if self.puntos_corte is None:
+            raise ValueError("El discretizador no ha sido ajustado.")
+        if self.metodo == 'ancho_igual':
+            min_valor, rango, ultimo = self.min_valor, self.rango, self.bins - 1
+            return [max(0, min(ultimo, int((valor - min_valor) / rango * self.bins))) for valor in columna]
+        puntos_corte = self.puntos_corte
+        # En frecuencia igual el corte es el último valor del bin; en el resto, un valor igual al corte pasa al siguiente
+        busqueda = bisect_left if self.metodo == 'frecuencia_igual' else bisect_right
+        return [busqueda(puntos_corte, valor) for valor in columna]
+
+    def ajustar_transformar(self, columna: list[float | int], clase: list = None) -> list[int]:
+        '''
+        Método para ajustar el discretizador y discretizar la misma columna.
+        Parameters:
+            columna: (list[float | int]) Valores numéricos a discretizar.
+            clase: (list | None) Clase de cada valor (necesaria para 'entropia_mdl').
+        Return:
+            list[int]: Lista de valores discretizados.
+        '''
+        return self.ajustar(columna, clase=clase).transformar(columna)
+
+    def obtener_rangos_bins(self, decimales: int = 8) -> list[tuple[float, float]]:
+        '''
+        Método para obtener los rangos de cada bin a partir de los puntos de corte ajustados.
+        Parameters:
+            decimales: (int) Número de decimales para redondear los puntos de corte.
+        Return:
+            list[tuple[float, float]]: Lista de tuplas que representan los rangos de cada bin.
+        Exceptions:
+            ValueError si el discretizador no ha sido ajustado.
+        '''
+        if self.puntos_corte is None:
+            raise ValueError("El discretizador no ha sido ajustado.")
+        cortes = [round(corte, decimales) for corte in self.puntos_corte]
+        return list(zip([float('-inf')] + cortes, cortes + [float('inf')]))
+
+    def a_dict(self) -> dict:
+        '''
+        Método para serializar el discretizador en un diccionario de tipos básicos (apto para JSON o pickle).
+        Return:
+            dict: Estado completo del discretizador.
+        '''
+        return {
+            'metodo': self.metodo, 'bins': self.bins, 'max_iteraciones': self.max_iteraciones,
+            'tolerancia': self.tolerancia, 'exacto': self.exacto,
+            'puntos_corte': None if self.puntos_corte is None else list(self.puntos_corte),
+            'min_valor': self.min_valor, 'rango': self.rango,
+        }
+
+    @classmethod
+    def desde_dict(cls, estado: dict) -> 'DiscretizadorColumna':
+        '''
+        Método para reconstruir un discretizador a partir de lo devuelto por a_dict.
+        Parameters:
+            estado: (dict) Estado serializado del discretizador.
+        Return:
+            DiscretizadorColumna: Discretizador listo para transformar.
+        '''
+        discretizador = cls(estado['metodo'], estado['bins'], estado.get('max_iteraciones', 300),
+                            estado.get('tolerancia', 1e-9), estado.get('exacto', False))
+        discretizador.puntos_corte = estado['puntos_corte']
+        discretizador.min_valor = estado['min_valor']
+        discretizador.rango = estado['rango']
+        return discretizador
+
+    def __repr__(self) -> str:
+        return f"DiscretizadorColumna(metodo={self.metodo!r}, bins={self.bins}, puntos_corte={self.puntos_corte})"
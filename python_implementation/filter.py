@@ -36,7 +36,7 @@ class Filtro:
         '''
         columnas_a_filtrar = self._validar_columnas(columnas)
         for nombre_columna in columnas_a_filtrar:
-            columna = self.df_original.obtener_columna(nombre_columna)
+            columna = self.df_original.obtener_buffer(nombre_columna)
             valor_entropia = Metricas.entropia(columna)
             if valor_entropia > umbral:
                 self.datos_filtrados[nombre_columna] = columna
@@ -50,35 +50,36 @@ class Filtro:
         '''
         columnas_a_filtrar = self._validar_columnas(columnas)
         for nombre_columna in columnas_a_filtrar:
-            columna = self.df_original.obtener_columna(nombre_columna)
-            if all(isinstance(x, (int, float)) for x in columna):
-                valor_varianza = Metricas.varianza(columna)
+            estadisticas = self.df_original.estadisticas_columna(nombre_columna)
+            if estadisticas['numerica']:
+                columna = self.df_original.obtener_buffer(nombre_columna)
+                valor_varianza = Metricas.varianza_estadisticas(estadisticas)
                 print(valor_varianza)
                 if valor_varianza > umbral:
                     self.datos_filtrados[nombre_columna] = columna
 
-    def filtrar_por_auc(self, umbral: float, nombre_columna_clase: str, columnas: list[str] = None) -> None:
+    def filtrar_por_auc(self, umbral: float, nombre_columna_clase: str, columnas: list[str] = None,
+                        n_procesos: int = 1) -> None:
         '''
         Método para filtrar columnas en función del AUC (Area Under the Curve) en relación a una columna de clase binaria.
+        El AUC de todas las columnas numéricas se calcula en un solo lote (Metricas.auc_lote).
         Parameters:
             umbral: (float) Umbral de AUC por encima del cual se filtran las columnas.
             nombre_columna_clase: (str) Nombre de la columna de clase binaria.
             columnas: (list[str] | None) Lista de nombres de columnas a filtrar, o None para todas las columnas.
+            n_procesos: (int | None) Número de procesos entre los que repartir las columnas, o None para usar todos los núcleos.
         Exceptions:
             ValueError si la columna de clase especificada no existe en el DataFrame.
         '''
         if nombre_columna_clase not in self.df_original.datos:
             raise ValueError(f"La columna de clase especificada '{nombre_columna_clase}' no existe.")
-        
-        columnas_a_filtrar = self._validar_columnas(columnas)
-        for nombre_columna in columnas_a_filtrar:
-            if nombre_columna == nombre_columna_clase:
-                continue
-            columna = self.df_original.obtener_columna(nombre_columna)
-            if all(isinstance(x, (int, float)) for x in columna):
-                valor_auc = Metricas.auc(columna, self.df_original.obtener_columna(nombre_columna_clase))
-                if valor_auc > umbral:
-                    self.datos_filtrados[nombre_columna] = columna
+
+        columnas_numericas = [nombre_columna for nombre_columna in self._validar_columnas(columnas)
+                              if nombre_columna != nombre_columna_clase and self.df_original.es_numerica(nombre_columna)]
+        valores_auc = Metricas.auc_lote(self.df_original, nombre_columna_clase, columnas_numericas, n_procesos)
+        for nombre_columna, valor_auc in valores_auc.items():
+            if valor_auc > umbral:
+                self.datos_filtrados[nombre_columna] = self.df_original.obtener_buffer(nombre_columna)
 
     def obtener_data_frame_filtrado(self) -> DataFrame:
         '''
@@ -86,4 +87,5 @@ class Filtro:
         Return:
             DataFramePersonalizado: DataFrame que contiene solo las columnas que cumplen con los filtros aplicados.
         '''
-        return DataFrame(self.datos_filtrados)
+        esquema = {nombre_columna: self.df_original.tipo_columna(nombre_columna) for nombre_columna in self.datos_filtrados}
+        return DataFrame(self.datos_filtrados, esquema)
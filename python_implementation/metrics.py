@@ -1,4 +1,11 @@
 import math
+import operator
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, compress, islice, repeat
+from typing import Iterator
+from dataframe import ColumnaCategorica, DataFrame
 
 class Metricas:
     @staticmethod
@@ -13,60 +20,352 @@ class Metricas:
         media = sum(columna) / len(columna)
         return sum((x - media) ** 2 for x in columna) / len(columna)
 
+    @staticmethod
+    def varianza_estadisticas(estadisticas: dict) -> float:
+        '''
+        Método para calcular la varianza a partir de las estadísticas en caché de una columna, sin recorrerla.
+        Parametros:
+            estadisticas: (dict) Estadísticas de la columna (DataFrame.estadisticas_columna) con 'varianza', o con
+                          'conteo', 'suma' y 'suma_cuadrados'.
+        Return:
+            float: Varianza de los valores en la columna.
+        '''
+        if estadisticas.get('varianza') is not None:
+            return estadisticas['varianza']
+        n, suma, suma_cuadrados = estadisticas['conteo'], estadisticas['suma'], estadisticas['suma_cuadrados']
+        if isinstance(suma, int) and isinstance(suma_cuadrados, int):
+            # Sumas enteras exactas: la varianza sólo se redondea en la división final
+            return (n * suma_cuadrados - suma * suma) / (n * n)
+        return max(suma_cuadrados / n - (suma / n) ** 2, 0.0)
+
     @staticmethod
     def entropia(columna: list) -> float:
         '''
         Método para calcular la entropía de una columna categórica.
+        En columnas categóricas codificadas se cuentan directamente los códigos enteros.
         Parametros:
-            columna: (list) Lista de valores categóricos.
+            columna: (list | ColumnaCategorica) Lista de valores categóricos.
         Return:
             float: Entropía de los valores en la columna.
         '''
-        conteo_valores = {}
-        for valor in columna:
-            conteo_valores[valor] = conteo_valores.get(valor, 0) + 1
+        if isinstance(columna, ColumnaCategorica):
+            conteo_valores = Counter(columna.codigos)
+        else:
+            conteo_valores = Counter(columna)
         total = len(columna)
         return -sum((conteo / total) * math.log2(conteo / total) for conteo in conteo_valores.values())
 
     @staticmethod
-    def auc(columna: list[float | int], columna_clase: list[int]) -> float:
+    def auc(columna: list[float | int], columna_clase: list[int], pesos: list[float] = None) -> float:
         '''
         Método para calcular el AUC (Area Under the Curve) de una columna en función de una columna de clase binaria.
+        Se ordenan los índices de las filas una sola vez (argsort) y se suman los rangos de las filas positivas; sólo los
+        grupos de valores empatados se recorren uno a uno para promediar sus rangos.
         Parametros:
             columna: (list[float | int]) Lista de valores numéricos para ordenar.
-            columna_clase: (list[int]) Lista binaria de clases asociadas a cada valor en columna.
+            columna_clase: (list[int]) Lista binaria (0/1) de clases asociadas a cada valor en columna.
+            pesos: (list[float] | None) Peso de cada fila, o None para dar el mismo peso a todas.
         Return:
             float: Valor de AUC calculado para la columna y columna_clase.
+        Exceptions:
+            ValueError si la columna de clase tiene valores distintos de 0 y 1.
         '''
-        pares_ordenados = sorted(zip(columna, columna_clase), key=lambda x: x[0])
-        conteo_positivos = sum(columna_clase)
-        conteo_negativos = len(columna_clase) - conteo_positivos
+        if not set(columna_clase) <= {0, 1}:
+            raise ValueError("La columna de clase debe ser binaria (0/1); use auc_multiclase para otras etiquetas.")
+        n = len(columna)
+        orden = sorted(range(n), key=columna.__getitem__)
+        valores_ordenados = list(map(columna.__getitem__, orden))
+        clases_ordenadas = list(map(columna_clase.__getitem__, orden))
+        if pesos is not None:
+            pesos_ordenados = list(map(pesos.__getitem__, orden))
+            return Metricas._auc_ponderado(valores_ordenados, pesos_ordenados, clases_ordenadas,
+                                           list(map(operator.not_, clases_ordenadas)))
+        conteo_positivos = sum(clases_ordenadas)
+        conteo_negativos = n - conteo_positivos
 
-        suma_rangos = 0
-        rango = 1
-        indices_actuales_empatados = [0]
-
-        for idx in range(1, len(pares_ordenados)):
-            if pares_ordenados[idx][0] == pares_ordenados[idx - 1][0]:
-                indices_actuales_empatados.append(idx)
-            else:
-                len_empate = len(indices_actuales_empatados)
-                rango_promedio = (2 * rango + len_empate - 1) / 2
-                suma_rangos += sum(
-                    rango_promedio for k in indices_actuales_empatados if pares_ordenados[k][1] == 1
-                )
-                rango += len_empate
-                indices_actuales_empatados = [idx]
-
-        if indices_actuales_empatados:
-            len_empate = len(indices_actuales_empatados)
-            rango_promedio = (2 * rango + len_empate - 1) / 2
-            suma_rangos += sum(
-                rango_promedio for k in indices_actuales_empatados if pares_ordenados[k][1] == 1
-            )
+        # Rangos por posición (desde 1); después se corrigen sólo los grupos de valores empatados
+        suma_rangos = sum(compress(range(1, n + 1), clases_ordenadas))
+        for inicio, fin in Metricas._grupos_empatados(valores_ordenados):
+            positivos = clases_ordenadas[inicio:fin]
+            conteo = sum(positivos)
+            if conteo:
+                # Las posiciones [inicio, fin) comparten el rango promedio (inicio + 1 + fin) / 2
+                suma_rangos += conteo * (inicio + 1 + fin) / 2 - sum(compress(range(inicio + 1, fin + 1), positivos))
 
         return (suma_rangos - conteo_positivos * (conteo_positivos + 1) / 2) / (conteo_positivos * conteo_negativos)
 
+    @staticmethod
+    def auc_multiclase(columna: list[float | int], columna_clase: list, estrategia: str = 'ovr',
+                       promedio: str = 'macro', pesos: list[float] = None) -> float:
+        '''
+        Método para calcular el AUC de una columna frente a una clase con cualquier número de etiquetas.
+        La columna se ordena una sola vez; con 'ovr' los rangos ponderados de todas las filas se calculan una vez y
+        se suman por clase, y con 'ovo' cada par de clases reutiliza el mismo orden filtrando sus filas.
+        Parametros:
+            columna: (list[float | int]) Lista de valores numéricos para ordenar.
+            columna_clase: (list) Etiqueta de clase de cada fila.
+            estrategia: (str) 'ovr' (cada clase frente al resto) u 'ovo' (cada par de clases; en el par (a, b), con
+                        a < b, la clase b hace de positiva).
+            promedio: (str) 'macro' (media simple) o 'ponderado' (media ponderada por el peso de las clases implicadas).
+            pesos: (list[float] | None) Peso de cada fila, o None para dar el mismo peso a todas.
+        Return:
+            float: AUC promedio.
+        Exceptions:
+            ValueError si la estrategia o el promedio no son válidos, o la clase tiene menos de dos etiquetas.
+        '''
+        if estrategia not in ('ovr', 'ovo'):
+            raise ValueError("Estrategia no válida. Use 'ovr' u 'ovo'.")
+        if promedio not in ('macro', 'ponderado'):
+            raise ValueError("Promedio no válido. Use 'macro' o 'ponderado'.")
+        n = len(columna)
+        orden = sorted(range(n), key=columna.__getitem__)
+        valores_ordenados = list(map(columna.__getitem__, orden))
+        clases_ordenadas = list(map(columna_clase.__getitem__, orden))
+        pesos_ordenados = [1] * n if pesos is None else list(map(pesos.__getitem__, orden))
+        etiquetas = sorted(set(clases_ordenadas))
+        if len(etiquetas) < 2:
+            raise ValueError("La columna de clase debe tener al menos dos etiquetas.")
+        mascaras = {etiqueta: list(map(operator.eq, clases_ordenadas, repeat(etiqueta))) for etiqueta in etiquetas}
+
+        valores_auc, ponderaciones = [], []
+        if estrategia == 'ovr':
+            rangos_ponderados = list(map(operator.mul, pesos_ordenados,
+                                         Metricas._rangos_medios(valores_ordenados, pesos_ordenados)))
+            peso_total = math.fsum(pesos_ordenados)
+            for etiqueta in etiquetas:
+                peso_clase = math.fsum(compress(pesos_ordenados, mascaras[etiqueta]))
+                suma_rangos = math.fsum(compress(rangos_ponderados, mascaras[etiqueta]))
+                valores_auc.append((suma_rangos - peso_clase * peso_clase / 2) / (peso_clase * (peso_total - peso_clase)))
+                ponderaciones.append(peso_clase)
+        else:
+            for i, negativa in enumerate(etiquetas):
+                for positiva in etiquetas[i + 1:]:
+                    par = list(map(operator.or_, mascaras[negativa], mascaras[positiva]))
+                    valores_auc.append(Metricas._auc_ponderado(
+                        list(compress(valores_ordenados, par)), list(compress(pesos_ordenados, par)),
+                        list(compress(mascaras[positiva], par)), list(compress(mascaras[negativa], par))))
+                    ponderaciones.append(math.fsum(compress(pesos_ordenados, par)))
+
+        if promedio == 'macro':
+            return math.fsum(valores_auc) / len(valores_auc)
+        return math.fsum(map(operator.mul, valores_auc, ponderaciones)) / math.fsum(ponderaciones)
+
+    @staticmethod
+    def _grupos_empatados(valores_ordenados: list[float | int]) -> Iterator[tuple[int, int]]:
+        '''
+        Método que localiza los grupos de valores repetidos de una lista ordenada sin recorrerla en Python.
+        Parametros:
+            valores_ordenados: (list[float | int]) Valores ordenados.
+        Return:
+            Iterator[tuple[int, int]]: Posiciones [inicio, fin) de cada grupo con más de un valor.
+        '''
+        n = len(valores_ordenados)
+        inicios = [0, *compress(range(1, n), map(operator.ne, valores_ordenados, islice(valores_ordenados, 1, None)))]
+        fines = inicios[1:] + [n]
+        return compress(zip(inicios, fines), map(operator.gt, map(operator.sub, fines, inicios), repeat(1)))
+
+    @staticmethod
+    def _rangos_medios(valores_ordenados: list[float | int], pesos_ordenados: list[float]) -> list[float]:
+        '''
+        Método para calcular el rango medio ponderado de cada fila ordenada: el peso de las filas anteriores más la
+        mitad del peso de su grupo de valores empatados.
+        Parametros:
+            valores_ordenados: (list[float | int]) Valores ordenados.
+            pesos_ordenados: (list[float]) Peso de cada fila, en el mismo orden.
+        Return:
+            list[float]: Rango medio ponderado de cada fila.
+        '''
+        acumulados = list(accumulate(pesos_ordenados, initial=0))
+        rangos = list(map(operator.add, acumulados, map(operator.truediv, pesos_ordenados, repeat(2))))
+        for inicio, fin in Metricas._grupos_empatados(valores_ordenados):
+            rangos[inicio:fin] = repeat((acumulados[inicio] + acumulados[fin]) / 2, fin - inicio)
+        return rangos
+
+    @staticmethod
+    def _auc_ponderado(valores_ordenados: list[float | int], pesos_ordenados: list[float], positivos: list[bool],
+                       negativos: list[bool]) -> float:
+        '''
+        Método para calcular el AUC ponderado a partir de filas ya ordenadas, usando que la suma de los rangos medios
+        ponderados de los positivos, menos su peso total al cuadrado entre dos, es el peso de los pares bien ordenados.
+        Parametros:
+            valores_ordenados: (list[float | int]) Valores ordenados (sólo filas positivas o negativas).
+            pesos_ordenados: (list[float]) Peso de cada fila.
+            positivos: (list[bool]) Si cada fila es positiva.
+            negativos: (list[bool]) Si cada fila es negativa.
+        Return:
+            float: Valor de AUC.
+        '''
+        rangos = Metricas._rangos_medios(valores_ordenados, pesos_ordenados)
+        peso_positivos = math.fsum(compress(pesos_ordenados, positivos))
+        peso_negativos = math.fsum(compress(pesos_ordenados, negativos))
+        suma_rangos = math.fsum(compress(map(operator.mul, pesos_ordenados, rangos), positivos))
+        return (suma_rangos - peso_positivos * peso_positivos / 2) / (peso_positivos * peso_negativos)
+
+    @staticmethod
+    def auc_lote(df, nombre_columna_clase: str, columnas: list[str] = None, n_procesos: int = None) -> dict[str, float]:
+        '''
+        Método para calcular el AUC de varias columnas numéricas frente a la misma columna de clase binaria.
+        La columna de clase se obtiene una sola vez y las columnas se reparten en lotes entre varios procesos; cada
+        lote recibe una única copia de la clase.
+        Parametros:
+            df: (DataFramePersonalizado) DataFrame con los datos.
+            nombre_columna_clase: (str) Nombre de la columna de clase binaria.
+            columnas: (list[str] | None) Columnas a evaluar, o None para todas las numéricas salvo la clase.
+            n_procesos: (int | None) Número de procesos, o None para usar todos los núcleos.
+        Return:
+            dict[str, float]: AUC de cada columna, en el orden de `columnas`.
+        Exceptions:
+            ValueError si `n_procesos` no es un entero positivo.
+        '''
+        n_procesos = DataFrame.normalizar_n_procesos(n_procesos)
+        if columnas is None:
+            columnas = [nombre for nombre in df.datos if df.es_numerica(nombre) and nombre != nombre_columna_clase]
+        columna_clase = df.obtener_buffer(nombre_columna_clase)
+        buffers = [df.obtener_buffer(nombre) for nombre in columnas]
+
+        n_lotes = min(n_procesos, len(buffers))
+        if n_lotes <= 1:
+            return dict(zip(columnas, Metricas._auc_columnas(buffers, columna_clase)))
+        columna_clase = DataFrame.buffer_para_proceso(columna_clase)
+        buffers = list(map(DataFrame.buffer_para_proceso, buffers))
+        lotes = [buffers[i::n_lotes] for i in range(n_lotes)]
+        with ProcessPoolExecutor(n_lotes) as ejecutor:
+            resultados = list(ejecutor.map(Metricas._auc_columnas, lotes, repeat(columna_clase, n_lotes)))
+        valores = [resultados[i % n_lotes][i // n_lotes] for i in range(len(buffers))]
+        return dict(zip(columnas, valores))
+
+    @staticmethod
+    def _auc_columnas(columnas: list[list[float | int]], columna_clase: list[int]) -> list[float]:
+        '''
+        Método que calcula el AUC de un lote de columnas frente a la misma clase (ejecutado en un proceso del pool).
+        Parametros:
+            columnas: (list[list[float | int]]) Columnas numéricas del lote.
+            columna_clase: (list[int]) Clase binaria de cada fila.
+        Return:
+            list[float]: AUC de cada columna del lote.
+        '''
+        return [Metricas.auc(columna, columna_clase) for columna in columnas]
+
+    @staticmethod
+    def intervalo_bootstrap(columna: list, metrica: str = 'auc', columna_clase: list[int] = None,
+                            n_remuestras: int = 1000, confianza: float = 0.95, semilla: int = 0,
+                            n_procesos: int = 1) -> dict:
+        '''
+        Método para obtener un intervalo de confianza bootstrap (percentiles) de una métrica.
+        La columna se prepara (ordena o agrupa) una sola vez; cada remuestra se representa por el número de veces que
+        aparece cada fila y la métrica se evalúa como métrica ponderada sobre los datos ya preparados, sin volver a
+        ordenar. Las semillas de todas las remuestras se generan de una vez a partir de `semilla`, de modo que el
+        resultado es reproducible y no depende del número de procesos.
+        Parametros:
+            columna: (list) Valores de la columna (numéricos para 'auc' y 'varianza').
+            metrica: (str) Métrica a evaluar ('auc', 'varianza' o 'entropia').
+            columna_clase: (list[int] | None) Clase binaria (0/1) de cada fila, necesaria para 'auc'.
+            n_remuestras: (int) Número de remuestras.
+            confianza: (float) Nivel de confianza del intervalo, entre 0 y 1.
+            semilla: (int) Semilla del generador aleatorio.
+            n_procesos: (int | None) Número de procesos entre los que repartir las remuestras, o None para usar todos
+                        los núcleos.
+        Return:
+            dict: Diccionario con la métrica sobre los datos originales ('estimacion') y los extremos del intervalo
+                  ('inferior' y 'superior').
+        Exceptions:
+            ValueError si la métrica no es válida, falta la clase para 'auc', `n_remuestras` o `n_procesos` no son
+            enteros positivos o `confianza` no está entre 0 y 1.
+        '''
+        if metrica not in ('auc', 'varianza', 'entropia'):
+            raise ValueError("Métrica no válida. Use 'auc', 'varianza' o 'entropia'.")
+        if not isinstance(n_remuestras, int) or n_remuestras < 1:
+            raise ValueError("`n_remuestras` debe ser un entero positivo.")
+        if not 0 < confianza < 1:
+            raise ValueError("`confianza` debe estar entre 0 y 1.")
+        n_procesos = DataFrame.normalizar_n_procesos(n_procesos)
+
+        n = len(columna)
+        if metrica == 'auc':
+            if columna_clase is None or not set(columna_clase) <= {0, 1}:
+                raise ValueError("El AUC necesita una columna de clase binaria (0/1).")
+            orden = sorted(range(n), key=columna.__getitem__)
+            clases_ordenadas = list(map(columna_clase.__getitem__, orden))
+            datos = (list(map(columna.__getitem__, orden)), clases_ordenadas, list(map(operator.not_, clases_ordenadas)))
+        elif metrica == 'varianza':
+            datos = list(columna)
+        else:
+            # Como las remuestras son uniformes, basta con imaginar las filas agrupadas por categoría: el conteo de
+            # cada categoría en una remuestra es la suma de los pesos de su tramo de filas
+            valores = columna.codigos if isinstance(columna, ColumnaCategorica) else columna
+            fines = list(accumulate(Counter(valores).values()))
+            datos = list(zip([0] + fines[:-1], fines))
+
+        estimacion = Metricas._metrica_ponderada(metrica, datos, [1] * n)
+        aleatorio = random.Random(semilla)
+        semillas = [aleatorio.getrandbits(64) for _ in range(n_remuestras)]
+        n_lotes = min(n_procesos, n_remuestras)
+        if n_lotes == 1:
+            resultados = Metricas._evaluar_remuestras(metrica, datos, n, semillas)
+        else:
+            with ProcessPoolExecutor(n_lotes) as ejecutor:
+                lotes = ejecutor.map(Metricas._evaluar_remuestras, repeat(metrica), repeat(datos), repeat(n),
+                                     [semillas[i::n_lotes] for i in range(n_lotes)])
+                resultados = [valor for lote in lotes for valor in lote]
+        # Las remuestras sin filas de alguna clase no tienen AUC definido y se descartan
+        resultados = sorted(valor for valor in resultados if not math.isnan(valor))
+        if not resultados:
+            raise ValueError("Ninguna remuestra permite calcular la métrica.")
+
+        def percentil(q: float) -> float:
+            posicion = q * (len(resultados) - 1)
+            inferior = int(posicion)
+            superior = min(inferior + 1, len(resultados) - 1)
+            return resultados[inferior] + (resultados[superior] - resultados[inferior]) * (posicion - inferior)
+
+        alfa = (1 - confianza) / 2
+        return {'estimacion': estimacion, 'inferior': percentil(alfa), 'superior': percentil(1 - alfa)}
+
+    @staticmethod
+    def _evaluar_remuestras(metrica: str, datos: tuple | list, n: int, semillas: list[int]) -> list[float]:
+        '''
+        Método que evalúa una métrica sobre varias remuestras (ejecutado en un proceso del pool).
+        Cada remuestra sortea n filas con reemplazo a partir de su semilla y cuenta cuántas veces sale cada una.
+        Parametros:
+            metrica: (str) Métrica a evaluar.
+            datos: (tuple | list) Datos preparados por intervalo_bootstrap.
+            n: (int) Número de filas.
+            semillas: (list[int]) Semilla de cada remuestra.
+        Return:
+            list[float]: Valor de la métrica en cada remuestra (NaN si no está definido).
+        '''
+        filas = range(n)
+        resultados = []
+        for semilla in semillas:
+            conteo = Counter(random.Random(semilla).choices(filas, k=n))
+            pesos = list(map(conteo.get, filas, repeat(0)))
+            resultados.append(Metricas._metrica_ponderada(metrica, datos, pesos))
+        return resultados
+
+    @staticmethod
+    def _metrica_ponderada(metrica: str, datos: tuple | list, pesos: list[int]) -> float:
+        '''
+        Método que evalúa una métrica con un peso por fila sobre los datos preparados por intervalo_bootstrap.
+        Parametros:
+            metrica: (str) Métrica a evaluar ('auc', 'varianza' o 'entropia').
+            datos: (tuple | list) Datos preparados: filas ordenadas y máscaras de clase ('auc'), valores ('varianza')
+                   o tramos de filas de cada categoría ('entropia').
+            pesos: (list[int]) Peso de cada fila, en el orden de los datos preparados.
+        Return:
+            float: Valor de la métrica (NaN si no está definido).
+        '''
+        total = sum(pesos)
+        if metrica == 'auc':
+            valores_ordenados, positivos, negativos = datos
+            if not any(compress(pesos, positivos)) or not any(compress(pesos, negativos)):
+                return math.nan
+            return Metricas._auc_ponderado(valores_ordenados, pesos, positivos, negativos)
+        if metrica == 'varianza':
+            media = math.fsum(map(operator.mul, pesos, datos)) / total
+            desviaciones = list(map(operator.sub, datos, repeat(media)))
+            return math.fsum(map(operator.mul, pesos, map(operator.mul, desviaciones, desviaciones))) / total
+        conteos = [sum(pesos[inicio:fin]) for inicio, fin in datos]
+        return -sum((conteo / total) * math.log2(conteo / total) for conteo in conteos if conteo)
 
     @staticmethod
     def calcular_metrica(df, nombre_columna: str, nombre_columna_clase: str = None) -> dict:
@@ -79,28 +378,306 @@ class Metricas:
         Return:
             dict: Diccionario con la métrica calculada.
         '''
-        columna = df.obtener_columna(nombre_columna)
-        valores_unicos = set(columna)
-        num_unicos = len(valores_unicos)
-        total_valores = len(columna)
-        ratio_unicos = num_unicos / total_valores
+        columna = df.obtener_buffer(nombre_columna)
+        estadisticas = df.estadisticas_columna(nombre_columna)
+        if Metricas._tratar_como_categorica(estadisticas):
+            return {"Entropía": Metricas.entropia(columna)}
+        if nombre_columna_clase:
+            columna_clase = df.obtener_buffer(nombre_columna_clase)
+            return {
+                "Varianza": Metricas.varianza_estadisticas(estadisticas),
+                "AUC": Metricas.auc(columna, columna_clase)
+            }
+        return {"Varianza": Metricas.varianza_estadisticas(estadisticas)}
 
-        es_numerica = all(isinstance(x, (int, float)) for x in columna)
+    @staticmethod
+    def _tratar_como_categorica(estadisticas: dict) -> bool:
+        '''
+        Método que decide si una columna se evalúa como categórica (entropía) o como numérica (varianza y AUC).
+        Las columnas no numéricas son categóricas; las numéricas también, si tienen pocos valores distintos.
+        Parametros:
+            estadisticas: (dict) Estadísticas de la columna (DataFrame.estadisticas_columna).
+        Return:
+            bool: True si la columna se trata como categórica.
+        '''
+        if not estadisticas['numerica']:
+            return True
+        num_unicos = estadisticas['distintos']
+        ratio_unicos = num_unicos / estadisticas['conteo']
+        return num_unicos <= 10 and ratio_unicos < 0.5
+
+    @staticmethod
+    def calcular_metricas_data_frame(df, columna_clase: str = None, n_procesos: int = None) -> "DataFrame":
+        '''
+        Método para calcular las métricas de todas las columnas de un data.frame con las mismas reglas que
+        calcular_metrica. La columna de clase se obtiene y valida una sola vez, y cada fase se reparte por columnas
+        entre varios procesos: el perfil de las columnas (ver DataFrame.estadisticas_columnas), la entropía de las
+        categóricas y el AUC de las numéricas (ver auc_lote).
+        Parametros:
+            df: (DataFramePersonalizado) DataFrame con los datos.
+            columna_clase: (str | None) Nombre de la columna de clase binaria, o None para no calcular el AUC.
+            n_procesos: (int | None) Número de procesos, o None para usar todos los núcleos.
+        Return:
+            DataFramePersonalizado: Tabla con una fila por columna (salvo la clase) y las columnas 'columna',
+                                    'Entropía', 'Varianza' y 'AUC' (None cuando la métrica no se aplica).
+        Exceptions:
+            ValueError si la columna de clase no existe o no es binaria, o `n_procesos` no es un entero positivo.
+        '''
+        n_procesos = DataFrame.normalizar_n_procesos(n_procesos)
+        if columna_clase is not None:
+            if columna_clase not in df.datos:
+                raise ValueError(f"La columna de clase especificada '{columna_clase}' no existe.")
+            if not set(df.obtener_buffer(columna_clase)) <= {0, 1}:
+                raise ValueError("La columna de clase debe ser binaria (0/1).")
+        nombres = [nombre for nombre in df.datos if nombre != columna_clase]
+        estadisticas = df.estadisticas_columnas(nombres, n_procesos)
+        categoricas = [nombre for nombre in nombres if Metricas._tratar_como_categorica(estadisticas[nombre])]
+        numericas = [nombre for nombre in nombres if nombre not in categoricas]
+        valores_entropia = Metricas._entropias(df, categoricas, n_procesos)
+        valores_auc = Metricas.auc_lote(df, columna_clase, numericas, n_procesos) if columna_clase is not None else {}
 
-        if es_numerica:
-            # Decidir si tratar como categórica o numérica basado en valores únicos
-            if num_unicos <= 10 and ratio_unicos < 0.5:
-                # Tratar como categórica
-                return {"Entropía": Metricas.entropia(columna)}
+        tabla = {'columna': nombres, 'Entropía': [], 'Varianza': [], 'AUC': []}
+        for nombre in nombres:
+            if nombre in valores_entropia:
+                tabla['Entropía'].append(valores_entropia[nombre])
+                tabla['Varianza'].append(None)
             else:
-                if nombre_columna_clase:
-                    columna_clase = df.obtener_columna(nombre_columna_clase)
-                    return {
-                        "Varianza": Metricas.varianza(columna),
-                        "AUC": Metricas.auc(columna, columna_clase)
-                    }
-                return {"Varianza": Metricas.varianza(columna)}
+                tabla['Entropía'].append(None)
+                tabla['Varianza'].append(Metricas.varianza_estadisticas(estadisticas[nombre]))
+            tabla['AUC'].append(valores_auc.get(nombre))
+        return df.__class__(tabla)
+
+    @staticmethod
+    def _entropias(df, columnas: list[str], n_procesos: int) -> dict[str, float]:
+        '''
+        Método que calcula la entropía de varias columnas categóricas, repartidas en lotes entre varios procesos; las
+        columnas codificadas se envían como códigos enteros (ver DataFrame.buffer_para_proceso).
+        Parametros:
+            df: (DataFramePersonalizado) DataFrame con los datos.
+            columnas: (list[str]) Columnas a evaluar.
+            n_procesos: (int) Número de procesos.
+        Return:
+            dict[str, float]: Entropía de cada columna, en el orden de `columnas`.
+        '''
+        buffers = [df.obtener_buffer(nombre) for nombre in columnas]
+        n_lotes = min(n_procesos, len(buffers))
+        if n_lotes <= 1:
+            return dict(zip(columnas, map(Metricas.entropia, buffers)))
+        with ProcessPoolExecutor(n_lotes) as ejecutor:
+            valores = list(ejecutor.map(Metricas.entropia, map(DataFrame.buffer_para_proceso, buffers),
+                                        chunksize=-(-len(buffers) // n_lotes)))
+        return dict(zip(columnas, valores))
+
+    @staticmethod
+    def perfilar_data_frame(df, n_procesos: int = 1) -> "DataFrame":
+        '''
+        Método para obtener el perfil de todas las columnas de un data.frame: tipo, conteo, valores distintos, mínimo,
+        máximo, media y varianza. Cada columna se recorre una sola vez (ver DataFrame.estadisticas_columnas) y el
+        resultado queda en caché, por lo que las métricas calculadas después no vuelven a recorrerla.
+        Parametros:
+            df: (DataFramePersonalizado) DataFrame con los datos.
+            n_procesos: (int | None) Número de procesos entre los que repartir las columnas, o None para usar todos
+                        los núcleos.
+        Return:
+            DataFramePersonalizado: Tabla con una fila por columna ('columna', 'tipo', 'conteo', 'distintos', 'min',
+                                    'max', 'media' y 'varianza'); las cuatro últimas son None en columnas no numéricas.
+        '''
+        campos = ('conteo', 'distintos', 'min', 'max', 'media', 'varianza')
+        perfil = {'columna': list(df.datos), 'tipo': [df.tipo_columna(nombre) for nombre in df.datos]}
+        perfil.update((campo, []) for campo in campos)
+        for estadisticas in df.estadisticas_columnas(n_procesos=n_procesos).values():
+            for campo in campos:
+                perfil[campo].append(estadisticas[campo])
+        return df.__class__(perfil)
+
+
+class AcumuladorVarianza:
+    '''
+    Acumulador de la varianza (poblacional) de una columna numérica que recibe los datos por bloques.
+    Cada bloque se resume en (conteo, media, suma de cuadrados de las desviaciones) y los resúmenes se combinan
+    con la fórmula de Welford por pares (Chan), de modo que el resultado es estable y no depende del orden de los bloques
+    más allá del redondeo.
+    '''
+    def __init__(self) -> None:
+        self.n = 0
+        self.media = 0.0
+        self.m2 = 0.0
+
+    def _agregar(self, n: int, media: float, m2: float) -> None:
+        '''
+        Método para combinar el resumen de otro conjunto de datos con el acumulado.
+        Parametros:
+            n: (int) Número de valores del otro conjunto.
+            media: (float) Media del otro conjunto.
+            m2: (float) Suma de cuadrados de las desviaciones respecto a su media.
+        '''
+        if n == 0:
+            return
+        total = self.n + n
+        delta = media - self.media
+        self.media += delta * n / total
+        self.m2 += m2 + delta * delta * self.n * n / total
+        self.n = total
+
+    def actualizar(self, columna: list[float | int]) -> 'AcumuladorVarianza':
+        '''
+        Método para añadir un bloque de valores.
+        Parametros:
+            columna: (list[float | int]) Valores numéricos del bloque.
+        Return:
+            AcumuladorVarianza: El propio acumulador.
+        '''
+        n = len(columna)
+        if n:
+            media = math.fsum(columna) / n
+            desviaciones = list(map(operator.sub, columna, repeat(media)))
+            self._agregar(n, media, math.fsum(map(operator.mul, desviaciones, desviaciones)))
+        return self
+
+    def combinar(self, otro: 'AcumuladorVarianza') -> 'AcumuladorVarianza':
+        '''
+        Método para incorporar el acumulado de otro bloque o proceso.
+        Parametros:
+            otro: (AcumuladorVarianza) Acumulador a combinar; no se modifica.
+        Return:
+            AcumuladorVarianza: El propio acumulador.
+        '''
+        self._agregar(otro.n, otro.media, otro.m2)
+        return self
+
+    def resultado(self) -> float:
+        '''
+        Método para obtener la varianza de todos los valores acumulados.
+        Return:
+            float: Varianza poblacional.
+        Exceptions:
+            ValueError si no se ha acumulado ningún valor.
+        '''
+        if self.n == 0:
+            raise ValueError("No se ha acumulado ningún valor.")
+        return self.m2 / self.n
+
+
+class AcumuladorEntropia:
+    '''
+    Acumulador de la entropía de una columna categórica que recibe los datos por bloques: guarda el número de
+    apariciones de cada valor, por lo que el resultado es exacto y su memoria depende sólo del número de valores distintos.
+    '''
+    def __init__(self) -> None:
+        self.conteos = Counter()
+
+    def actualizar(self, columna: list) -> 'AcumuladorEntropia':
+        '''
+        Método para añadir un bloque de valores.
+        Parametros:
+            columna: (list | ColumnaCategorica) Valores categóricos del bloque.
+        Return:
+            AcumuladorEntropia: El propio acumulador.
+        '''
+        if isinstance(columna, ColumnaCategorica):
+            # Los códigos de cada bloque pueden referirse a categorías distintas: se cuentan por categoría
+            for codigo, conteo in Counter(columna.codigos).items():
+                self.conteos[columna.categorias[codigo]] += conteo
         else:
-            # No numérica, tratar como categórica
-            return {"Entropía": Metricas.entropia(columna)}
+            self.conteos.update(columna)
+        return self
+
+    def combinar(self, otro: 'AcumuladorEntropia') -> 'AcumuladorEntropia':
+        '''
+        Método para incorporar el acumulado de otro bloque o proceso.
+        Parametros:
+            otro: (AcumuladorEntropia) Acumulador a combinar; no se modifica.
+        Return:
+            AcumuladorEntropia: El propio acumulador.
+        '''
+        self.conteos.update(otro.conteos)
+        return self
 
+    def resultado(self) -> float:
+        '''
+        Método para obtener la entropía de todos los valores acumulados.
+        Return:
+            float: Entropía de los valores.
+        Exceptions:
+            ValueError si no se ha acumulado ningún valor.
+        '''
+        total = sum(self.conteos.values())
+        if total == 0:
+            raise ValueError("No se ha acumulado ningún valor.")
+        return -sum((conteo / total) * math.log2(conteo / total) for conteo in self.conteos.values())
+
+
+class AcumuladorAUC:
+    '''
+    Acumulador del AUC de una columna numérica frente a una clase binaria (0/1) que recibe los datos por bloques.
+    Guarda, para cada valor, cuántas filas tiene y cuántas son positivas; al final recorre los valores ordenados
+    sumando los rangos con los empates promediados, como Metricas.auc. Con `decimales` los valores se redondean al
+    acumularlos: la memoria queda acotada por el número de bins y el resultado es aproximado (los valores del mismo
+    bin cuentan como empatados).
+    '''
+    def __init__(self, decimales: int = None) -> None:
+        '''
+        Constructor del acumulador.
+        Parametros:
+            decimales: (int | None) Decimales a los que se redondean los valores, o None para un resultado exacto.
+        '''
+        self.decimales = decimales
+        self.totales = Counter()
+        self.positivos = Counter()
+
+    def actualizar(self, columna: list[float | int], columna_clase: list[int]) -> 'AcumuladorAUC':
+        '''
+        Método para añadir un bloque de valores con su clase.
+        Parametros:
+            columna: (list[float | int]) Valores numéricos del bloque.
+            columna_clase: (list[int]) Clase binaria (0/1) de cada valor.
+        Return:
+            AcumuladorAUC: El propio acumulador.
+        Exceptions:
+            ValueError si la columna y la clase no tienen la misma longitud.
+        '''
+        if len(columna) != len(columna_clase):
+            raise ValueError("La columna y la clase deben tener la misma longitud.")
+        if self.decimales is not None:
+            columna = [round(valor, self.decimales) for valor in columna]
+        self.totales.update(columna)
+        self.positivos.update(compress(columna, columna_clase))
+        return self
+
+    def combinar(self, otro: 'AcumuladorAUC') -> 'AcumuladorAUC':
+        '''
+        Método para incorporar el acumulado de otro bloque o proceso.
+        Parametros:
+            otro: (AcumuladorAUC) Acumulador a combinar; no se modifica.
+        Return:
+            AcumuladorAUC: El propio acumulador.
+        Exceptions:
+            ValueError si los acumuladores redondean con distintos decimales.
+        '''
+        if otro.decimales != self.decimales:
+            raise ValueError("Sólo se pueden combinar acumuladores con los mismos decimales.")
+        self.totales.update(otro.totales)
+        self.positivos.update(otro.positivos)
+        return self
+
+    def resultado(self) -> float:
+        '''
+        Método para obtener el AUC de todos los valores acumulados.
+        Return:
+            float: Valor de AUC.
+        Exceptions:
+            ValueError si no hay filas positivas y negativas.
+        '''
+        conteo_positivos = sum(self.positivos.values())
+        conteo_negativos = sum(self.totales.values()) - conteo_positivos
+        if conteo_positivos == 0 or conteo_negativos == 0:
+            raise ValueError("El AUC necesita filas de ambas clases.")
+        # Cada positivo supera a los negativos de valores menores y empata con los de su mismo valor
+        negativos_previos = 0
+        pares_favorables = 0.0
+        for valor in sorted(self.totales):
+            positivos = self.positivos.get(valor, 0)
+            negativos = self.totales[valor] - positivos
+            pares_favorables += positivos * (negativos_previos + negativos / 2)
+            negativos_previos += negativos
+        return pares_favorables / (conteo_positivos * conteo_negativos)
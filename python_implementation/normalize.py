@@ -1,3 +1,5 @@
+from metrics import Metricas
+
 class EscaladorDatos:
     @staticmethod
     def es_columna_numerica(columna: list) -> bool:
@@ -11,33 +13,39 @@ class EscaladorDatos:
         return all(isinstance(x, (int, float)) for x in columna)
 
     @staticmethod
-    def normalizar_min_max(columna: list[float | int], decimales: int = 3) -> list[float]:
+    def normalizar_min_max(columna: list[float | int], decimales: int = 3, min_val: float = None, max_val: float = None) -> list[float]:
         '''
         Método para normalizar una columna utilizando la escala min-max.
         Parámetros:
             columna: (list[float | int]) Lista de valores numéricos a normalizar.
             decimales: (int) Número de decimales para redondear los valores normalizados.
+            min_val: (float | None) Mínimo ya conocido de la columna, o None para calcularlo.
+            max_val: (float | None) Máximo ya conocido de la columna, o None para calcularlo.
         Retorno:
             list[float]: Lista de valores normalizados con la escala min-max.
         '''
-        min_val, max_val = min(columna), max(columna)
+        if min_val is None or max_val is None:
+            min_val, max_val = min(columna), max(columna)
         if max_val == min_val:
             return [round(0.5, decimales)] * len(columna)
         return [round((x - min_val) / (max_val - min_val), decimales) for x in columna]
 
     @staticmethod
-    def estandarizar(columna: list[float | int], decimales: int = 3) -> list[float]:
+    def estandarizar(columna: list[float | int], decimales: int = 3, media: float = None, desviacion_estandar: float = None) -> list[float]:
         '''
         Método para estandarizar una columna, restando la media y dividiendo por la desviación estándar.
         Parámetros:
             columna: (list[float | int]) Lista de valores numéricos a estandarizar.
             decimales: (int) Número de decimales para redondear los valores estandarizados.
+            media: (float | None) Media ya conocida de la columna, o None para calcularla.
+            desviacion_estandar: (float | None) Desviación estándar ya conocida, o None para calcularla.
         Retorno:
             list[float]: Lista de valores estandarizados.
         '''
-        media = sum(columna) / len(columna)
-        varianza = sum((x - media) ** 2 for x in columna) / len(columna)
-        desviacion_estandar = varianza ** 0.5
+        if media is None or desviacion_estandar is None:
+            media = sum(columna) / len(columna)
+            varianza = sum((x - media) ** 2 for x in columna) / len(columna)
+            desviacion_estandar = varianza ** 0.5
         if desviacion_estandar == 0:
             return [round(0.0, decimales)] * len(columna)
         return [round((x - media) / desviacion_estandar, decimales) for x in columna]
@@ -53,9 +61,11 @@ class EscaladorDatos:
             None
         '''
         for nombre_columna in df.datos:
-            columna = df.obtener_columna(nombre_columna)
-            if EscaladorDatos.es_columna_numerica(columna):
-                df.datos[nombre_columna] = EscaladorDatos.normalizar_min_max(columna, decimales)
+            estadisticas = df.estadisticas_columna(nombre_columna)
+            if estadisticas['numerica']:
+                columna = df.obtener_buffer(nombre_columna)
+                normalizada = EscaladorDatos.normalizar_min_max(columna, decimales, estadisticas['min'], estadisticas['max'])
+                df.reemplazar_columna(nombre_columna, normalizada)
 
     @staticmethod
     def estandarizar_data_frame(df, decimales: int = 3) -> None:
@@ -68,6 +78,9 @@ class EscaladorDatos:
             None
         '''
         for nombre_columna in df.datos:
-            columna = df.obtener_columna(nombre_columna)
-            if EscaladorDatos.es_columna_numerica(columna):
-                df.datos[nombre_columna] = EscaladorDatos.estandarizar(columna, decimales)
+            estadisticas = df.estadisticas_columna(nombre_columna)
+            if estadisticas['numerica'] and estadisticas['conteo']:
+                columna = df.obtener_buffer(nombre_columna)
+                media = estadisticas['suma'] / estadisticas['conteo']
+                desviacion_estandar = Metricas.varianza_estadisticas(estadisticas) ** 0.5
+                df.reemplazar_columna(nombre_columna, EscaladorDatos.estandarizar(columna, decimales, media, desviacion_estandar))
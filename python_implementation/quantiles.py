@@ -0,0 +1,201 @@
+import math
+import random
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Iterable, Iterator
+
+class ResumenCuantiles:
+    '''
+    Resumen de cuantiles aproximados en memoria acotada (sketch KLL), alimentado por bloques y combinable.
+    Los valores se guardan en niveles de compactadores: el nivel h representa cada valor retenido con peso 2**h.
+    Cuando un nivel se llena se ordena y se conserva uno de cada dos valores en el nivel siguiente, de modo que el
+    tamaño total del resumen es del orden de 3 / error valores, independientemente del número de filas.
+    El error de rango esperado es del orden de `error * n`; con menos valores que la capacidad el resumen es exacto.
+    '''
+    FACTOR_CAPACIDAD = 2 / 3
+
+    def __init__(self, error: float = 0.01, semilla: int = 0) -> None:
+        '''
+        Constructor del resumen.
+        Parameters:
+            error: (float) Error de rango relativo admitido (entre 0 y 1).
+            semilla: (int) Semilla para elegir qué mitad se conserva en cada compactación (resultado reproducible).
+        Exceptions:
+            ValueError si `error` no está entre 0 y 1.
+        '''
+        if not 0 < error < 1:
+            raise ValueError("El error debe estar entre 0 y 1.")
+        self.error = error
+        self.k = max(8, math.ceil(3 / error))
+        self.niveles = [[]]
+        self.n = 0
+        self.min = None
+        self.max = None
+        self._aleatorio = random.Random(semilla)
+        self._vista = None
+
+    def _capacidad(self, nivel: int) -> int:
+        '''
+        Método para obtener la capacidad de un nivel: los niveles inferiores, de menor peso, son más pequeños.
+        Parameters:
+            nivel: (int) Índice del nivel.
+        Return:
+            int: Número de valores que admite el nivel antes de compactarse.
+        '''
+        profundidad = len(self.niveles) - nivel - 1
+        return max(2, math.ceil(self.k * self.FACTOR_CAPACIDAD ** profundidad))
+
+    def _compactar(self) -> None:
+        '''
+        Método para compactar niveles hasta que el resumen vuelva a caber en su capacidad total.
+        '''
+        while sum(map(len, self.niveles)) > sum(map(self._capacidad, range(len(self.niveles)))):
+            for h, nivel in enumerate(self.niveles):
+                if len(nivel) >= self._capacidad(h):
+                    if h + 1 == len(self.niveles):
+                        self.niveles.append([])
+                    nivel.sort()
+                    # Con un número impar de valores, el último se queda en el nivel para conservar el peso total
+                    resto = [nivel.pop()] if len(nivel) % 2 else []
+                    self.niveles[h + 1].extend(nivel[self._aleatorio.randint(0, 1)::2])
+                    self.niveles[h] = resto
+                    break
+
+    def actualizar(self, valores: Iterable[float | int]) -> 'ResumenCuantiles':
+        '''
+        Método para añadir un bloque de valores al resumen.
+        Parameters:
+            valores: (Iterable[float | int]) Valores numéricos del bloque.
+        Return:
+            ResumenCuantiles: El propio resumen, actualizado.
+        '''
+        valores = list(valores)
+        if not valores:
+            return self
+        self.n += len(valores)
+        minimo, maximo = min(valores), max(valores)
+        self.min = minimo if self.min is None else min(self.min, minimo)
+        self.max = maximo if self.max is None else max(self.max, maximo)
+        self.niveles[0].extend(valores)
+        self._vista = None
+        self._compactar()
+        return self
+
+    def combinar(self, otro: 'ResumenCuantiles') -> 'ResumenCuantiles':
+        '''
+        Método para incorporar otro resumen (por ejemplo, el construido por otro proceso sobre otra parte de los datos).
+        Parameters:
+            otro: (ResumenCuantiles) Resumen a combinar; no se modifica.
+        Return:
+            ResumenCuantiles: El propio resumen, que pasa a representar ambos conjuntos de datos.
+        '''
+        if otro.n == 0:
+            return self
+        self.k = min(self.k, otro.k)
+        self.error = max(self.error, otro.error)
+        while len(self.niveles) < len(otro.niveles):
+            self.niveles.append([])
+        for nivel, valores in zip(self.niveles, otro.niveles):
+            nivel.extend(valores)
+        self.n += otro.n
+        self.min = otro.min if self.min is None else min(self.min, otro.min)
+        self.max = otro.max if self.max is None else max(self.max, otro.max)
+        self._vista = None
+        self._compactar()
+        return self
+
+    def _obtener_vista(self) -> tuple[list[float | int], list[int]]:
+        '''
+        Método para obtener los valores retenidos ordenados y sus pesos acumulados (se recalcula solo tras cambios).
+        Return:
+            tuple[list[float | int], list[int]]: Valores ordenados y peso acumulado hasta cada uno (incluido).
+        '''
+        if self._vista is None:
+            pares = sorted((valor, 1 << h) for h, nivel in enumerate(self.niveles) for valor in nivel)
+            self._vista = ([valor for valor, _ in pares], list(accumulate(peso for _, peso in pares)))
+        return self._vista
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __getitem__(self, rango: int) -> float | int:
+        '''
+        Método para obtener el valor aproximado que ocuparía la posición `rango` en la columna ordenada, de modo que
+        el resumen puede usarse en lugar de la lista ordenada para calcular puntos de corte.
+        Parameters:
+            rango: (int) Posición en el orden (se admiten índices negativos).
+        Return:
+            float | int: Valor aproximado en esa posición.
+        Exceptions:
+            IndexError si la posición está fuera del rango [0, n).
+        '''
+        if rango < 0:
+            rango += self.n
+        if not 0 <= rango < self.n:
+            raise IndexError("Posición fuera del resumen.")
+        if rango == 0:
+            return self.min
+        if rango == self.n - 1:
+            return self.max
+        valores, acumulados = self._obtener_vista()
+        return valores[bisect_right(acumulados, rango)]
+
+    def cuantil(self, q: float) -> float | int:
+        '''
+        Método para obtener el cuantil aproximado `q`.
+        Parameters:
+            q: (float) Cuantil entre 0 y 1.
+        Return:
+            float | int: Valor aproximado del cuantil.
+        Exceptions:
+            ValueError si el resumen está vacío o `q` no está entre 0 y 1.
+        '''
+        if self.n == 0:
+            raise ValueError("El resumen está vacío.")
+        if not 0 <= q <= 1:
+            raise ValueError("El cuantil debe estar entre 0 y 1.")
+        return self[int(q * (self.n - 1))]
+
+    def cuantiles(self, qs: Iterable[float]) -> list[float | int]:
+        '''
+        Método para obtener varios cuantiles aproximados a la vez.
+        Parameters:
+            qs: (Iterable[float]) Cuantiles entre 0 y 1.
+        Return:
+            list[float | int]: Valores aproximados de cada cuantil.
+        '''
+        return [self.cuantil(q) for q in qs]
+
+    @classmethod
+    def desde_bloques(cls, bloques: Iterator, columnas: list[str] = None, error: float = 0.01,
+                      semilla: int = 0) -> dict[str, 'ResumenCuantiles']:
+        '''
+        Método de clase para construir un resumen por columna recorriendo bloques de un data.frame, por ejemplo los
+        generados por DataFrame.iterar_csv, sin cargar el archivo completo en memoria.
+        Como los tipos inferidos pueden variar entre bloques, una columna resumida que deja de ser numérica en un
+        bloque posterior provoca un error en lugar de descartarse en silencio.
+        Parameters:
+            bloques: (Iterator[DataFrame]) Bloques consecutivos del data.frame.
+            columnas: (list[str] | None) Columnas a resumir, o None para resumir todas las numéricas del primer bloque.
+            error: (float) Error de rango relativo admitido.
+            semilla: (int) Semilla de las compactaciones.
+        Return:
+            dict[str, ResumenCuantiles]: Resumen de cada columna.
+        Exceptions:
+            ValueError si alguna columna resumida no es numérica en algún bloque.
+        '''
+        resumenes = {}
+        for bloque in bloques:
+            if columnas is None:
+                columnas = [nombre for nombre in bloque.datos if bloque.es_numerica(nombre)]
+            for nombre in columnas:
+                if not bloque.es_numerica(nombre):
+                    raise ValueError(f"La columna '{nombre}' no es numérica en todos los bloques; fije su tipo con "
+                                     "`esquema` al leerlos.")
+                if nombre not in resumenes:
+                    resumenes[nombre] = cls(error, semilla)
+                resumenes[nombre].actualizar(bloque.obtener_buffer(nombre))
+        return resumenes
+
+    def __repr__(self) -> str:
+        return f"ResumenCuantiles(n={self.n}, error={self.error}, retenidos={sum(map(len, self.niveles))})"
@@ -60,9 +60,41 @@ def prueba_correlacion_mixta():
     
     print("Éxito: Prueba de Correlación Mixta")
 
+def prueba_informacion_mutua_categorica_codificada():
+    # Verifica que la información mutua sobre columnas categóricas codificadas coincide con la de las listas.
+    df = DataFrame({
+        'a': ['gato', 'perro', 'perro', 'pajaro', 'pajaro', 'gato'],
+        'b': ['manzana', 'banana', 'banana', 'cereza', 'banana', 'manzana']
+    })
+    esperado = Correlacion(df).calcular_correlacion_por_pares()[('a', 'b')]
+    df.codificar_categorica('a')
+    df.codificar_categorica('b')
+    resultado = Correlacion(df).calcular_correlacion_por_pares()[('a', 'b')]
+    assert abs(resultado - esperado) < 1e-12, f"Fallo: Prueba de información mutua codificada. Obtenido {resultado}"
+    print("Éxito: Prueba de Información Mutua Categórica Codificada")
+
+def prueba_matriz_correlacion_pearson():
+    # Verifica la matriz de correlaciones frente a correlacion_pearson, por bloques y con una columna constante.
+    df = DataFrame({
+        'x': [1, 2, 3, 4, 5, 6], 'y': [2, 1, 4, 3, 6, 5], 'z': [6, 5, 4, 3, 2, 1], 'k': [7] * 6, 'c': list('aabbcc')
+    })
+    calculadora_correlacion = Correlacion(df)
+    matriz, etiquetas = calculadora_correlacion.matriz_correlacion_pearson(filas_por_bloque=4)
+    assert etiquetas == ['x', 'y', 'z', 'k'], f"Fallo: Etiquetas de la matriz. Obtenido {etiquetas}"
+    for i, nombre1 in enumerate(etiquetas):
+        for j, nombre2 in enumerate(etiquetas):
+            esperado = calculadora_correlacion.correlacion_pearson(df.obtener_columna(nombre1), df.obtener_columna(nombre2))
+            if i == j and nombre1 != 'k':
+                esperado = 1.0
+            assert abs(matriz[i][j] - esperado) < 1e-12, f"Fallo: Correlación ({nombre1}, {nombre2}). Obtenido {matriz[i][j]}"
+    assert calculadora_correlacion.calcular_correlacion_por_pares()[('x', 'z')] == matriz[0][2], "Fallo: Correlación por pares desde la matriz"
+    print("Éxito: Prueba de Matriz de Correlación de Pearson")
+
+
 if __name__ == "__main__":
     prueba_correlacion_pearson()
     prueba_correlacion_cero()
     prueba_informacion_mutua()
     prueba_correlacion_mixta()
-
+    prueba_informacion_mutua_categorica_codificada()
+    prueba_matriz_correlacion_pearson()
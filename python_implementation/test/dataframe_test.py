@@ -1,5 +1,7 @@
 import os
+import pickle
 import sys
+from array import array
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
@@ -57,6 +59,289 @@ def prueba_escribir_y_leer_txt_data_frame_personalizado():
     os.remove(ruta_archivo)
     print("Exito: Prueba de Escritura y Lectura TXT en DataFramePersonalizado")
 
+def prueba_almacenamiento_tipado_data_frame_personalizado():
+    # Verifica que las columnas numéricas se guardan en buffers tipados y que el esquema registra su tipo.
+    df = DataFrame({'enteros': [1, 2, 3], 'reales': [1, 2.5, 3], 'texto': ['a', 'b', 'c']})
+    assert df.esquema == {'enteros': 'int', 'reales': 'float', 'texto': 'str'}, f"Fallo: Esquema inferido. Obtenido {df.esquema}"
+    assert df.obtener_buffer('enteros').typecode == 'q', "Fallo: Buffer tipado de enteros"
+    assert df.obtener_buffer('reales').typecode == 'd', "Fallo: Buffer tipado de reales"
+    assert df.obtener_columna('reales') == [1.0, 2.5, 3.0], "Fallo: obtener_columna sobre buffer tipado"
+    assert df.es_numerica('enteros') and not df.es_numerica('texto'), "Fallo: es_numerica a partir del esquema"
+    df.reemplazar_columna('texto', [0.1, 0.2, 0.3])
+    assert df.tipo_columna('texto') == 'float', "Fallo: Esquema tras reemplazar columna"
+    print("Exito: Prueba de Almacenamiento Tipado en DataFramePersonalizado")
+
+def prueba_iterar_csv_por_bloques_data_frame_personalizado():
+    # Verifica que la lectura por bloques devuelve todas las filas, en orden y en bloques del tamaño pedido.
+    df = DataFrame({'col1': list(range(10)), 'col2': [x * 0.5 for x in range(10)]})
+    ruta_archivo = 'prueba_bloques.csv'
+    df.escribir_a_csv(ruta_archivo)
+    bloques = list(DataFrame.iterar_csv(ruta_archivo, filas_por_bloque=4))
+    os.remove(ruta_archivo)
+    assert [len(b.obtener_columna('col1')) for b in bloques] == [4, 4, 2], "Fallo: Tamaño de los bloques CSV"
+    assert sum((b.obtener_columna('col1') for b in bloques), []) == list(range(10)), "Fallo: Orden de las filas por bloques"
+    assert bloques[2].obtener_columna('col2') == [4.0, 4.5], "Fallo: Valores del último bloque"
+    print("Exito: Prueba de Lectura CSV por Bloques en DataFramePersonalizado")
+
+def prueba_inferencia_esquema_data_frame_personalizado():
+    # Verifica la inferencia de tipos por columna, la ampliación de tipo y el esquema explícito al leer un CSV.
+    ruta_archivo = 'prueba_esquema.csv'
+    with open(ruta_archivo, 'w') as archivo:
+        archivo.write('a,b,c\n1,1,x\n2,2.5,3\n')
+    df = DataFrame.leer_desde_csv(ruta_archivo)
+    assert df.esquema == {'a': 'int', 'b': 'float', 'c': 'str'}, f"Fallo: Esquema inferido al leer CSV. Obtenido {df.esquema}"
+    assert df.obtener_columna('b') == [1.0, 2.5], "Fallo: Ampliación de int a float"
+    assert df.obtener_columna('c') == ['x', '3'], "Fallo: Ampliación a str"
+    df_explicito = DataFrame.leer_desde_csv(ruta_archivo, esquema={'a': 'float'})
+    assert df_explicito.tipo_columna('a') == 'float', "Fallo: Esquema explícito"
+    try:
+        DataFrame.leer_desde_csv(ruta_archivo, esquema={'c': 'int'})
+        print("Fallo: Prueba de esquema explícito incompatible (no se lanzó excepción)")
+    except ValueError:
+        print("Exito: Prueba de Inferencia de Esquema en DataFramePersonalizado")
+    finally:
+        os.remove(ruta_archivo)
+
+def prueba_leer_columnas_seleccionadas_data_frame_personalizado():
+    # Verifica que al leer sólo algunas columnas se cargan únicamente ésas, en el orden pedido.
+    df = DataFrame({'col1': [1, 2, 3], 'col2': [4.5, 5.5, 6.5], 'col3': ['a', 'b', 'c']})
+    ruta_archivo = 'prueba_columnas.txt'
+    df.escribir_a_txt(ruta_archivo)
+    df_cargado = DataFrame.leer_desde_txt(ruta_archivo, columnas=['col3', 'col1'])
+    os.remove(ruta_archivo)
+    assert list(df_cargado.datos) == ['col3', 'col1'], f"Fallo: Columnas cargadas. Obtenido {list(df_cargado.datos)}"
+    assert df_cargado.obtener_columna('col3') == ['a', 'b', 'c'], "Fallo: Lectura de columna seleccionada col3"
+    assert df_cargado.obtener_columna('col1') == [1, 2, 3], "Fallo: Lectura de columna seleccionada col1"
+    print("Exito: Prueba de Lectura de Columnas Seleccionadas en DataFramePersonalizado")
+
+def prueba_escribir_y_leer_binario_data_frame_personalizado():
+    # Prueba la escritura y lectura en formato binario columnar mapeado en memoria.
+    df = DataFrame({'col1': [1, 2, 3], 'col2': [4.5, 5.5, 6.5], 'col3': ['a', 'ñ', '']})
+    ruta_archivo = 'prueba.dfc'
+    df.escribir_a_binario(ruta_archivo)
+    df_cargado = DataFrame.leer_desde_binario(ruta_archivo)
+    assert df_cargado.esquema == df.esquema, f"Fallo: Esquema del binario. Obtenido {df_cargado.esquema}"
+    assert isinstance(df_cargado.obtener_buffer('col1'), memoryview), "Fallo: Columna numérica sin copia"
+    assert df_cargado.obtener_columna('col1') == [1, 2, 3], "Fallo: Lectura binaria en col1"
+    assert df_cargado.obtener_columna('col2') == [4.5, 5.5, 6.5], "Fallo: Lectura binaria en col2"
+    assert df_cargado.obtener_columna('col3') == ['a', 'ñ', ''], "Fallo: Lectura binaria en col3"
+    assert list(DataFrame.leer_desde_binario(ruta_archivo, columnas=['col2']).datos) == ['col2'], "Fallo: Selección de columnas en binario"
+    del df_cargado
+    os.remove(ruta_archivo)
+    print("Exito: Prueba de Escritura y Lectura Binaria en DataFramePersonalizado")
+
+def prueba_sobrescribir_binario_mapeado_data_frame_personalizado():
+    # Verifica que un data.frame leído de un binario mapeado puede guardarse sobre el mismo archivo.
+    df = DataFrame({'num': list(range(1000)), 'real': [x / 2 for x in range(1000)], 'txt': [f'v{x}' for x in range(1000)]})
+    ruta_archivo = 'prueba_sobrescribir.dfc'
+    df.escribir_a_binario(ruta_archivo)
+    try:
+        df_cargado = DataFrame.leer_desde_binario(ruta_archivo)
+        df_cargado.escribir_a_binario(ruta_archivo)
+        assert df_cargado.obtener_columna('txt') == df.obtener_columna('txt'), "Fallo: El original mapeado cambia al sobrescribirlo"
+        df_releido = DataFrame.leer_desde_binario(ruta_archivo)
+        for nombre in df.datos:
+            assert df_releido.obtener_columna(nombre) == df.obtener_columna(nombre), f"Fallo: Sobrescritura del binario en {nombre}"
+        assert not [f for f in os.listdir('.') if f.startswith('.prueba_sobrescribir')], "Fallo: Quedan archivos temporales"
+        del df_cargado, df_releido
+    finally:
+        os.remove(ruta_archivo)
+    print("Exito: Prueba de Sobrescribir un Binario Mapeado en DataFramePersonalizado")
+
+def prueba_escribir_csv_por_lotes_data_frame_personalizado():
+    # Verifica la escritura por lotes, en paralelo y anexando bloques a un CSV existente.
+    ruta_archivo = 'prueba_lotes.csv'
+    if os.path.exists(ruta_archivo):
+        os.remove(ruta_archivo)
+    for bloque in (DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']}), DataFrame({'a': [4, 5], 'b': ['u', 'v']})):
+        bloque.escribir_a_csv(ruta_archivo, anexar=True, filas_por_lote=2, n_procesos=2)
+    df_cargado = DataFrame.leer_desde_csv(ruta_archivo)
+    os.remove(ruta_archivo)
+    assert df_cargado.obtener_columna('a') == [1, 2, 3, 4, 5], f"Fallo: Escritura por lotes en a. Obtenido {df_cargado.obtener_columna('a')}"
+    assert df_cargado.obtener_columna('b') == ['x', 'y', 'z', 'u', 'v'], "Fallo: Escritura por lotes en b"
+    print("Exito: Prueba de Escritura CSV por Lotes en DataFramePersonalizado")
+
+def prueba_escribir_y_leer_comprimido_data_frame_personalizado():
+    # Verifica la escritura y lectura de archivos comprimidos con gzip, bz2 y xz, también por bloques.
+    df = DataFrame({'col1': [1, 2, 3], 'col2': ['a', 'b', 'c']})
+    for ruta_archivo in ('prueba.csv.gz', 'prueba.csv.bz2', 'prueba.csv.xz'):
+        df.escribir_a_csv(ruta_archivo)
+        df.escribir_a_csv(ruta_archivo, anexar=True)
+        df_cargado = DataFrame.leer_desde_csv(ruta_archivo)
+        bloques = list(DataFrame.iterar_csv(ruta_archivo, filas_por_bloque=4))
+        with open(ruta_archivo, 'rb') as archivo:
+            comprimido = not archivo.read().startswith(b'col1')
+        os.remove(ruta_archivo)
+        assert comprimido, f"Fallo: El archivo {ruta_archivo} no está comprimido"
+        assert df_cargado.obtener_columna('col1') == [1, 2, 3, 1, 2, 3], f"Fallo: Lectura comprimida de {ruta_archivo}"
+        assert [b.obtener_columna('col2') for b in bloques] == [['a', 'b', 'c', 'a'], ['b', 'c']], f"Fallo: Lectura comprimida por bloques de {ruta_archivo}"
+    print("Exito: Prueba de Escritura y Lectura Comprimida en DataFramePersonalizado")
+
+def prueba_leer_csv_paralelo_data_frame_personalizado():
+    # Verifica que la lectura en paralelo por rangos de bytes y por archivos conserva el orden de las filas.
+    df = DataFrame({'col1': list(range(500)), 'col2': [x / 4 for x in range(500)]})
+    rutas = ['prueba_paralelo_1.csv', 'prueba_paralelo_2.csv.gz']
+    for ruta_archivo in rutas:
+        df.escribir_a_csv(ruta_archivo)
+    tamano_original = DataFrame.TAMANO_MIN_FRAGMENTO
+    DataFrame.TAMANO_MIN_FRAGMENTO = 100
+    try:
+        df_un_archivo = DataFrame.leer_desde_csv_paralelo(rutas[0], n_procesos=4)
+        df_varios = DataFrame.leer_desde_csv_paralelo(rutas, n_procesos=2)
+    finally:
+        DataFrame.TAMANO_MIN_FRAGMENTO = tamano_original
+        for ruta_archivo in rutas:
+            os.remove(ruta_archivo)
+    assert df_un_archivo.obtener_columna('col1') == list(range(500)), "Fallo: Lectura paralela de un archivo en col1"
+    assert df_un_archivo.obtener_columna('col2') == [x / 4 for x in range(500)], "Fallo: Lectura paralela de un archivo en col2"
+    assert df_varios.obtener_columna('col1') == list(range(500)) * 2, "Fallo: Lectura paralela de varios archivos"
+    assert df_varios.esquema == {'col1': 'int', 'col2': 'float'}, f"Fallo: Esquema de la lectura paralela. Obtenido {df_varios.esquema}"
+    print("Exito: Prueba de Lectura CSV en Paralelo en DataFramePersonalizado")
+
+def prueba_leer_directorio_con_indice_data_frame_personalizado():
+    # Verifica que la lectura de un directorio ignora los índices de filas guardados junto a las partes.
+    directorio = 'prueba_partes'
+    os.makedirs(directorio, exist_ok=True)
+    ruta_archivo = os.path.join(directorio, 'p0.csv')
+    DataFrame({'col1': list(range(20))}).escribir_a_csv(ruta_archivo)
+    ruta_indice = DataFrame.construir_indice_filas(ruta_archivo, cada_n=5)
+    try:
+        df = DataFrame.leer_desde_csv_paralelo(directorio, n_procesos=1)
+    finally:
+        os.remove(ruta_archivo)
+        os.remove(ruta_indice)
+        os.rmdir(directorio)
+    assert df.obtener_columna('col1') == list(range(20)), f"Fallo: Lectura de directorio con índice. Obtenido {df.obtener_columna('col1')}"
+    print("Exito: Prueba de Lectura de Directorio con Índice en DataFramePersonalizado")
+
+def prueba_estadisticas_columna_data_frame_personalizado():
+    # Verifica el cálculo de estadísticas por columna, su caché y su invalidación al sustituir la columna.
+    df = DataFrame({'col1': [3, 1, 2, 3], 'col2': ['a', 'b', 'a', 'a']})
+    estadisticas = df.estadisticas_columna('col1')
+    esperado = {'numerica': True, 'conteo': 4, 'distintos': 3, 'min': 1, 'max': 3, 'suma': 9, 'suma_cuadrados': 23,
+                'media': 2.25, 'varianza': 0.6875}
+    assert estadisticas == esperado, f"Fallo: Estadísticas de col1. Obtenido {estadisticas}"
+    assert df.estadisticas_columna('col2')['distintos'] == 2 and not df.estadisticas_columna('col2')['numerica'], "Fallo: Estadísticas de col2"
+    assert df._estadisticas['col1'][0] is df.obtener_buffer('col1'), "Fallo: Estadísticas no guardadas en caché"
+    df.reemplazar_columna('col1', [10, 20, 30, 40])
+    assert df.estadisticas_columna('col1')['max'] == 40, "Fallo: Invalidación de la caché al reemplazar la columna"
+    df.datos['col1'] = [5.0, 5.0, 5.0, 5.0]
+    assert df.estadisticas_columna('col1')['distintos'] == 1, "Fallo: Invalidación de la caché al asignar sobre `datos`"
+    df.datos['col1'] = ['p', 'q', 'r', 'r']
+    assert not df.es_numerica('col1') and df.esquema['col1'] == 'str', f"Fallo: Tipo tras asignar texto sobre `datos`. Obtenido {df.esquema}"
+    assert df.estadisticas_columna('col1')['distintos'] == 3, "Fallo: Estadísticas tras asignar texto sobre `datos`"
+    print("Exito: Prueba de Estadísticas por Columna en DataFramePersonalizado")
+
+def prueba_columnas_categoricas_data_frame_personalizado():
+    # Verifica que las columnas de texto con pocos valores distintos se cargan como categóricas y se conservan al escribirlas.
+    df = DataFrame({'id': list(range(6)), 'color': ['rojo', 'azul', 'rojo', 'rojo', 'azul', 'rojo'], 'nombre': list('abcdef')})
+    ruta_archivo = 'prueba_categorica.csv'
+    df.escribir_a_csv(ruta_archivo)
+    df_cargado = DataFrame.leer_desde_csv(ruta_archivo)
+    os.remove(ruta_archivo)
+    assert df_cargado.esquema == {'id': 'int', 'color': 'category', 'nombre': 'str'}, f"Fallo: Esquema categórico. Obtenido {df_cargado.esquema}"
+    columna = df_cargado.obtener_buffer('color')
+    assert list(columna.codigos) == [0, 1, 0, 0, 1, 0] and columna.categorias == ['rojo', 'azul'], "Fallo: Codificación categórica"
+    assert df_cargado.obtener_columna('color') == df.obtener_columna('color'), "Fallo: Decodificación categórica"
+    ruta_binario = 'prueba_categorica.dfc'
+    df_cargado.escribir_a_binario(ruta_binario)
+    df_binario = DataFrame.leer_desde_binario(ruta_binario)
+    assert df_binario.tipo_columna('color') == 'category', "Fallo: Tipo categórico en formato binario"
+    assert df_binario.obtener_columna('color') == df.obtener_columna('color'), "Fallo: Lectura binaria categórica"
+    del df_binario
+    os.remove(ruta_binario)
+    print("Exito: Prueba de Columnas Categóricas en DataFramePersonalizado")
+
+def prueba_seleccionar_filas_data_frame_personalizado():
+    # Verifica la selección de filas por rango, índices y máscara, y que las vistas no copian ni modifican el original.
+    df = DataFrame({'num': [10, 20, 30, 40, 50], 'txt': ['a', 'b', 'c', 'd', 'e']})
+    vista_rango = df.seleccionar_filas(slice(1, 4))
+    assert vista_rango.obtener_columna('num') == [20, 30, 40], "Fallo: Selección por rango en num"
+    assert vista_rango.obtener_columna('txt') == ['b', 'c', 'd'], "Fallo: Selección por rango en txt"
+    assert vista_rango.obtener_buffer('num').base is df.obtener_buffer('num'), "Fallo: La vista por rango copia el buffer"
+    vista_indices = df.seleccionar_filas([4, 0, 2])
+    assert vista_indices.obtener_columna('num') == [50, 10, 30], "Fallo: Selección por índices"
+    vista_mascara = df.seleccionar_filas([x > 25 for x in df.obtener_columna('num')])
+    assert vista_mascara.obtener_columna('txt') == ['c', 'd', 'e'], "Fallo: Selección por máscara"
+    assert vista_mascara.seleccionar_filas(slice(1, None)).obtener_columna('num') == [40, 50], "Fallo: Vista de una vista"
+    assert vista_mascara.esquema == df.esquema, "Fallo: Esquema de la vista"
+    vista_rango.reemplazar_columna('num', [0, 0, 0])
+    assert df.obtener_columna('num') == [10, 20, 30, 40, 50], "Fallo: Escribir en la vista modifica el original"
+    try:
+        df.seleccionar_filas([True, False])
+        print("Fallo: Prueba de máscara de longitud incorrecta (no se lanzó excepción)")
+    except ValueError:
+        print("Exito: Prueba de Selección de Filas en DataFramePersonalizado")
+
+def prueba_modificar_original_tras_seleccionar_filas():
+    # Verifica que una vista comparte los datos del original sin bloquear la ampliación de sus buffers.
+    df = DataFrame({'num': [10, 20, 30, 40], 'cat': ['a', 'b', 'a', 'b']})
+    df.codificar_categorica('cat')
+    vista = df.seleccionar_filas(slice(0, 2))
+    buffer = df.obtener_buffer('num')
+    buffer[0] = 99
+    assert vista.obtener_columna('num') == [99, 20], "Fallo: La vista no comparte los datos del original"
+    buffer.append(50)
+    buffer.extend([60, 70])
+    assert vista.obtener_columna('num') == [99, 20], "Fallo: Ampliar el original modifica la vista"
+    assert vista.obtener_columna('cat') == ['a', 'b'], "Fallo: Vista de columna categórica"
+    df.reemplazar_columna('num', [0] * 7)
+    assert vista.obtener_columna('num') == [99, 20], "Fallo: Reemplazar la columna del original modifica la vista"
+    print("Exito: Prueba de Modificar el Original tras Seleccionar Filas")
+
+def prueba_buffer_para_proceso_data_frame_personalizado():
+    # Verifica que los buffers se preparan para otros procesos sin decodificar categorías ni arrastrar la columna original.
+    df = DataFrame({'num': [1, 2, 3, 4], 'real': [0.5, 1.5, 2.5, 3.5], 'cat': ['x', 'y', 'x', 'x'], 'txt': list('abcd')})
+    df.codificar_categorica('cat')
+    ruta_archivo = 'prueba_proceso.dfc'
+    df.escribir_a_binario(ruta_archivo)
+    df_binario = DataFrame.leer_desde_binario(ruta_archivo)
+    buffer = DataFrame.buffer_para_proceso(df_binario.obtener_buffer('real'))
+    assert buffer == array('d', [0.5, 1.5, 2.5, 3.5]), f"Fallo: Copia de un memoryview. Obtenido {buffer}"
+    vista = df.seleccionar_filas([3, 1])
+    buffer = DataFrame.buffer_para_proceso(vista.obtener_buffer('num'))
+    assert buffer == array('q', [4, 2]), f"Fallo: Copia de una vista de filas. Obtenido {buffer}"
+    categorica = pickle.loads(pickle.dumps(DataFrame.buffer_para_proceso(vista.obtener_buffer('cat'))))
+    assert categorica.codigos == array('i', [0, 1]) and categorica.categorias == ['x', 'y'], "Fallo: Códigos categóricos"
+    assert DataFrame.buffer_para_proceso(vista.obtener_buffer('txt')) == ['d', 'b'], "Fallo: Copia de una vista de texto"
+    assert DataFrame.buffer_para_proceso(df.obtener_buffer('num')) is df.obtener_buffer('num'), "Fallo: Copia innecesaria"
+    del df_binario
+    os.remove(ruta_archivo)
+    assert DataFrame.normalizar_n_procesos(None) >= 1, "Fallo: Número de procesos por defecto"
+    for n_procesos in (0, -1, 0.5):
+        try:
+            DataFrame.normalizar_n_procesos(n_procesos)
+            print(f"Fallo: Prueba de número de procesos no válido {n_procesos} (no se lanzó excepción)")
+            return
+        except ValueError:
+            pass
+    print("Exito: Prueba de Buffers para Procesos en DataFramePersonalizado")
+
+def prueba_leer_filas_con_indice_data_frame_personalizado():
+    # Verifica la lectura de rangos de filas de un CSV a través de su índice de desplazamientos.
+    df = DataFrame({'col1': list(range(100)), 'col2': [f'v{x}' for x in range(100)]})
+    ruta_archivo = 'prueba_indice.csv'
+    df.escribir_a_csv(ruta_archivo)
+    ruta_indice = DataFrame.construir_indice_filas(ruta_archivo, cada_n=7)
+    try:
+        df_rango = DataFrame.leer_filas_csv(ruta_archivo, 45, 52)
+        df_fila = DataFrame.leer_filas_csv(ruta_archivo, 99, 100, columnas=['col2'])
+        assert df_rango.obtener_columna('col1') == list(range(45, 52)), f"Fallo: Lectura de rango con índice. Obtenido {df_rango.obtener_columna('col1')}"
+        assert df_fila.obtener_columna('col2') == ['v99'], "Fallo: Lectura de una fila con índice"
+        # Con un número de filas múltiplo de cada_n, el rango vacío del final no tiene desplazamiento en el índice
+        DataFrame.construir_indice_filas(ruta_archivo, cada_n=10)
+        df_vacio = DataFrame.leer_filas_csv(ruta_archivo, 100, 100)
+        assert df_vacio.esta_vacio() and list(df_vacio.datos) == ['col1', 'col2'], "Fallo: Lectura de un rango vacío al final"
+        df.escribir_a_csv(ruta_archivo, anexar=True)
+        try:
+            DataFrame.leer_filas_csv(ruta_archivo, 0, 1)
+            print("Fallo: Prueba de índice desactualizado (no se lanzó excepción)")
+        except ValueError:
+            print("Exito: Prueba de Lectura de Filas con Índice en DataFramePersonalizado")
+    finally:
+        os.remove(ruta_archivo)
+        os.remove(ruta_indice)
+
 
 if __name__ == "__main__":
     prueba_inicializacion_data_frame_personalizado()
@@ -64,3 +349,19 @@ if __name__ == "__main__":
     prueba_esta_vacio_data_frame_personalizado()
     prueba_escribir_y_leer_csv_data_frame_personalizado()
     prueba_escribir_y_leer_txt_data_frame_personalizado()
+    prueba_almacenamiento_tipado_data_frame_personalizado()
+    prueba_iterar_csv_por_bloques_data_frame_personalizado()
+    prueba_inferencia_esquema_data_frame_personalizado()
+    prueba_leer_columnas_seleccionadas_data_frame_personalizado()
+    prueba_escribir_y_leer_binario_data_frame_personalizado()
+    prueba_sobrescribir_binario_mapeado_data_frame_personalizado()
+    prueba_escribir_csv_por_lotes_data_frame_personalizado()
+    prueba_escribir_y_leer_comprimido_data_frame_personalizado()
+    prueba_leer_csv_paralelo_data_frame_personalizado()
+    prueba_leer_directorio_con_indice_data_frame_personalizado()
+    prueba_estadisticas_columna_data_frame_personalizado()
+    prueba_columnas_categoricas_data_frame_personalizado()
+    prueba_seleccionar_filas_data_frame_personalizado()
+    prueba_modificar_original_tras_seleccionar_filas()
+    prueba_leer_filas_con_indice_data_frame_personalizado()
+    prueba_buffer_para_proceso_data_frame_personalizado()
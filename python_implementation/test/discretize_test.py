@@ -1,9 +1,11 @@
 import os
+import pickle
+import random
 import sys
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from discretize import Discretizador
+from discretize import Discretizador, DiscretizadorColumna
 from dataframe import DataFrame
 
 def prueba_discretizador_ancho_igual():
@@ -24,6 +26,29 @@ def prueba_discretizador_frecuencia_igual():
     assert resultado == esperado, f"Fallo: Prueba de frecuencia igual. Obtenido {resultado}"
     print("Exito: Prueba de Discretizador Frecuencia Igual")
 
+def prueba_discretizador_frecuencia_igual_empates():
+    # Verifica que la discretización de igual frecuencia no reparte valores repetidos entre bins.
+    columna = [5, 5, 1, 5, 2, 5, 3, 3]
+    bins = 3
+    resultado = Discretizador.frecuencia_igual(columna, bins)
+    esperado = [2, 2, 0, 2, 0, 2, 1, 1]
+    assert resultado == esperado, f"Fallo: Prueba de frecuencia igual con empates. Obtenido {resultado}"
+    print("Exito: Prueba de Discretizador Frecuencia Igual con Empates")
+
+def prueba_discretizador_frecuencia_igual_pocos_valores():
+    # Verifica que con menos valores que bins todos los caminos asignan el último bin, como el método original.
+    columna = [4, 0, 2]
+    bins = 4
+    esperado = [3, 3, 3]
+    resultado = Discretizador.frecuencia_igual(columna, bins)
+    assert resultado == esperado, f"Fallo: Prueba de frecuencia igual con pocos valores. Obtenido {resultado}"
+    resultado = DiscretizadorColumna('frecuencia_igual', bins).ajustar_transformar(columna)
+    assert resultado == esperado, f"Fallo: DiscretizadorColumna con pocos valores. Obtenido {resultado}"
+    df = DataFrame({'x': columna})
+    Discretizador.discretizar_columna(df, 'x', 'frecuencia_igual', bins)
+    assert df.obtener_columna('x') == esperado, f"Fallo: discretizar_columna con pocos valores. Obtenido {df.obtener_columna('x')}"
+    print("Exito: Prueba de Discretizador Frecuencia Igual con Pocos Valores")
+
 def prueba_discretizador_k_means():
     # Verifica la discretización usando el método k-means.
     columna = [10, 20, 20, 30, 40, 40, 50, 60]
@@ -33,6 +58,29 @@ def prueba_discretizador_k_means():
     assert resultado == esperado, f"Fallo: Prueba de k-means. Obtenido {resultado}"
     print("Exito: Prueba de Discretizador K-means")
 
+def prueba_discretizador_k_means_exacto():
+    # Verifica que la partición óptima coincide con Lloyd en un caso sencillo y que agrupa los valores repetidos.
+    columna = [10, 20, 20, 30, 40, 40, 50, 60]
+    resultado = Discretizador.k_means(columna, 3, exacto=True)
+    assert resultado == [0, 0, 0, 1, 1, 1, 2, 2], f"Fallo: Prueba de k-means exacto. Obtenido {resultado}"
+    columna = [1, 1, 1, 2, 9, 9, 10]
+    resultado = Discretizador.k_means(columna, 2, exacto=True)
+    assert resultado == [0, 0, 0, 0, 1, 1, 1], f"Fallo: Prueba de k-means exacto. Obtenido {resultado}"
+    resultado = Discretizador.k_means(columna, 2, max_iteraciones=1)
+    assert len(resultado) == len(columna), "Fallo: Prueba de k-means con límite de iteraciones"
+    # Con un desplazamiento grande (marcas de tiempo) la partición óptima no debe ser peor que la de Lloyd
+    aleatorio = random.Random(0)
+    columna = [1.7e9 + aleatorio.uniform(0, 10) for _ in range(2000)]
+    def suma_cuadrados(bins_asignados):
+        grupos = {}
+        for valor, indice_bin in zip(columna, bins_asignados):
+            grupos.setdefault(indice_bin, []).append(valor - 1.7e9)
+        return sum(sum((x - sum(g) / len(g)) ** 2 for x in g) for g in grupos.values())
+    exacto = suma_cuadrados(Discretizador.k_means(columna, 4, exacto=True))
+    lloyd = suma_cuadrados(Discretizador.k_means(columna, 4))
+    assert exacto <= lloyd + 1e-6, f"Fallo: Prueba de k-means exacto con desplazamiento. Obtenido {exacto} frente a {lloyd}"
+    print("Exito: Prueba de Discretizador K-means exacto")
+
 def prueba_discretizador_basado_en_cuantiles():
     # Verifica la discretización basada en cuantiles.
     columna = [5, 15, 25, 35, 45, 55, 65, 75, 85]
@@ -94,13 +142,61 @@ def prueba_discretizador_obtener_rangos_bins_basado_en_cuantiles():
     
     print("Exito: Prueba de Discretizador Obtener Rangos de Bins Basado en Cuantiles")
 
+def prueba_discretizador_columna_ajustar_transformar():
+    # Verifica que el discretizador ajustado conserva sus cortes y los aplica igual a nuevos datos y tras serializar.
+    columna = [5, 15, 25, 35, 45, 55, 65, 75, 85]
+    discretizador = DiscretizadorColumna('basado_en_cuantiles', 3)
+    resultado = discretizador.ajustar_transformar(columna)
+    assert resultado == Discretizador.basado_en_cuantiles(columna, 3), f"Fallo: Prueba de ajustar_transformar. Obtenido {resultado}"
+    assert discretizador.puntos_corte == [30.0, 60.0], f"Fallo: Puntos de corte {discretizador.puntos_corte}"
+    assert discretizador.transformar([-100, 30, 59.9, 1000]) == [0, 1, 1, 2], "Fallo: Prueba de transformar nuevos datos"
+    copia = DiscretizadorColumna.desde_dict(discretizador.a_dict())
+    assert copia.transformar(columna) == resultado, "Fallo: Prueba de serialización con a_dict"
+    assert pickle.loads(pickle.dumps(discretizador)).transformar(columna) == resultado, "Fallo: Prueba de pickle"
+    ancho = DiscretizadorColumna('ancho_igual', 2).ajustar([0, 10])
+    assert ancho.transformar([-5, 0, 4, 6, 10, 50]) == [0, 0, 0, 1, 1, 1], "Fallo: Prueba de ancho igual fuera de rango"
+    print("Exito: Prueba de DiscretizadorColumna Ajustar y Transformar")
+
+def prueba_discretizador_discretizar_data_frame():
+    # Verifica la discretización de todas las columnas numéricas y que el resultado no depende del número de procesos.
+    datos = {'a': [10, 20, 20, 30, 40, 40, 50, 60], 'b': [0.5, 0.1, 0.9, 0.3, 0.7, 0.2, 0.8, 0.4], 'c': list('abcdefgh')}
+    df_serie, df_paralelo = DataFrame(datos), DataFrame(datos)
+    cortes_serie = Discretizador.discretizar_data_frame(df_serie, 'k_means', 3, n_procesos=1)
+    cortes_paralelo = Discretizador.discretizar_data_frame(df_paralelo, 'k_means', 3, n_procesos=2)
+    assert list(cortes_serie) == ['a', 'b'], f"Fallo: Columnas discretizadas {list(cortes_serie)}"
+    assert df_serie.obtener_columna('a') == [0, 0, 0, 1, 1, 1, 2, 2], f"Fallo: Columna a {df_serie.obtener_columna('a')}"
+    assert df_serie.obtener_columna('c') == list('abcdefgh'), "Fallo: La columna de texto no debe modificarse"
+    for nombre in cortes_serie:
+        assert df_serie.obtener_columna(nombre) == df_paralelo.obtener_columna(nombre), f"Fallo: Resultado paralelo en {nombre}"
+        assert cortes_serie[nombre].puntos_corte == cortes_paralelo[nombre].puntos_corte, f"Fallo: Cortes paralelos en {nombre}"
+    print("Exito: Prueba de Discretizador Discretizar Data Frame")
+
+def prueba_discretizador_entropia_mdl():
+    # Verifica que el método supervisado corta donde cambia la clase y no corta cuando la columna no la explica.
+    columna = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12]
+    clase = ['a', 'a', 'a', 'a', 'b', 'b', 'b', 'b', 'c', 'c', 'c', 'c']
+    resultado = Discretizador.entropia_mdl(columna, clase)
+    assert resultado == [0] * 4 + [1] * 4 + [2] * 4, f"Fallo: Prueba de entropía MDL. Obtenido {resultado}"
+    assert Discretizador.puntos_corte['entropia_mdl'] == [4.5, 8.5], "Fallo: Puntos de corte de entropía MDL"
+    resultado = Discretizador.entropia_mdl(columna, [0, 1] * 6)
+    assert resultado == [0] * 12, f"Fallo: Prueba de entropía MDL sin relación con la clase. Obtenido {resultado}"
+    df = DataFrame({'x': columna, 'clase': clase})
+    Discretizador.discretizar_columna(df, 'x', 'entropia_mdl', columna_clase='clase')
+    assert df.obtener_columna('x') == [0] * 4 + [1] * 4 + [2] * 4, "Fallo: Prueba de entropía MDL en data.frame"
+    print("Exito: Prueba de Discretizador Entropía MDL")
+
 if __name__ == "__main__":
     prueba_discretizador_ancho_igual()
     prueba_discretizador_frecuencia_igual()
+    prueba_discretizador_frecuencia_igual_empates()
+    prueba_discretizador_frecuencia_igual_pocos_valores()
     prueba_discretizador_k_means()
+    prueba_discretizador_k_means_exacto()
     prueba_discretizador_basado_en_cuantiles()
     prueba_discretizador_discretizar_columna_k_means()
     prueba_discretizador_discretizar_columna_basado_en_cuantiles()
     prueba_discretizador_obtener_rangos_bins_k_means()
     prueba_discretizador_obtener_rangos_bins_basado_en_cuantiles()
-
+    prueba_discretizador_columna_ajustar_transformar()
+    prueba_discretizador_discretizar_data_frame()
+    prueba_discretizador_entropia_mdl()
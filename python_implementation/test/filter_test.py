@@ -78,9 +78,26 @@ def prueba_filtrar_por_auc():
     assert 'compra' not in df_filtrado.datos, "Fallo: columna 'compra' inesperada en filtro de AUC (columnas específicas)"
     print("Éxito: Prueba de Filtro por AUC (columnas específicas)")
 
+def prueba_filtrar_vista_de_filas():
+    # Verifica que los filtros aceptan directamente una vista de filas de un DataFrame.
+    df = DataFrame({
+        'edad': [25, 25, 30, 40, 45, 50],
+        'ingreso': [30000, 30000, 70000, 100000, 120000, 150000],
+        'compra': [0, 0, 1, 0, 1, 1]
+    })
+    vista = df.seleccionar_filas([True, False, True, True, True, True])
+    filtro_datos = Filtro(vista)
+    filtro_datos.filtrar_por_varianza(umbral=1000)
+    filtro_datos.filtrar_por_auc(umbral=0.7, nombre_columna_clase='compra', columnas=['edad'])
+    df_filtrado = filtro_datos.obtener_data_frame_filtrado()
+    assert 'ingreso' in df_filtrado.datos and 'edad' in df_filtrado.datos, "Fallo: Filtro sobre vista de filas"
+    assert df_filtrado.obtener_columna('edad') == [25, 30, 40, 45, 50], "Fallo: Valores de la vista filtrada"
+    print("Éxito: Prueba de Filtro sobre Vista de Filas")
+
 if __name__ == "__main__":
     prueba_filtrar_por_entropia()
     prueba_filtrar_por_varianza()
     prueba_filtrar_por_auc()
+    prueba_filtrar_vista_de_filas()
 
 
@@ -3,8 +3,8 @@ import sys
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from dataframe import DataFrame
-from metrics import Metricas
+from dataframe import ColumnaCategorica, DataFrame
+from metrics import Metricas, AcumuladorVarianza, AcumuladorEntropia, AcumuladorAUC
 import math
 
 def prueba_varianza():
@@ -81,6 +81,117 @@ def prueba_calcular_metrica_entropia_categorica():
     assert abs(resultado['Entropía'] - esperado['Entropía']) < 1e-5, f"Fallo: Prueba de calcular_metrica para entropía categórica. Obtenido {resultado}"
     print("Éxito: Prueba de Calcular Métrica Entropía Categórica")
 
+def prueba_entropia_categorica_codificada():
+    # Verifica que la entropía sobre una columna categórica codificada coincide con la de la lista original.
+    columna = ['A', 'B', 'A', 'C', 'A', 'B']
+    df = DataFrame({'categoria': columna})
+    df.codificar_categorica('categoria')
+    resultado = Metricas.entropia(df.obtener_buffer('categoria'))
+    esperado = Metricas.entropia(columna)
+    assert abs(resultado - esperado) < 1e-12, f"Fallo: Prueba de entropía categórica codificada. Obtenido {resultado}"
+    print("Éxito: Prueba de Entropía Categórica Codificada")
+
+
+def prueba_perfilar_data_frame():
+    # Verifica el perfil de todas las columnas y la estabilidad de la varianza con una media grande.
+    df = DataFrame({'a': [1, 2, 2, 3], 'b': [1e9 + 1, 1e9 + 2, 1e9 + 3, 1e9 + 4], 'c': ['x', 'y', 'x', 'x']})
+    perfil = Metricas.perfilar_data_frame(df)
+    assert perfil.obtener_columna('columna') == ['a', 'b', 'c'], "Fallo: Columnas del perfil"
+    assert perfil.obtener_columna('tipo') == ['int', 'float', 'str'], "Fallo: Tipos del perfil"
+    assert perfil.obtener_columna('distintos') == [3, 4, 2], "Fallo: Valores distintos del perfil"
+    assert perfil.obtener_columna('media')[0] == 2.0 and perfil.obtener_columna('media')[2] is None, "Fallo: Medias del perfil"
+    assert perfil.obtener_columna('varianza')[0] == 0.5, "Fallo: Varianza entera del perfil"
+    assert abs(perfil.obtener_columna('varianza')[1] - 1.25) < 1e-9, f"Fallo: Varianza estable. Obtenido {perfil.obtener_columna('varianza')[1]}"
+    perfil_paralelo = Metricas.perfilar_data_frame(DataFrame({nombre: df.obtener_columna(nombre) for nombre in df.datos}), n_procesos=2)
+    assert all(perfil_paralelo.obtener_columna(campo) == perfil.obtener_columna(campo) for campo in perfil.datos), "Fallo: Perfil en paralelo"
+    print("Éxito: Prueba de Perfilar Data Frame")
+
+def prueba_acumuladores_por_bloques():
+    # Verifica que los acumuladores alimentados por bloques y combinados reproducen las métricas sobre la columna completa.
+    columna = [0.1, 0.4, 0.35, 0.8, 0.4, 0.9, 0.05, 0.6]
+    clase = [0, 1, 0, 1, 0, 1, 0, 0]
+    varianza, auc = AcumuladorVarianza(), AcumuladorAUC()
+    for inicio in range(0, len(columna), 3):
+        parcial_varianza = AcumuladorVarianza().actualizar(columna[inicio:inicio + 3])
+        parcial_auc = AcumuladorAUC().actualizar(columna[inicio:inicio + 3], clase[inicio:inicio + 3])
+        varianza.combinar(parcial_varianza)
+        auc.combinar(parcial_auc)
+    assert math.isclose(varianza.resultado(), Metricas.varianza(columna)), f"Fallo: Varianza acumulada {varianza.resultado()}"
+    assert math.isclose(auc.resultado(), Metricas.auc(columna, clase)), f"Fallo: AUC acumulado {auc.resultado()}"
+    aproximado = AcumuladorAUC(decimales=0).actualizar(columna, clase)
+    assert len(aproximado.totales) == 2, "Fallo: El AUC aproximado debe agrupar los valores en bins"
+
+    entropia = AcumuladorEntropia()
+    entropia.actualizar(ColumnaCategorica.codificar(['a', 'b', 'a']))
+    entropia.combinar(AcumuladorEntropia().actualizar(ColumnaCategorica.codificar(['b', 'c', 'a'])))
+    esperado = Metricas.entropia(['a', 'b', 'a', 'b', 'c', 'a'])
+    assert math.isclose(entropia.resultado(), esperado), f"Fallo: Entropía acumulada {entropia.resultado()}"
+    print("Éxito: Prueba de Acumuladores por Bloques")
+
+def prueba_auc_lote():
+    # Verifica el AUC por lotes de todas las columnas numéricas y que no depende del número de procesos.
+    df = DataFrame({
+        'a': [0.1, 0.4, 0.35, 0.8], 'b': [4, 3, 2, 1], 'c': [1, 1, 2, 2], 'texto': ['x', 'y', 'z', 'w'], 'clase': [0, 1, 0, 1]
+    })
+    resultado = Metricas.auc_lote(df, 'clase', n_procesos=1)
+    assert resultado == {'a': 1.0, 'b': 0.25, 'c': 0.5}, f"Fallo: Prueba de AUC por lotes. Obtenido {resultado}"
+    assert Metricas.auc_lote(df, 'clase', n_procesos=2) == resultado, "Fallo: Prueba de AUC por lotes en paralelo"
+    print("Éxito: Prueba de AUC por Lotes")
+
+def prueba_auc_multiclase_y_ponderado():
+    # Verifica el AUC multiclase (uno contra resto y uno contra uno), con pesos, y el error con etiquetas no binarias.
+    columna = [1, 2, 3, 4, 5, 6]
+    clase = ['a', 'a', 'b', 'b', 'c', 'c']
+    assert Metricas.auc_multiclase(columna, clase, 'ovo') == 1.0, "Fallo: AUC uno contra uno"
+    resultado = Metricas.auc_multiclase(columna, clase, 'ovr')
+    assert math.isclose(resultado, 0.5), f"Fallo: AUC uno contra resto. Obtenido {resultado}"
+    assert math.isclose(Metricas.auc_multiclase(columna, clase, 'ovr', 'ponderado'), resultado), "Fallo: AUC ponderado por clase"
+    assert Metricas.auc(columna, [0, 1, 0, 1, 0, 1], pesos=[1] * 6) == Metricas.auc(columna, [0, 1, 0, 1, 0, 1]), "Fallo: AUC con pesos unitarios"
+    resultado = Metricas.auc([1, 2, 3], [0, 1, 0], pesos=[1, 1, 3])
+    assert math.isclose(resultado, 0.25), f"Fallo: AUC con pesos. Obtenido {resultado}"
+    try:
+        Metricas.auc(columna, [0, 1, 2, 0, 1, 2])
+        assert False, "Fallo: El AUC binario debe rechazar etiquetas distintas de 0/1"
+    except ValueError:
+        pass
+    print("Éxito: Prueba de AUC Multiclase y Ponderado")
+
+def prueba_intervalo_bootstrap():
+    # Verifica que el intervalo contiene la estimación, es reproducible con la misma semilla y no depende de los procesos.
+    columna = [0.1, 0.4, 0.35, 0.8, 0.55, 0.2, 0.9, 0.3, 0.7, 0.15] * 3
+    clase = [0, 1, 0, 1, 1, 0, 1, 0, 1, 0] * 3
+    intervalo = Metricas.intervalo_bootstrap(columna, 'auc', clase, n_remuestras=200, semilla=1)
+    assert intervalo['estimacion'] == Metricas.auc(columna, clase), "Fallo: Estimación del intervalo de AUC"
+    assert intervalo['inferior'] <= intervalo['estimacion'] <= intervalo['superior'], f"Fallo: Intervalo de AUC {intervalo}"
+    assert intervalo == Metricas.intervalo_bootstrap(columna, 'auc', clase, n_remuestras=200, semilla=1, n_procesos=2), "Fallo: Reproducibilidad del bootstrap"
+    intervalo = Metricas.intervalo_bootstrap(columna, 'varianza', n_remuestras=200)
+    assert math.isclose(intervalo['estimacion'], Metricas.varianza(columna)), "Fallo: Estimación del intervalo de varianza"
+    assert intervalo['inferior'] < intervalo['superior'], f"Fallo: Intervalo de varianza {intervalo}"
+    intervalo = Metricas.intervalo_bootstrap(['a', 'b', 'a', 'c'] * 5, 'entropia', n_remuestras=200)
+    assert math.isclose(intervalo['estimacion'], 1.5), "Fallo: Estimación del intervalo de entropía"
+    print("Éxito: Prueba de Intervalo Bootstrap")
+
+def prueba_calcular_metricas_data_frame():
+    # Verifica que la tabla de métricas aplica a cada columna las mismas reglas que calcular_metrica.
+    df = DataFrame({
+        'edad': [25, 32, 47, 51, 62, 23, 34, 45], 'grupo': [1, 1, 2, 2, 1, 1, 2, 2],
+        'color': ['rojo', 'azul', 'rojo', 'verde', 'azul', 'rojo', 'azul', 'verde'], 'compra': [0, 1, 0, 1, 1, 0, 1, 0]
+    })
+    tabla = Metricas.calcular_metricas_data_frame(df, 'compra', n_procesos=1)
+    assert tabla.obtener_columna('columna') == ['edad', 'grupo', 'color'], "Fallo: Columnas de la tabla de métricas"
+    for fila, nombre in enumerate(tabla.obtener_columna('columna')):
+        esperado = Metricas.calcular_metrica(df, nombre, 'compra')
+        obtenido = {metrica: tabla.obtener_columna(metrica)[fila] for metrica in ('Entropía', 'Varianza', 'AUC')}
+        assert {metrica: valor for metrica, valor in obtenido.items() if valor is not None} == esperado, f"Fallo: Métricas de {nombre}"
+    sin_clase = Metricas.calcular_metricas_data_frame(df)
+    assert sin_clase.obtener_columna('AUC') == [None] * 4, "Fallo: AUC sin columna de clase"
+    paralelo = DataFrame({nombre: df.obtener_columna(nombre) for nombre in df.datos})
+    paralelo.codificar_categorica('color')
+    tabla_paralela = Metricas.calcular_metricas_data_frame(paralelo, 'compra', n_procesos=2)
+    for metrica in ('columna', 'Entropía', 'Varianza', 'AUC'):
+        assert tabla_paralela.obtener_columna(metrica) == tabla.obtener_columna(metrica), f"Fallo: {metrica} en paralelo"
+    assert paralelo._estadisticas['edad'][0] is paralelo.obtener_buffer('edad'), "Fallo: Estadísticas en paralelo sin caché"
+    print("Éxito: Prueba de Calcular Métricas Data Frame")
 
 if __name__ == "__main__":
     prueba_varianza()
@@ -90,3 +201,10 @@ if __name__ == "__main__":
     prueba_calcular_metrica_entropia()
     prueba_calcular_metrica_auc()
     prueba_calcular_metrica_entropia_categorica()
+    prueba_entropia_categorica_codificada()
+    prueba_perfilar_data_frame()
+    prueba_acumuladores_por_bloques()
+    prueba_auc_lote()
+    prueba_auc_multiclase_y_ponderado()
+    prueba_intervalo_bootstrap()
+    prueba_calcular_metricas_data_frame()
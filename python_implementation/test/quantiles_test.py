@@ -0,0 +1,84 @@
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from quantiles import ResumenCuantiles
+from discretize import DiscretizadorColumna
+from dataframe import DataFrame
+
+def error_rango(valores_ordenados, resumen, cuantiles):
+    # Mayor diferencia entre el cuantil pedido y la posición real del valor devuelto por el resumen.
+    n = len(valores_ordenados)
+    return max(abs(valores_ordenados.index(resumen.cuantil(q)) / (n - 1) - q) for q in cuantiles)
+
+def prueba_resumen_exacto_pocos_valores():
+    # Verifica que con menos valores que la capacidad el resumen devuelve los cuantiles exactos.
+    resumen = ResumenCuantiles().actualizar([5, 1, 4, 2, 3])
+    assert resumen.cuantiles([0, 0.5, 1]) == [1, 3, 5], f"Fallo: Cuantiles exactos. Obtenido {resumen.cuantiles([0, 0.5, 1])}"
+    assert len(resumen) == 5, "Fallo: Número de valores del resumen"
+    print("Exito: Prueba de Resumen de Cuantiles Exacto")
+
+def prueba_resumen_por_bloques_y_combinado():
+    # Verifica la cota de error alimentando por bloques y combinando resúmenes parciales construidos por separado.
+    aleatorio = random.Random(7)
+    valores = list(range(20000))
+    aleatorio.shuffle(valores)
+    resumen = ResumenCuantiles(error=0.02)
+    for inicio in range(0, len(valores), 1500):
+        resumen.actualizar(valores[inicio:inicio + 1500])
+    cuantiles = [i / 20 for i in range(21)]
+    ordenados = sorted(valores)
+    assert error_rango(ordenados, resumen, cuantiles) <= 0.02, "Fallo: Error del resumen por bloques"
+    assert len(sum(resumen.niveles, [])) < len(valores) / 10, "Fallo: El resumen no acota la memoria"
+
+    parciales = [ResumenCuantiles(error=0.02, semilla=i).actualizar(valores[i::4]) for i in range(4)]
+    combinado = parciales[0]
+    for parcial in parciales[1:]:
+        combinado.combinar(parcial)
+    assert combinado.n == len(valores), "Fallo: Número de valores del resumen combinado"
+    assert error_rango(ordenados, combinado, cuantiles) <= 0.02, "Fallo: Error del resumen combinado"
+    print("Exito: Prueba de Resumen de Cuantiles por Bloques y Combinado")
+
+def prueba_discretizador_desde_csv_por_bloques():
+    # Verifica los puntos de corte aproximados obtenidos al recorrer un CSV por bloques.
+    ruta_archivo = 'prueba_cuantiles.csv'
+    columna = list(range(1, 3001))
+    DataFrame({'a': columna, 'b': ['x' + str(valor) for valor in columna]}).escribir_a_csv(ruta_archivo)
+    try:
+        resumenes = ResumenCuantiles.desde_bloques(DataFrame.iterar_csv(ruta_archivo, filas_por_bloque=500))
+    finally:
+        os.remove(ruta_archivo)
+    assert list(resumenes) == ['a'], f"Fallo: Columnas resumidas {list(resumenes)}"
+    discretizador = DiscretizadorColumna('basado_en_cuantiles', 3).ajustar_resumen(resumenes['a'])
+    exactos = DiscretizadorColumna('basado_en_cuantiles', 3).ajustar(columna).puntos_corte
+    for aproximado, exacto in zip(discretizador.puntos_corte, exactos):
+        assert abs(aproximado - exacto) <= 0.01 * len(columna), f"Fallo: Corte {aproximado} frente a {exacto}"
+    try:
+        DiscretizadorColumna('k_means', 3).ajustar_resumen(resumenes['a'])
+        assert False, "Fallo: k_means no debe ajustarse desde un resumen"
+    except ValueError:
+        pass
+    print("Exito: Prueba de Discretizador desde CSV por Bloques")
+
+def prueba_resumen_por_bloques_con_cambio_de_tipo():
+    # Verifica que una columna que pasa a float se sigue resumiendo y que una que deja de ser numérica provoca un error.
+    ruta_archivo = 'prueba_cuantiles_tipos.csv'
+    DataFrame({'a': list(range(10)) + [0.5] * 10, 'b': list(range(10)) + ['x'] * 10}).escribir_a_csv(ruta_archivo)
+    try:
+        resumenes = ResumenCuantiles.desde_bloques(DataFrame.iterar_csv(ruta_archivo, filas_por_bloque=5), columnas=['a'])
+        assert resumenes['a'].n == 20, f"Fallo: Resumen de una columna ampliada a float. Obtenido {resumenes['a']}"
+        try:
+            ResumenCuantiles.desde_bloques(DataFrame.iterar_csv(ruta_archivo, filas_por_bloque=5))
+            print("Fallo: Prueba de columna que deja de ser numérica (no se lanzó excepción)")
+        except ValueError:
+            print("Exito: Prueba de Resumen por Bloques con Cambio de Tipo")
+    finally:
+        os.remove(ruta_archivo)
+
+if __name__ == "__main__":
+    prueba_resumen_exacto_pocos_valores()
+    prueba_resumen_por_bloques_y_combinado()
+    prueba_discretizador_desde_csv_por_bloques()
+    prueba_resumen_por_bloques_con_cambio_de_tipo()